@@ -20,17 +20,24 @@ import time
 from typing import TYPE_CHECKING, Any, Literal, overload
 
 from pocketdock import _socket_client as sc
+from pocketdock import _tar
 from pocketdock._callbacks import CallbackRegistry
 from pocketdock._helpers import (
     build_container_info,
     build_exposed_ports,
     build_port_bindings,
     parse_mem_limit,
+    parse_port_bindings,
 )
 from pocketdock._logger import InstanceLogger
 from pocketdock._process import AsyncExecStream, AsyncProcess
 from pocketdock._session import AsyncSession
-from pocketdock.errors import ContainerNotFound, ContainerNotRunning, PodmanNotRunning
+from pocketdock.errors import (
+    ContainerNotFound,
+    ContainerNotRunning,
+    PodmanNotRunning,
+    SocketCommunicationError,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -42,6 +49,12 @@ if TYPE_CHECKING:
 _DEFAULT_IMAGE = "pocketdock/minimal-python"
 _DEFAULT_TIMEOUT = 30
 _DEFAULT_MAX_OUTPUT = 10 * 1024 * 1024  # 10 MB
+# Text at least this large is encoded in a worker thread by write_file() so a
+# big payload does not stall the event loop; smaller text is not worth the hop.
+_ENCODE_IN_THREAD_MIN = 1024 * 1024
+# write_file() uploads payloads below this size before creating the parent
+# directory; the engine drains about this much of a rejected upload body.
+_OPTIMISTIC_UPLOAD_MAX = 256 * 1024
 
 
 def _generate_name() -> str:
@@ -56,15 +69,41 @@ def _build_command(command: str, lang: str | None) -> list[str]:
     return ["sh", "-c", command]
 
 
+def _split_posix(path: str) -> tuple[str, str]:
+    """Split a container path into ``(parent, name)``.
+
+    Matches ``PurePosixPath(path).parent`` and ``.name`` for the paths we
+    are given, without building a path object per file operation.
+    """
+    head, sep, tail = (path.rstrip("/") or path[:1]).rpartition("/")
+    if not sep:
+        return ".", tail
+    return head.rstrip("/") or "/", tail
+
+
+def _utc_now_iso() -> str:
+    """Return the current UTC time as an ISO 8601 string."""
+    return datetime.datetime.now(tz=datetime.timezone.utc).isoformat()
+
+
 def _build_labels(
-    name: str, *, persist: bool, project: str = "", data_path: str = ""
+    name: str,
+    *,
+    persist: bool,
+    project: str = "",
+    data_path: str = "",
+    created_at: str | None = None,
 ) -> dict[str, str]:
-    """Build the standard pocketdock container labels."""
+    """Build the standard pocketdock container labels.
+
+    ``created_at`` defaults to now; pass it in to share one timestamp with
+    the instance metadata.
+    """
     labels = {
         "pocketdock.managed": "true",
         "pocketdock.instance": name,
-        "pocketdock.persist": str(persist).lower(),
-        "pocketdock.created-at": datetime.datetime.now(tz=datetime.timezone.utc).isoformat(),
+        "pocketdock.persist": "true" if persist else "false",
+        "pocketdock.created-at": created_at or _utc_now_iso(),
     }
     if project:
         labels["pocketdock.project"] = project
@@ -73,6 +112,27 @@ def _build_labels(
     return labels
 
 
+def _extract_archive(tar_data: bytes, dest_path: pathlib.Path) -> None:
+    """Write a pulled archive to *dest_path* on the host.
+
+    A lone regular file is written to *dest_path* itself; anything else is
+    extracted into *dest_path* as a directory.
+    """
+    with tarfile.open(fileobj=io.BytesIO(tar_data), mode="r") as tar:
+        # Peek at most two headers to spot the single-file case; extractall()
+        # picks up from there without re-reading the ones already parsed.
+        first = tar.next()
+        if first is not None and first.isfile() and tar.next() is None:
+            extracted = tar.extractfile(first)
+            if extracted is not None:
+                dest_path.parent.mkdir(parents=True, exist_ok=True)
+                dest_path.write_bytes(extracted.read())
+                return
+        # Directory or multiple files: extract all
+        dest_path.mkdir(parents=True, exist_ok=True)
+        tar.extractall(dest_path, filter="data")
+
+
 def _build_host_config(mem_limit_bytes: int, nano_cpus: int) -> dict[str, Any] | None:
     """Build a HostConfig dict for resource limits, or None if no limits set."""
     hc: dict[str, Any] = {}
@@ -129,6 +189,7 @@ class AsyncContainer:
         project: str = "",
         data_path: str = "",
         ports: dict[int, int] | None = None,
+        lazy_config: bool = False,
     ) -> None:
         self._container_id = container_id
         self._socket_path = socket_path
@@ -141,6 +202,9 @@ class AsyncContainer:
         self._project = project
         self._data_path = data_path
         self._ports = ports
+        # Set for resumed containers: image, limits and ports are read from
+        # the engine only when a fresh reboot needs them to recreate.
+        self._config_pending = lazy_config
         self._logger: InstanceLogger | None = None
         if data_path:
             self._logger = InstanceLogger(pathlib.Path(data_path))
@@ -149,6 +213,7 @@ class AsyncContainer:
         self._active_streams: list[AsyncExecStream] = []
         self._active_processes: list[AsyncProcess] = []
         self._active_sessions: list[AsyncSession] = []
+        self._info_cache: tuple[float, ContainerInfo] | None = None
 
     @property
     def container_id(self) -> str:
@@ -293,12 +358,22 @@ class AsyncContainer:
             self._logger.log_run(command, result, started_at)
         return result
 
-    async def info(self) -> ContainerInfo:
+    async def info(self, *, max_age: float = 0.0) -> ContainerInfo:
         """Return a live snapshot of the container's state and resource usage.
 
         Makes 1-3 API calls depending on the container state: inspect always,
         stats and top only when running.
+
+        Args:
+            max_age: Accept a snapshot taken up to this many seconds ago
+                instead of querying the engine again.  Meant for callers that
+                poll in a tight loop; the default ``0`` always hits the engine.
+
         """
+        cached = self._info_cache
+        if cached is not None and time.monotonic() - cached[0] < max_age:
+            return cached[1]
+
         inspect_data = await sc.inspect_container(self._socket_path, self._container_id)
         stats_data: dict[str, object] | None = None
         top_data: dict[str, object] | None = None
@@ -311,7 +386,9 @@ class AsyncContainer:
                     sc.get_container_top(self._socket_path, self._container_id),
                 )
 
-        return build_container_info(inspect_data, stats_data, top_data, self._name)
+        info = build_container_info(inspect_data, stats_data, top_data, self._name)
+        self._info_cache = (time.monotonic(), info)
+        return info
 
     async def reboot(self, *, fresh: bool = False) -> None:
         """Restart the container.
@@ -322,11 +399,14 @@ class AsyncContainer:
                 container and create a new one with the same image and config.
 
         """
+        self._info_cache = None
         if not fresh:
             await sc.restart_container(self._socket_path, self._container_id)
             return
 
         # Fresh reboot: remove old container, create new one
+        if self._config_pending:
+            await self._load_create_config()
         with contextlib.suppress(ContainerNotRunning, ContainerNotFound):
             await sc.stop_container(self._socket_path, self._container_id)
         with contextlib.suppress(ContainerNotFound):
@@ -348,6 +428,17 @@ class AsyncContainer:
         )
         await sc.start_container(self._socket_path, self._container_id)
 
+    async def _load_create_config(self) -> None:
+        """Read image, resource limits and port bindings back from the engine."""
+        inspect_data = await sc.inspect_container(self._socket_path, self._container_id)
+        config = inspect_data.get("Config", {})
+        host_config = inspect_data.get("HostConfig", {})
+        self._image = config.get("Image", "") or self._image
+        self._mem_limit_bytes = int(host_config.get("Memory", 0))
+        self._nano_cpus = int(host_config.get("NanoCpus", 0))
+        self._ports = parse_port_bindings(inspect_data) or None
+        self._config_pending = False
+
     async def write_file(self, path: str, content: str | bytes) -> None:
         """Write a file into the container.
 
@@ -358,20 +449,46 @@ class AsyncContainer:
             content: File contents (str is encoded as UTF-8).
 
         """
-        data = content.encode("utf-8") if isinstance(content, str) else content
-        dest_dir = str(pathlib.PurePosixPath(path).parent)
-        file_name = pathlib.PurePosixPath(path).name
-
-        # Ensure parent directory exists (Docker archive API returns 404 otherwise)
-        await self.run(f"mkdir -p {dest_dir}")
-
-        buf = io.BytesIO()
-        with tarfile.open(fileobj=buf, mode="w") as tar:
-            info = tarfile.TarInfo(name=file_name)
-            info.size = len(data)
-            tar.addfile(info, io.BytesIO(data))
-
-        await sc.push_archive(self._socket_path, self._container_id, dest_dir, buf.getvalue())
+        if isinstance(content, str):
+            if len(content) >= _ENCODE_IN_THREAD_MIN:
+                data = await asyncio.to_thread(content.encode, "utf-8")
+            else:
+                data = content.encode("utf-8")
+        else:
+            data = content
+        dest_dir, file_name = _split_posix(path)
+
+        # The archive API returns 404 when dest_dir is missing.  Most writes
+        # target an existing directory, so small payloads are uploaded first
+        # and only pay for the mkdir exec (and a second upload) when needed.
+        # The engine answers that 404 without reading the body, and closes
+        # the connection once it has discarded a few hundred KiB of it, so
+        # larger payloads create the directory before their only upload.
+        if len(data) >= _OPTIMISTIC_UPLOAD_MAX:
+            await self.run(f"mkdir -p {dest_dir}")
+        else:
+            try:
+                await sc.push_archive(
+                    self._socket_path,
+                    self._container_id,
+                    dest_dir,
+                    _tar.stream_bytes(file_name, data),
+                )
+            except FileNotFoundError:
+                pass
+            except SocketCommunicationError as exc:
+                # The engine hung up mid-upload, most likely after the 404.
+                if not isinstance(exc.__cause__, (BrokenPipeError, ConnectionResetError)):
+                    raise
+            else:
+                return
+            await self.run(f"mkdir -p {dest_dir}")
+        await sc.push_archive(
+            self._socket_path,
+            self._container_id,
+            dest_dir,
+            _tar.stream_bytes(file_name, data),
+        )
 
     async def read_file(self, path: str) -> bytes:
         """Read a file from the container.
@@ -386,7 +503,9 @@ class AsyncContainer:
         tar_data = await sc.pull_archive(self._socket_path, self._container_id, path)
         buf = io.BytesIO(tar_data)
         with tarfile.open(fileobj=buf, mode="r") as tar:
-            for member in tar.getmembers():
+            # Iterate lazily so a pull of a directory stops at the first file
+            # instead of indexing every header in the archive up front.
+            for member in tar:
                 if member.isfile():
                     extracted = tar.extractfile(member)
                     if extracted is not None:
@@ -404,11 +523,18 @@ class AsyncContainer:
             List of filenames (not full paths).
 
         """
-        result = await self.run(f"ls -1a {path}")
+        # Exec ls directly rather than through run(): no sh process to spawn,
+        # no quoting issues with the path, and -A already drops "." and "..".
+        result = await sc.exec_command(
+            self._socket_path,
+            self._container_id,
+            ["ls", "-1A", "--", path],
+            timeout=self._timeout,
+        )
         if not result.ok:
             msg = f"ls failed: {result.stderr.strip()}"
             raise FileNotFoundError(msg)
-        return [f for f in result.stdout.strip().split("\n") if f and f not in (".", "..")]
+        return [f for f in result.stdout.splitlines() if f]
 
     async def push(self, src: str, dest: str) -> None:
         """Copy a file or directory from the host into the container.
@@ -423,32 +549,13 @@ class AsyncContainer:
             msg = f"source path does not exist: {src}"
             raise FileNotFoundError(msg)
 
-        def _reset_tar_info(info: tarfile.TarInfo) -> tarfile.TarInfo:
-            """Reset ownership and permissions for container compatibility."""
-            info.uid = 0
-            info.gid = 0
-            info.uname = "root"
-            info.gname = "root"
-            if info.isdir():
-                info.mode = 0o755
-            else:
-                info.mode = 0o644
-            return info
-
-        buf = io.BytesIO()
-        with tarfile.open(fileobj=buf, mode="w") as tar:
-            if host_path.is_dir():  # noqa: ASYNC240
-                dest_name = pathlib.PurePosixPath(dest).name
-                tar.add(str(host_path), arcname=dest_name, filter=_reset_tar_info)
-            else:
-                tar.add(
-                    str(host_path),
-                    arcname=pathlib.PurePosixPath(dest).name,
-                    filter=_reset_tar_info,
-                )
-
-        dest_dir = str(pathlib.PurePosixPath(dest).parent)
-        await sc.push_archive(self._socket_path, self._container_id, dest_dir, buf.getvalue())
+        dest_dir, dest_name = _split_posix(dest)
+        await sc.push_archive(
+            self._socket_path,
+            self._container_id,
+            dest_dir,
+            _tar.stream_path(host_path, dest_name),
+        )
 
     async def pull(self, src: str, dest: str) -> None:
         """Copy a file or directory from the container to the host.
@@ -459,19 +566,9 @@ class AsyncContainer:
 
         """
         tar_data = await sc.pull_archive(self._socket_path, self._container_id, src)
-        dest_path = pathlib.Path(dest)
-        buf = io.BytesIO(tar_data)
-        with tarfile.open(fileobj=buf, mode="r") as tar:
-            members = tar.getmembers()
-            if len(members) == 1 and members[0].isfile():
-                extracted = tar.extractfile(members[0])
-                if extracted is not None:
-                    dest_path.parent.mkdir(parents=True, exist_ok=True)
-                    dest_path.write_bytes(extracted.read())  # noqa: ASYNC240
-                    return
-            # Directory or multiple files: extract all
-            dest_path.mkdir(parents=True, exist_ok=True)  # noqa: ASYNC240
-            tar.extractall(dest_path, filter="data")
+        # Parsing and writing the archive is blocking disk I/O; keep it off
+        # the event loop so other containers stay responsive meanwhile.
+        await asyncio.to_thread(_extract_archive, tar_data, pathlib.Path(dest))
 
     def on_stdout(self, fn: Callable[..., object]) -> None:
         """Register a callback for stdout data from detached processes."""
@@ -534,22 +631,35 @@ class AsyncContainer:
         if self._closed:
             return
         self._closed = True
-
-        # Clean up active sessions
-        for sess in self._active_sessions:
-            await sess._close()  # noqa: SLF001
+        self._info_cache = None
+
+        # Each session, stream and process owns its own exec connection, so
+        # they are closed concurrently rather than one round trip at a time.
+        # The container is stopped only afterwards: a detached process must
+        # read its real exit code before the container goes away.
+        results = await asyncio.gather(
+            *(sess._close() for sess in self._active_sessions),  # noqa: SLF001
+            *(s._close() for s in self._active_streams),  # noqa: SLF001
+            *(p._cancel() for p in self._active_processes),  # noqa: SLF001
+            return_exceptions=True,
+        )
         self._active_sessions.clear()
-
-        # Clean up active streams
-        for s in self._active_streams:
-            await s._close()  # noqa: SLF001
         self._active_streams.clear()
-
-        # Clean up active processes
-        for p in self._active_processes:
-            await p._cancel()  # noqa: SLF001
         self._active_processes.clear()
+        try:
+            await self._stop_or_remove(force=force)
+        finally:
+            if self._logger is not None:
+                self._logger.close()
 
+        # A handle that failed to close is reported only after the container
+        # itself has been torn down, so it is never leaked.
+        for res in results:
+            if isinstance(res, BaseException):
+                raise res
+
+    async def _stop_or_remove(self, *, force: bool) -> None:
+        """Stop a persistent container, or stop and remove an ephemeral one."""
         if self._persist:
             with contextlib.suppress(ContainerNotRunning, ContainerNotFound):
                 await sc.stop_container(self._socket_path, self._container_id)
@@ -586,6 +696,7 @@ async def create_new_container(  # noqa: PLR0913
     profile: str | None = None,
     devices: list[str] | None = None,
     ports: dict[int, int] | None = None,
+    socket_path: str | None = None,
 ) -> AsyncContainer:
     """Create and start a new container, returning an async handle.
 
@@ -603,6 +714,7 @@ async def create_new_container(  # noqa: PLR0913
             when *image* is explicitly set to a non-default value.
         devices: Host device paths to passthrough (e.g. ``["/dev/ttyUSB0"]``).
         ports: Host-to-container port mappings (e.g. ``{8080: 80}``).
+        socket_path: Path to the engine socket. Auto-detected if ``None``.
 
     Returns:
         A running :class:`AsyncContainer`.
@@ -625,13 +737,17 @@ async def create_new_container(  # noqa: PLR0913
         profile_info = resolve_profile(profile)
         image = profile_info.image_tag
 
-    socket_path = sc.detect_socket()
     if socket_path is None:
-        raise PodmanNotRunning
+        socket_path = sc.detect_socket_cached()
+        if socket_path is None:
+            raise PodmanNotRunning
 
     mem_limit_bytes = parse_mem_limit(mem_limit) if mem_limit is not None else 0
     nano_cpus = cpu_percent * 10_000_000 if cpu_percent is not None else 0
 
+    # One timestamp for the label and both metadata writes, so they agree.
+    created_at = _utc_now_iso()
+
     # Resolve project + instance directory for persistent containers
     resolved_project = project or ""
     data_path = ""
@@ -648,14 +764,20 @@ async def create_new_container(  # noqa: PLR0913
                 name=name,
                 image=image,
                 project=resolved_project,
-                created_at=datetime.datetime.now(tz=datetime.timezone.utc).isoformat(),
+                created_at=created_at,
                 persist=True,
                 mem_limit=mem_limit or "",
                 cpu_percent=cpu_percent or 0,
                 ports=ports,
             )
 
-    labels = _build_labels(name, persist=persist, project=resolved_project, data_path=data_path)
+    labels = _build_labels(
+        name,
+        persist=persist,
+        project=resolved_project,
+        data_path=data_path,
+        created_at=created_at,
+    )
     host_config = _build_host_config(mem_limit_bytes, nano_cpus)
     host_config = _augment_host_config(host_config, devices=devices, volumes=volumes, ports=ports)
     exposed_ports = build_exposed_ports(ports) if ports else None
@@ -678,7 +800,7 @@ async def create_new_container(  # noqa: PLR0913
             name=name,
             image=image,
             project=resolved_project,
-            created_at=datetime.datetime.now(tz=datetime.timezone.utc).isoformat(),
+            created_at=created_at,
             persist=True,
             mem_limit=mem_limit or "",
             cpu_percent=cpu_percent or 0,
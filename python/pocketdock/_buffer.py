@@ -19,58 +19,129 @@ class BufferSnapshot:
     stderr: str
 
 
+_EMPTY = BufferSnapshot(stdout="", stderr="")
+
+
+def _decode(stdout: bytes, stderr: bytes) -> BufferSnapshot:
+    """Decode raw stream bytes into a :class:`BufferSnapshot`."""
+    return BufferSnapshot(
+        stdout=stdout.decode("utf-8", errors="replace"),
+        stderr=stderr.decode("utf-8", errors="replace"),
+    )
+
+
+class _ByteRing:
+    """Fixed-capacity byte ring for one stream.
+
+    Grows like a plain ``bytearray`` until it first reaches *capacity*, then
+    overwrites in place from ``_start`` (the oldest byte) so eviction never
+    shifts the remaining data.  Not thread-safe; :class:`RingBuffer` locks.
+    """
+
+    __slots__ = ("_buf", "_cap", "_start")
+
+    def __init__(self, capacity: int) -> None:
+        self._cap = capacity
+        self._buf = bytearray()
+        self._start = 0
+
+    def __len__(self) -> int:
+        return len(self._buf)
+
+    def write(self, data: bytes) -> bool:
+        """Append *data*, returning ``True`` if older bytes were evicted."""
+        n = len(data)
+        cap = self._cap
+        size = len(self._buf)
+        if n >= cap:
+            self._buf[:] = data[n - cap :]
+            self._start = 0
+            return size + n > cap
+        mv = memoryview(data)
+        if size < cap:
+            room = cap - size
+            self._buf += mv[:room]
+            if n <= room:
+                return False
+            mv = mv[room:]
+            n -= room
+        # Full: overwrite the oldest n bytes, wrapping at most once.
+        pos = self._start
+        first = min(n, cap - pos)
+        self._buf[pos : pos + first] = mv[:first]
+        self._buf[: n - first] = mv[first:]
+        self._start = (pos + n) % cap
+        return True
+
+    def getvalue(self) -> bytes:
+        """Return the buffered bytes, oldest first."""
+        start = self._start
+        if start == 0:
+            return bytes(self._buf)
+        return bytes(self._buf[start:] + self._buf[:start])
+
+
 class RingBuffer:
     """Bounded ring buffer for stdout/stderr accumulation.
 
     Each stream (stdout, stderr) gets half the total capacity.
     When a stream's buffer exceeds its half, the oldest bytes are evicted.
-    Thread-safe via threading.Lock.
+    Thread-safe via threading.Lock; decoding happens outside the lock, and
+    the decoded :meth:`peek` result is reused until the next write.
     """
 
     def __init__(self, capacity: int = 1_048_576) -> None:
         self._half = max(capacity // 2, 1)
         self._lock = threading.Lock()
-        self._stdout = bytearray()
-        self._stderr = bytearray()
+        self._stdout = _ByteRing(self._half)
+        self._stderr = _ByteRing(self._half)
         self._overflow = False
+        self._generation = 0
+        self._cached: BufferSnapshot | None = _EMPTY
 
     def write(self, stream_type: int, data: bytes) -> None:
         """Append data to the appropriate stream buffer, evicting if needed."""
         with self._lock:
             buf = self._stdout if stream_type == STREAM_STDOUT else self._stderr
-            buf.extend(data)
-            if len(buf) > self._half:
-                excess = len(buf) - self._half
-                del buf[:excess]
+            if buf.write(data):
                 self._overflow = True
+            self._generation += 1
+            self._cached = None
 
     def read(self) -> BufferSnapshot:
         """Drain and return all buffered output."""
         with self._lock:
-            snapshot = BufferSnapshot(
-                stdout=bytes(self._stdout).decode("utf-8", errors="replace"),
-                stderr=bytes(self._stderr).decode("utf-8", errors="replace"),
-            )
-            self._stdout.clear()
-            self._stderr.clear()
-            return snapshot
+            if self._cached is _EMPTY:
+                return _EMPTY
+            out, err = self._stdout, self._stderr
+            self._stdout = _ByteRing(self._half)
+            self._stderr = _ByteRing(self._half)
+            self._generation += 1
+            self._cached = _EMPTY
+        return _decode(out.getvalue(), err.getvalue())
 
     def peek(self) -> BufferSnapshot:
         """Return buffered output without draining."""
         with self._lock:
-            return BufferSnapshot(
-                stdout=bytes(self._stdout).decode("utf-8", errors="replace"),
-                stderr=bytes(self._stderr).decode("utf-8", errors="replace"),
-            )
+            if self._cached is not None:
+                return self._cached
+            generation = self._generation
+            out, err = self._stdout.getvalue(), self._stderr.getvalue()
+        snapshot = _decode(out, err)
+        with self._lock:
+            if self._generation == generation:
+                self._cached = snapshot
+        return snapshot
+
+    # size and overflow are advisory reads of single attributes; they skip
+    # the lock so polling them never contends with the frame reader.
 
     @property
     def size(self) -> int:
         """Current bytes in buffer (stdout + stderr)."""
-        with self._lock:
-            return len(self._stdout) + len(self._stderr)
+        return len(self._stdout) + len(self._stderr)
 
     @property
     def overflow(self) -> bool:
         """True if any data was evicted due to capacity."""
-        with self._lock:
-            return self._overflow
+        return self._overflow
@@ -5,7 +5,6 @@
 
 from __future__ import annotations
 
-import contextlib
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -37,18 +36,29 @@ class CallbackRegistry:
 
     def dispatch_stdout(self, container: object, data: str) -> None:
         """Fire all stdout callbacks, suppressing errors."""
-        for fn in self._stdout_cbs:
-            with contextlib.suppress(Exception):
-                fn(container, data)
+        if self._stdout_cbs:
+            _fire(self._stdout_cbs, container, data)
 
     def dispatch_stderr(self, container: object, data: str) -> None:
         """Fire all stderr callbacks, suppressing errors."""
-        for fn in self._stderr_cbs:
-            with contextlib.suppress(Exception):
-                fn(container, data)
+        if self._stderr_cbs:
+            _fire(self._stderr_cbs, container, data)
 
     def dispatch_exit(self, container: object, exit_code: int) -> None:
         """Fire all exit callbacks, suppressing errors."""
-        for fn in self._exit_cbs:
-            with contextlib.suppress(Exception):
-                fn(container, exit_code)
+        if self._exit_cbs:
+            _fire(self._exit_cbs, container, exit_code)
+
+
+def _fire(cbs: list[Callable[..., object]], container: object, arg: object) -> None:
+    """Call each of *cbs* with ``(container, arg)``, ignoring their errors.
+
+    Runs once per output frame, so it uses a plain try/except rather than
+    ``contextlib.suppress``, whose ``__enter__``/``__exit__`` calls would
+    cost more than a cheap callback.
+    """
+    for fn in cbs:
+        try:  # noqa: SIM105
+            fn(container, arg)
+        except Exception:  # noqa: BLE001, PERF203, S110
+            pass
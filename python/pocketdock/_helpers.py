@@ -6,11 +6,14 @@
 from __future__ import annotations
 
 import datetime
+import functools
 import re
 from typing import Any
 
 from pocketdock.types import ContainerInfo
 
+_UTC = datetime.timezone.utc
+
 _KIB = 1024
 
 _UNIT_MULTIPLIERS: dict[str, int] = {
@@ -21,6 +24,13 @@ _UNIT_MULTIPLIERS: dict[str, int] = {
     "t": _KIB**4,
 }
 
+_NUMERIC = (int, float)
+
+_MEM_LIMIT_RE = re.compile(r"(\d+)\s*([bkmgt])?", re.IGNORECASE)
+
+# Fractional seconds beyond microseconds, which fromisoformat() rejects.
+_SUB_MICROSECOND_RE = re.compile(r"(\.\d{6})\d+")
+
 
 def format_bytes(n: int) -> str:
     """Format a byte count as a human-readable string (e.g. ``42.1 MB``)."""
@@ -38,6 +48,11 @@ def format_bytes(n: int) -> str:
     return f"{value:.1f} TB"
 
 
+# Memory limits repeat across every stats poll of a container (and usually
+# across containers), unlike usage, so only the limit side is memoised.
+_format_limit = functools.lru_cache(maxsize=64)(format_bytes)
+
+
 def parse_mem_limit(s: str) -> int:
     """Parse a memory limit string like ``256m`` or ``1g`` into bytes.
 
@@ -45,7 +60,17 @@ def parse_mem_limit(s: str) -> int:
     Plain integers are treated as bytes.
     """
     s = s.strip()
-    match = re.fullmatch(r"(\d+)\s*([bkmgt])?", s, flags=re.IGNORECASE)
+    # Fast path for the usual "<digits>[suffix]" spelling; the regex below
+    # handles whitespace before the suffix and produces the error message.
+    suffix = s[-1:].lower()
+    if suffix in _UNIT_MULTIPLIERS:
+        digits = s[:-1]
+    else:
+        digits, suffix = s, "b"
+    if digits.isdecimal():
+        return int(digits) * _UNIT_MULTIPLIERS[suffix]
+
+    match = _MEM_LIMIT_RE.fullmatch(s)
     if not match:
         msg = f"invalid memory limit: {s!r}"
         raise ValueError(msg)
@@ -60,35 +85,63 @@ def parse_iso_timestamp(s: str) -> datetime.datetime:
     Handles both ``Z`` suffix and ``+00:00`` offset, and truncates
     sub-microsecond precision that some engines emit.
     """
+    # Python 3.11+ parses the engines' RFC 3339 form ("Z", nanoseconds)
+    # natively in C; 3.10 needs it rewritten first.
+    try:
+        return datetime.datetime.fromisoformat(s)
+    except ValueError:
+        pass
     s = s.replace("Z", "+00:00")
     # Truncate nanosecond precision — Python only handles microseconds
     # e.g. "2024-01-15T10:30:00.123456789+00:00" → "...123456+00:00"
-    s = re.sub(r"(\.\d{6})\d+", r"\1", s)
+    s = _SUB_MICROSECOND_RE.sub(r"\1", s)
     return datetime.datetime.fromisoformat(s)
 
 
+# Created and StartedAt never change for a container, so polling info()
+# re-parses the same two strings every time; datetimes are immutable.
+_parse_engine_timestamp = functools.lru_cache(maxsize=256)(parse_iso_timestamp)
+
+
+def _percent(part: float, whole: float) -> float:
+    """Return *part* / *whole* as a percentage rounded half-up to two decimals.
+
+    Works in hundredths of a percent with floor division, which avoids the
+    general-purpose ``round(x, 2)``.  Exact ties round up, unlike ``round()``,
+    which rounds them to even: ``_percent(1, 800)`` is 0.13 where
+    ``round(0.125, 2)`` is 0.12.  *whole* must be positive.
+    """
+    return (part * 20000 // whole + 1) // 2 / 100
+
+
 def compute_cpu_percent(stats: dict[str, object]) -> float:
     """Compute CPU usage percentage from container stats."""
-    try:
-        cpu_stats = stats.get("cpu_stats", {})
-        precpu_stats = stats.get("precpu_stats", {})
-        if not isinstance(cpu_stats, dict) or not isinstance(precpu_stats, dict):
-            return 0.0
-        cpu_usage = cpu_stats.get("cpu_usage", {})
-        precpu_usage = precpu_stats.get("cpu_usage", {})
-        if not isinstance(cpu_usage, dict) or not isinstance(precpu_usage, dict):
-            return 0.0
-        cpu_delta = float(cpu_usage.get("total_usage", 0)) - float(
-            precpu_usage.get("total_usage", 0)
-        )
-        system_delta = float(cpu_stats.get("system_cpu_usage", 0)) - float(
-            precpu_stats.get("system_cpu_usage", 0)
-        )
-        online = cpu_stats.get("online_cpus", 0)
-        if system_delta > 0 and isinstance(online, (int, float)) and online > 0:
-            return round(cpu_delta / system_delta * float(online) * 100.0, 2)
-    except (TypeError, ValueError, ArithmeticError):
-        pass
+    cpu_stats = stats.get("cpu_stats")
+    precpu_stats = stats.get("precpu_stats")
+    if not isinstance(cpu_stats, dict) or not isinstance(precpu_stats, dict):
+        return 0.0
+    cpu_usage = cpu_stats.get("cpu_usage")
+    precpu_usage = precpu_stats.get("cpu_usage")
+    if not isinstance(cpu_usage, dict) or not isinstance(precpu_usage, dict):
+        return 0.0
+    total = cpu_usage.get("total_usage", 0)
+    pre_total = precpu_usage.get("total_usage", 0)
+    system = cpu_stats.get("system_cpu_usage", 0)
+    pre_system = precpu_stats.get("system_cpu_usage", 0)
+    online = cpu_stats.get("online_cpus", 0)
+    # Type guards instead of a try/except around float(): malformed fields
+    # are rejected up front and the arithmetic below cannot raise.
+    if not (
+        isinstance(total, _NUMERIC)
+        and isinstance(pre_total, _NUMERIC)
+        and isinstance(system, _NUMERIC)
+        and isinstance(pre_system, _NUMERIC)
+        and isinstance(online, _NUMERIC)
+    ):
+        return 0.0
+    system_delta = system - pre_system
+    if system_delta > 0 and online > 0:
+        return _percent((total - pre_total) * online, system_delta)
     return 0.0
 
 
@@ -152,22 +205,25 @@ def _extract_memory(stats: dict[str, object] | None) -> tuple[str, str, float]:
     """Return ``(usage_str, limit_str, percent)`` from stats."""
     if stats is None:
         return "", "", 0.0
-    mem = _safe_dict(stats, "memory_stats")
+    # stats is already known to be a dict here; only the sub-key needs checking.
+    mem = stats.get("memory_stats")
+    if not isinstance(mem, dict):
+        mem = {}
     usage_val = mem.get("usage", 0)
     limit_val = mem.get("limit", 0)
-    if not isinstance(usage_val, (int, float)) or not isinstance(limit_val, (int, float)):
+    if not isinstance(usage_val, _NUMERIC) or not isinstance(limit_val, _NUMERIC):
         return "", "", 0.0
-    pct = round(float(usage_val) / float(limit_val) * 100.0, 2) if limit_val > 0 else 0.0
-    return format_bytes(int(usage_val)), format_bytes(int(limit_val)), pct
+    pct = _percent(usage_val, limit_val) if limit_val > 0 else 0.0
+    return format_bytes(int(usage_val)), _format_limit(int(limit_val)), pct
 
 
 def _extract_pids(stats: dict[str, object] | None) -> int:
     """Return the current PID count from stats."""
     if stats is None:
         return 0
-    pids_stats = _safe_dict(stats, "pids_stats")
-    current = pids_stats.get("current", 0)
-    return int(current) if isinstance(current, (int, float)) else 0
+    pids_stats = stats.get("pids_stats")
+    current = pids_stats.get("current", 0) if isinstance(pids_stats, dict) else 0
+    return int(current) if isinstance(current, _NUMERIC) else 0
 
 
 def _extract_processes(top: dict[str, object] | None) -> tuple[dict[str, str], ...]:
@@ -178,12 +234,14 @@ def _extract_processes(top: dict[str, object] | None) -> tuple[dict[str, str], .
     procs = top.get("Processes", [])
     if not isinstance(titles, list) or not isinstance(procs, list):
         return ()
-    result: list[dict[str, str]] = []
-    for proc in procs:
-        if isinstance(proc, list):
-            entry = {str(titles[i]): str(proc[i]) for i in range(min(len(titles), len(proc)))}
-            result.append(entry)
-    return tuple(result)
+    # Column names are stringified once; zip() pairs them with each row and
+    # stops at whichever of the two is shorter.
+    columns = tuple(map(str, titles))
+    return tuple(
+        dict(zip(columns, map(str, proc), strict=False))
+        for proc in procs
+        if isinstance(proc, list)
+    )
 
 
 def build_container_info(
@@ -193,20 +251,22 @@ def build_container_info(
     name: str,
 ) -> ContainerInfo:
     """Assemble a :class:`ContainerInfo` from engine API responses."""
+    # Validated once here, so the stats extractors only check nested keys.
+    stats = stats if isinstance(stats, dict) else None
     state = _safe_dict(inspect, "State")
     config = _safe_dict(inspect, "Config")
     net = _safe_dict(inspect, "NetworkSettings")
 
     status = str(state.get("Status", "unknown"))
-    created_at = parse_iso_timestamp(str(inspect.get("Created", "1970-01-01T00:00:00+00:00")))
+    created_at = _parse_engine_timestamp(str(inspect.get("Created", "1970-01-01T00:00:00+00:00")))
 
     started_at: datetime.datetime | None = None
     uptime: datetime.timedelta | None = None
     started_str = state.get("StartedAt", "")
     if isinstance(started_str, str) and started_str and started_str != "0001-01-01T00:00:00Z":
-        started_at = parse_iso_timestamp(started_str)
+        started_at = _parse_engine_timestamp(started_str)
         if status == "running":
-            uptime = datetime.datetime.now(tz=datetime.timezone.utc) - started_at
+            uptime = datetime.datetime.now(_UTC) - started_at
 
     mem_usage, mem_limit, mem_pct = _extract_memory(stats)
     ip_address = str(net.get("IPAddress", ""))
@@ -0,0 +1,40 @@
+# SPDX-License-Identifier: BSD-2-Clause
+# Copyright (c) deftio llc
+
+"""JSON encoding and decoding shared by the SDK and the CLI.
+
+orjson is used when it is already installed — it is several times faster
+than the stdlib — but never required, so the core SDK stays stdlib-only.
+Both backends accept and produce the same shapes: non-string keys become
+strings, and values JSON cannot represent (datetimes included) are written
+through ``str()``.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+try:
+    import orjson  # type: ignore[import-not-found,unused-ignore]
+except ModuleNotFoundError:
+    loads: Callable[[bytes], Any] = json.loads
+
+    def dumps(obj: object, *, indent: bool = False) -> bytes:
+        """Serialize *obj* as UTF-8 JSON, indented by two spaces if *indent* else compact."""
+        if indent:
+            return json.dumps(obj, indent=2, default=str).encode()
+        return json.dumps(obj, separators=(",", ":"), default=str).encode()
+
+else:
+    loads = orjson.loads
+    _OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def dumps(obj: object, *, indent: bool = False) -> bytes:
+        """Serialize *obj* as UTF-8 JSON, indented by two spaces if *indent* else compact."""
+        option = _OPTIONS | orjson.OPT_INDENT_2 if indent else _OPTIONS
+        data: bytes = orjson.dumps(obj, default=str, option=option)
+        return data
@@ -8,24 +8,33 @@ All I/O is synchronous filesystem writes — simple, no async overhead.
 
 from __future__ import annotations
 
-import json
+import datetime
 from typing import TYPE_CHECKING
 
+from pocketdock._json import dumps
+
 if TYPE_CHECKING:
-    import datetime
     from pathlib import Path
-    from typing import TextIO
+    from typing import BinaryIO, TextIO
 
     from pocketdock.types import ExecResult
 
 
+_UTC = datetime.timezone.utc
+
+
 class InstanceLogger:
     """Logs container commands and output to an instance's ``logs/`` directory."""
 
+    __slots__ = ("_enabled", "_history_file", "_history_path", "_logs_dir")
+
     def __init__(self, instance_dir: Path, *, enabled: bool = True) -> None:
         self._logs_dir = instance_dir / "logs"
         self._history_path = instance_dir / "logs" / "history.jsonl"
         self._enabled = enabled
+        # Opened on first use and kept for the container's lifetime; every
+        # run() appends to it, so this saves an open/close pair per command.
+        self._history_file: BinaryIO | None = None
 
     @property
     def enabled(self) -> bool:
@@ -41,21 +50,22 @@ class InstanceLogger:
         log_name = f"run-{ts}.log"
         log_path = self._logs_dir / log_name
 
-        lines = [
-            f"# command: {command}",
-            f"# exit_code: {result.exit_code}",
-            f"# duration_ms: {result.duration_ms:.1f}",
-            f"# timed_out: {result.timed_out}",
-            "",
-        ]
-        if result.stdout:
-            lines.append("--- stdout ---")
-            lines.append(result.stdout)
-        if result.stderr:
-            lines.append("--- stderr ---")
-            lines.append(result.stderr)
-
-        log_path.write_text("\n".join(lines))
+        header = (
+            f"# command: {command}\n"
+            f"# exit_code: {result.exit_code}\n"
+            f"# duration_ms: {result.duration_ms:.1f}\n"
+            f"# timed_out: {result.timed_out}\n"
+        )
+        # stdout/stderr can be megabytes; write them as-is rather than
+        # joining everything into one more string of the same size first.
+        with log_path.open("w") as f:
+            f.write(header)
+            if result.stdout:
+                f.write("\n--- stdout ---\n")
+                f.write(result.stdout)
+            if result.stderr:
+                f.write("\n--- stderr ---\n")
+                f.write(result.stderr)
 
         self.append_history(
             {
@@ -73,9 +83,7 @@ class InstanceLogger:
         if not self._enabled:
             return SessionLogHandle(None)
 
-        from datetime import datetime, timezone  # noqa: PLC0415
-
-        ts = _safe_timestamp(datetime.now(tz=timezone.utc))
+        ts = _safe_timestamp(datetime.datetime.now(_UTC))
         log_path = self._logs_dir / f"session-{ts}.log"
         handle = log_path.open("a")
         handle.write(f"# session_id: {session_id}\n\n")
@@ -86,9 +94,7 @@ class InstanceLogger:
         if not self._enabled:
             return DetachLogHandle(None)
 
-        from datetime import datetime, timezone  # noqa: PLC0415
-
-        ts = _safe_timestamp(datetime.now(tz=timezone.utc))
+        ts = _safe_timestamp(datetime.datetime.now(_UTC))
         log_path = self._logs_dir / f"detach-{ts}.log"
         handle = log_path.open("a")
         handle.write(f"# command: {command}\n\n")
@@ -98,12 +104,28 @@ class InstanceLogger:
         """Append one JSONL line to ``history.jsonl``."""
         if not self._enabled:
             return
-        with self._history_path.open("a") as f:
-            f.write(json.dumps(entry, default=str) + "\n")
+        if self._history_file is None:
+            self._history_file = self._history_path.open("ab")
+        self._history_file.write(dumps(entry) + b"\n")
+        # Flushed per entry so ``pocketdock logs`` sees it immediately.
+        self._history_file.flush()
+
+    def close(self) -> None:
+        """Close the history file, if it was opened."""
+        if self._history_file is not None:
+            self._history_file.close()
+            self._history_file = None
 
 
 class SessionLogHandle:
-    """Handle for incremental writes to a session log file."""
+    """Handle for incremental writes to a session log file.
+
+    Writes are buffered and reach the file on :meth:`flush` or :meth:`close`.
+    The session flushes after each sent command and each received frame, so
+    the file stays current at one ``write(2)`` per frame rather than per line.
+    """
+
+    __slots__ = ("_handle",)
 
     def __init__(self, handle: TextIO | None) -> None:
         self._handle = handle
@@ -112,18 +134,19 @@ class SessionLogHandle:
         """Log a command sent to the session."""
         if self._handle is None:
             return
-        from datetime import datetime, timezone  # noqa: PLC0415
-
-        ts = datetime.now(tz=timezone.utc).isoformat()
+        ts = datetime.datetime.now(_UTC).isoformat()
         self._handle.write(f"[{ts}] >>> {command}\n")
-        self._handle.flush()
 
     def write_recv(self, data: str) -> None:
         """Log output received from the session."""
         if self._handle is None:
             return
         self._handle.write(data)
-        self._handle.flush()
+
+    def flush(self) -> None:
+        """Push buffered log text to disk without closing the file."""
+        if self._handle is not None:
+            self._handle.flush()
 
     def close(self) -> None:
         """Close the log file."""
@@ -133,7 +156,13 @@ class SessionLogHandle:
 
 
 class DetachLogHandle:
-    """Handle for incremental writes to a detach log file."""
+    """Handle for incremental writes to a detach log file.
+
+    Buffered like :class:`SessionLogHandle`; the process reader flushes
+    after each output frame.
+    """
+
+    __slots__ = ("_handle",)
 
     def __init__(self, handle: TextIO | None) -> None:
         self._handle = handle
@@ -142,11 +171,13 @@ class DetachLogHandle:
         """Log output from a detached process."""
         if self._handle is None:
             return
-        from datetime import datetime, timezone  # noqa: PLC0415
-
-        ts = datetime.now(tz=timezone.utc).isoformat()
+        ts = datetime.datetime.now(_UTC).isoformat()
         self._handle.write(f"[{ts}] [{stream}] {data}")
-        self._handle.flush()
+
+    def flush(self) -> None:
+        """Push buffered log text to disk without closing the file."""
+        if self._handle is not None:
+            self._handle.flush()
 
     def close(self, exit_code: int, duration_ms: float) -> None:
         """Close the log file with exit info."""
@@ -151,6 +151,10 @@ class AsyncProcess:
                     self._callbacks.dispatch_stderr(self._container, data_str)
                     if self._log_handle is not None:
                         self._log_handle.write_output("stderr", data_str)
+                # Flush once per frame so the log follows a long-running
+                # process and survives a crash; the handle itself only buffers.
+                if self._log_handle is not None:
+                    self._log_handle.flush()
         finally:
             self._writer.close()
             await self._writer.wait_closed()
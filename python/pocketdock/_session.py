@@ -95,6 +95,7 @@ class AsyncSession:
             raise SessionClosed
         if self._log_handle is not None:
             self._log_handle.write_send(command)
+            self._log_handle.flush()
         self._writer.write(f"{command}\n".encode())
         await self._writer.drain()
 
@@ -153,11 +154,16 @@ class AsyncSession:
         )
 
     def read(self) -> str:
-        """Drain and return all accumulated output (thread-safe)."""
+        """Drain and return all accumulated output (thread-safe).
+
+        Never touches the event loop, so the sync facade calls it directly
+        from the caller's thread.  The lock is only held long enough to swap
+        the buffer out; the join happens after it is released so the read
+        loop is not stalled behind a large drain.
+        """
         with self._lock:
-            text = "".join(self._output)
-            self._output.clear()
-            return text
+            parts, self._output = self._output, []
+        return "".join(parts)
 
     def on_output(self, fn: Callable[..., object]) -> None:
         """Register a callback for output data.
@@ -207,6 +213,10 @@ class AsyncSession:
                         self._emit(line + "\n", is_stdout=True)
                 else:
                     self._emit(text, is_stdout=False)
+                # A frame can hold many lines; they reach the log file in one
+                # write, and the file stays current while the session runs.
+                if self._log_handle is not None:
+                    self._log_handle.flush()
         finally:
             if self._pending is not None and not self._pending.event.is_set():
                 self._pending.exit_code = -1
@@ -15,6 +15,7 @@ Uses unversioned Docker-compatible API paths (``/containers/create``, not
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import os
 import pathlib
@@ -24,8 +25,9 @@ import urllib.parse
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncGenerator
+    from collections.abc import AsyncGenerator, AsyncIterable, Collection
 
+from pocketdock._json import loads
 from pocketdock._stream import (
     HEADER_SIZE as _DEMUX_HEADER_SIZE,
 )
@@ -98,6 +100,30 @@ def detect_socket() -> str | None:
     return None
 
 
+@functools.lru_cache(maxsize=1)
+def _detect_socket_for(explicit: str | None, xdg: str | None) -> str | None:  # noqa: ARG001
+    """Memoised :func:`detect_socket`, keyed on the env vars it reads."""
+    return detect_socket()
+
+
+def detect_socket_cached() -> str | None:
+    """Like :func:`detect_socket`, but reuse the last successful probe.
+
+    The cache is keyed on ``POCKETDOCK_SOCKET`` and ``XDG_RUNTIME_DIR`` so a
+    change to either re-probes.  A miss is never remembered, so a caller
+    that retries after starting the engine sees the new socket, and a hit
+    whose socket has since disappeared (engine stopped) is probed afresh.
+    """
+    key = (os.environ.get("POCKETDOCK_SOCKET"), os.environ.get("XDG_RUNTIME_DIR"))
+    detected = _detect_socket_for(*key)
+    if detected is not None and not _path_exists(pathlib.Path(detected)):
+        _detect_socket_for.cache_clear()
+        detected = _detect_socket_for(*key)
+    if detected is None:
+        _detect_socket_for.cache_clear()
+    return detected
+
+
 # ---------------------------------------------------------------------------
 # Raw HTTP helpers
 # ---------------------------------------------------------------------------
@@ -117,25 +143,48 @@ async def _send_request(
     writer: asyncio.StreamWriter,
     method: str,
     path: str,
-    body: bytes | None = None,
+    body: bytes | AsyncIterable[bytes] | None = None,
     content_type: str = "application/json",
 ) -> None:
-    """Write an HTTP/1.1 request to the writer."""
+    """Write an HTTP/1.1 request to the writer.
+
+    A ``bytes`` body is sent with ``Content-Length``; an async iterable of
+    chunks is sent with ``Transfer-Encoding: chunked`` as it is produced.
+    """
     lines = [
         f"{method} {path} HTTP/1.1",
         "Host: localhost",
     ]
     if body is not None:
         lines.append(f"Content-Type: {content_type}")
-        lines.append(f"Content-Length: {len(body)}")
+        if isinstance(body, bytes):
+            lines.append(f"Content-Length: {len(body)}")
+        else:
+            lines.append("Transfer-Encoding: chunked")
     lines.append("Connection: close")
     lines.append("")
     lines.append("")
 
     header_bytes = "\r\n".join(lines).encode("ascii")
     writer.write(header_bytes)
-    if body is not None:
+    if isinstance(body, bytes):
         writer.write(body)
+    elif body is not None:
+        await _send_chunked(writer, body)
+        return
+    await writer.drain()
+
+
+async def _send_chunked(writer: asyncio.StreamWriter, chunks: AsyncIterable[bytes]) -> None:
+    """Write *chunks* using HTTP/1.1 chunked transfer encoding."""
+    async for chunk in chunks:
+        if not chunk:  # a zero-length chunk would end the body early
+            continue
+        writer.write(b"%x\r\n" % len(chunk))
+        writer.write(chunk)
+        writer.write(b"\r\n")
+        await writer.drain()
+    writer.write(b"0\r\n\r\n")
     await writer.drain()
 
 
@@ -219,6 +268,53 @@ async def _read_chunked(reader: asyncio.StreamReader) -> bytes:
     return b"".join(parts)
 
 
+async def _iter_body(
+    reader: asyncio.StreamReader,
+    headers: dict[str, str],
+) -> AsyncGenerator[bytes, None]:
+    """Yield the HTTP response body in pieces of at most 64 KiB as it arrives.
+
+    The streaming counterpart of :func:`_read_body` for bodies too large to
+    hold in memory, such as image archives.  A body cut short by the
+    connection closing raises :class:`asyncio.IncompleteReadError`, so a
+    truncated download is never mistaken for a complete one.
+    """
+    if headers.get("transfer-encoding", "").lower() == "chunked":
+        async for chunk in _iter_chunked(reader):
+            yield chunk
+        return
+
+    content_length_str = headers.get("content-length")
+    remaining = int(content_length_str) if content_length_str is not None else -1
+    if remaining < 0:  # no length given: the body runs until EOF
+        while chunk := await reader.read(65536):
+            yield chunk
+        return
+    while remaining:
+        chunk = await reader.readexactly(min(remaining, 65536))
+        remaining -= len(chunk)
+        yield chunk
+
+
+async def _iter_chunked(reader: asyncio.StreamReader) -> AsyncGenerator[bytes, None]:
+    """Yield a chunked transfer-encoded body without joining the chunks."""
+    while True:
+        # readuntil raises on EOF, before the terminating 0-size chunk arrives.
+        size_line = await reader.readuntil(b"\n")
+        size_str = size_line.strip().decode("ascii", errors="replace")
+        if not size_str:
+            continue
+        remaining = int(size_str, 16)
+        if remaining == 0:
+            await reader.readline()  # trailing \r\n
+            return
+        while remaining:
+            chunk = await reader.readexactly(min(remaining, 65536))
+            remaining -= len(chunk)
+            yield chunk
+        await reader.readline()  # trailing \r\n after chunk
+
+
 async def _request(
     socket_path: str,
     method: str,
@@ -353,7 +449,7 @@ async def create_container(  # noqa: PLR0913
         msg = f"create failed: HTTP {status}: {body.decode('utf-8', errors='replace')}"
         raise SocketCommunicationError(msg)
 
-    data = json.loads(body)
+    data = loads(body)
     return str(data["Id"])
 
 
@@ -396,7 +492,7 @@ async def inspect_container(socket_path: str, container_id: str) -> dict[str, An
     """Inspect a container, returning its full JSON state."""
     status, body = await _request(socket_path, "GET", f"/containers/{container_id}/json")
     _check_container_response(status, body, container_id)
-    return json.loads(body)  # type: ignore[no-any-return]
+    return loads(body)  # type: ignore[no-any-return]
 
 
 async def get_container_stats(socket_path: str, container_id: str) -> dict[str, Any]:
@@ -410,7 +506,7 @@ async def get_container_stats(socket_path: str, container_id: str) -> dict[str,
         f"/containers/{container_id}/stats?stream=false&one-shot=true",
     )
     _check_container_response(status, body, container_id)
-    return json.loads(body)  # type: ignore[no-any-return]
+    return loads(body)  # type: ignore[no-any-return]
 
 
 async def get_container_top(socket_path: str, container_id: str) -> dict[str, Any]:
@@ -424,7 +520,7 @@ async def get_container_top(socket_path: str, container_id: str) -> dict[str, An
         f"/containers/{container_id}/top",
     )
     _check_container_response(status, body, container_id)
-    return json.loads(body)  # type: ignore[no-any-return]
+    return loads(body)  # type: ignore[no-any-return]
 
 
 async def restart_container(
@@ -541,7 +637,7 @@ async def _exec_create(
         msg = f"exec create failed: HTTP {status}: {body_text}"
         raise SocketCommunicationError(msg)
 
-    data = json.loads(body)
+    data = loads(body)
     return str(data["Id"])
 
 
@@ -651,7 +747,7 @@ async def _exec_inspect_exit_code(socket_path: str, exec_id: str) -> int:
     if status >= 400:  # noqa: PLR2004
         msg = f"exec inspect failed: HTTP {status}: {body.decode('utf-8', errors='replace')}"
         raise SocketCommunicationError(msg)
-    data = json.loads(body)
+    data = loads(body)
     return int(data["ExitCode"])
 
 
@@ -664,10 +760,10 @@ async def _request_raw(
     socket_path: str,
     method: str,
     path: str,
-    body: bytes | None = None,
+    body: bytes | AsyncIterable[bytes] | None = None,
     content_type: str = "application/x-tar",
 ) -> tuple[int, bytes]:
-    """Make an HTTP request with a raw byte body."""
+    """Make an HTTP request with a raw byte body (or a stream of chunks)."""
     reader, writer = await _open_connection(socket_path)
     try:
         await _send_request(writer, method, path, body, content_type=content_type)
@@ -694,7 +790,7 @@ async def push_archive(
     socket_path: str,
     container_id: str,
     dest_path: str,
-    tar_data: bytes,
+    tar_data: bytes | AsyncIterable[bytes],
 ) -> None:
     """Upload a tar archive to the container.
 
@@ -704,7 +800,8 @@ async def push_archive(
         socket_path: Path to the container engine Unix socket.
         container_id: Target container ID.
         dest_path: Destination directory inside the container.
-        tar_data: Raw tar archive bytes.
+        tar_data: Raw tar archive bytes, or an async iterable of chunks
+            that is streamed with chunked transfer encoding.
 
     """
     encoded_path = urllib.parse.quote(dest_path, safe="")
@@ -762,7 +859,8 @@ async def pull_archive(
 async def list_containers(
     socket_path: str,
     *,
-    label_filter: str | None = None,
+    label_filter: str | list[str] | None = None,
+    fields: Collection[str] | None = None,
 ) -> list[dict[str, Any]]:
     """List containers, optionally filtered by label.
 
@@ -770,7 +868,10 @@ async def list_containers(
 
     Args:
         socket_path: Path to the container engine Unix socket.
-        label_filter: Label filter string (e.g. ``"pocketdock.managed=true"``).
+        label_filter: Label filter string (e.g. ``"pocketdock.managed=true"``),
+            or a list of them that must all match.
+        fields: If given, keep only these top-level keys in each object so
+            callers don't hold on to Mounts, NetworkSettings and the like.
 
     Returns:
         List of container JSON objects from the engine.
@@ -778,13 +879,17 @@ async def list_containers(
     """
     path = "/containers/json?all=true"
     if label_filter is not None:
-        filters = json.dumps({"label": [label_filter]})
+        labels = [label_filter] if isinstance(label_filter, str) else label_filter
+        filters = json.dumps({"label": labels})
         path = f"{path}&filters={urllib.parse.quote(filters)}"
     status, body = await _request(socket_path, "GET", path)
     if status >= 400:  # noqa: PLR2004
         msg = f"list containers failed: HTTP {status}: {body.decode('utf-8', errors='replace')}"
         raise SocketCommunicationError(msg)
-    return json.loads(body)  # type: ignore[no-any-return]
+    containers: list[dict[str, Any]] = loads(body)
+    if fields is None:
+        return containers
+    return [{k: c[k] for k in fields if k in c} for c in containers]
 
 
 async def commit_container(
@@ -816,7 +921,7 @@ async def commit_container(
     )
     status, body = await _request(socket_path, "POST", f"/commit?{params}")
     _check_container_response(status, body, container_id)
-    data = json.loads(body)
+    data = loads(body)
     return str(data["Id"])
 
 
@@ -856,6 +961,15 @@ async def build_image(
     return body.decode("utf-8", errors="replace")
 
 
+def _check_save_response(status: int, body: bytes, image_name: str) -> None:
+    """Raise the appropriate error for a failed image export."""
+    if status == 404:  # noqa: PLR2004
+        raise ImageNotFound(image_name)
+    if status >= 400:  # noqa: PLR2004
+        msg = f"save failed: HTTP {status}: {body.decode('utf-8', errors='replace')}"
+        raise SocketCommunicationError(msg)
+
+
 async def save_image(socket_path: str, image_name: str) -> bytes:
     """Export an image as a tar archive.
 
@@ -878,22 +992,56 @@ async def save_image(socket_path: str, image_name: str) -> bytes:
         "GET",
         f"/images/{encoded}/get",
     )
-    if status == 404:  # noqa: PLR2004
-        raise ImageNotFound(image_name)
-    if status >= 400:  # noqa: PLR2004
-        msg = f"save failed: HTTP {status}: {body.decode('utf-8', errors='replace')}"
-        raise SocketCommunicationError(msg)
+    _check_save_response(status, body, image_name)
     return body
 
 
-async def load_image(socket_path: str, tar_data: bytes) -> str:
+async def save_image_stream(socket_path: str, image_name: str) -> AsyncGenerator[bytes, None]:
+    """Export an image as a tar archive, yielding it in chunks as it arrives.
+
+    Like :func:`save_image`, but the archive is never held in memory as a
+    whole, so multi-gigabyte images can be written straight to disk.  Errors
+    are raised when iteration starts.
+
+    Args:
+        socket_path: Path to the container engine Unix socket.
+        image_name: Image name with optional tag (e.g. ``"pocketdock/dev:latest"``).
+
+    Yields:
+        Consecutive pieces of the tar archive.
+
+    Raises:
+        ImageNotFound: If the image does not exist locally.
+
+    """
+    encoded = urllib.parse.quote(image_name, safe="")
+    status, headers, reader, writer = await _request_stream(
+        socket_path,
+        "GET",
+        f"/images/{encoded}/get",
+    )
+    try:
+        if status >= 400:  # noqa: PLR2004
+            _check_save_response(status, await _read_body(reader, headers), image_name)
+        async for chunk in _iter_body(reader, headers):
+            yield chunk
+    except (OSError, asyncio.IncompleteReadError) as exc:
+        raise SocketCommunicationError(str(exc)) from exc
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+async def load_image(socket_path: str, tar_data: bytes | AsyncIterable[bytes]) -> str:
     """Load an image from a tar archive.
 
     Uses ``POST /images/load``.
 
     Args:
         socket_path: Path to the container engine Unix socket.
-        tar_data: Raw tar archive bytes (as produced by :func:`save_image`).
+        tar_data: Raw tar archive bytes (as produced by :func:`save_image`),
+            or an async iterable of chunks that is streamed with chunked
+            transfer encoding.
 
     Returns:
         Load output from the engine.
@@ -11,8 +11,8 @@ to the background event loop via :func:`asyncio.run_coroutine_threadsafe`.
 from __future__ import annotations
 
 import asyncio
-import atexit
 import threading
+import weakref
 from typing import TYPE_CHECKING, Literal, overload
 
 from pocketdock._async_container import (
@@ -37,6 +37,19 @@ if TYPE_CHECKING:
     from pocketdock.types import ContainerInfo, ExecResult, StreamChunk
 
 
+_SHUTDOWN_JOIN_TIMEOUT = 0.1
+
+
+def _shutdown_loop(loop: asyncio.AbstractEventLoop, thread: threading.Thread) -> None:
+    """Stop *loop* and briefly join its daemon *thread*.
+
+    The thread is a daemon, so there is no need to wait long: an idle loop
+    stops almost immediately and a busy one is torn down with the process.
+    """
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=_SHUTDOWN_JOIN_TIMEOUT)
+
+
 class _LoopThread:
     """Singleton background event loop thread shared by all sync Containers."""
 
@@ -51,16 +64,26 @@ class _LoopThread:
             daemon=True,
         )
         self._thread.start()
-        atexit.register(self._shutdown)
+        # finalize() fires at most once — on collection or at interpreter
+        # exit — and must not hold a reference back to ``self``.
+        self._finalizer = weakref.finalize(self, _shutdown_loop, self._loop, self._thread)
 
     @classmethod
     def get(cls) -> _LoopThread:
-        """Return the singleton, creating it lazily."""
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = cls()
-        return cls._instance
+        """Return the singleton, creating it lazily.
+
+        Reads go through ``cls.__dict__`` directly — a single dict lookup
+        that skips the descriptor protocol, so the fast path stays cheap
+        (and atomic) on free-threaded builds as well.
+        """
+        inst: _LoopThread | None = cls.__dict__.get("_instance")
+        if inst is not None:
+            return inst
+        with cls._lock:
+            inst = cls.__dict__.get("_instance")
+            if inst is None:
+                cls._instance = inst = cls()
+        return inst
 
     @property
     def loop(self) -> asyncio.AbstractEventLoop:
@@ -75,8 +98,7 @@ class _LoopThread:
         return future.result(timeout=timeout)
 
     def _shutdown(self) -> None:
-        self._loop.call_soon_threadsafe(self._loop.stop)
-        self._thread.join(timeout=5)
+        self._finalizer()
 
 
 class SyncExecStream:
@@ -93,6 +115,8 @@ class SyncExecStream:
         return self
 
     def __next__(self) -> StreamChunk:
+        # Pull one chunk per call: the exec is only read as fast as the caller
+        # consumes it, and nothing keeps reading after the caller stops.
         try:
             return self._lt.run(self._async_stream.__anext__())  # type: ignore[return-value]
         except StopAsyncIteration:
@@ -305,12 +329,12 @@ class Container:
             return SyncProcess(result, self._lt)  # type: ignore[arg-type]
         return result  # type: ignore[return-value]
 
-    def info(self) -> ContainerInfo:
+    def info(self, *, max_age: float = 0.0) -> ContainerInfo:
         """Return a live snapshot of the container's state and resource usage.
 
         See :meth:`AsyncContainer.info` for full documentation.
         """
-        return self._lt.run(self._ac.info())  # type: ignore[return-value]
+        return self._lt.run(self._ac.info(max_age=max_age))  # type: ignore[return-value]
 
     def reboot(self, *, fresh: bool = False) -> None:
         """Restart the container.
@@ -413,6 +437,7 @@ def create_new_container(  # noqa: PLR0913
     profile: str | None = None,
     devices: list[str] | None = None,
     ports: dict[int, int] | None = None,
+    socket_path: str | None = None,
 ) -> Container:
     """Create and start a new container, returning a sync handle.
 
@@ -432,6 +457,7 @@ def create_new_container(  # noqa: PLR0913
             profile=profile,
             devices=devices,
             ports=ports,
+            socket_path=socket_path,
         )
     )
     return Container(ac, lt)  # type: ignore[arg-type]
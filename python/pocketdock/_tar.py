@@ -0,0 +1,103 @@
+# SPDX-License-Identifier: BSD-2-Clause
+# Copyright (c) deftio llc
+
+"""Streaming tar archives for uploads into a container.
+
+Archives are produced as async iterators of byte chunks so the archive API
+can be fed with chunked transfer encoding, instead of building the whole tar
+in memory and then copying it again into the request body.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import tarfile
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pathlib
+    from collections.abc import AsyncIterator
+
+_CHUNK_SIZE = 64 * 1024
+_END_OF_ARCHIVE = bytes(2 * tarfile.BLOCKSIZE)
+
+
+def _padding(size: int) -> bytes:
+    """Return the zero fill that rounds a member of *size* bytes up to a block."""
+    remainder = size % tarfile.BLOCKSIZE
+    return bytes(tarfile.BLOCKSIZE - remainder) if remainder else b""
+
+
+def _reset_tar_info(info: tarfile.TarInfo) -> tarfile.TarInfo:
+    """Reset ownership and permissions for container compatibility."""
+    info.uid = 0
+    info.gid = 0
+    info.uname = "root"
+    info.gname = "root"
+    if info.isdir():
+        info.mode = 0o755
+    else:
+        info.mode = 0o644
+    return info
+
+
+async def stream_bytes(name: str, data: bytes) -> AsyncIterator[bytes]:
+    """Yield a tar archive holding a single regular file *name* with *data*."""
+    info = tarfile.TarInfo(name=name)
+    info.size = len(data)
+    yield info.tobuf()
+    yield data
+    yield _padding(len(data)) + _END_OF_ARCHIVE
+
+
+def _collect_members(
+    host_path: pathlib.Path,
+    arcname: str,
+) -> list[tuple[tarfile.TarInfo, pathlib.Path | None]]:
+    """Walk *host_path* like ``TarFile.add`` and return (header, source) pairs.
+
+    The source is only set for regular files whose contents must follow the
+    header.  A scratch :class:`tarfile.TarFile` provides ``gettarinfo`` so
+    symlinks and hard links are recorded exactly as ``add`` would.
+    """
+    tar = tarfile.TarFile(fileobj=io.BytesIO(), mode="w")
+    members: list[tuple[tarfile.TarInfo, pathlib.Path | None]] = []
+    pending = [(host_path, arcname)]
+    while pending:
+        path, name = pending.pop()
+        info = tar.gettarinfo(str(path), name)
+        if info is None:  # sockets, devices tarfile cannot represent
+            continue
+        members.append((_reset_tar_info(info), path if info.isreg() else None))
+        if info.isdir():
+            children = sorted((child.name for child in path.iterdir()), reverse=True)
+            pending.extend((path / child, f"{name}/{child}") for child in children)
+    return members
+
+
+async def stream_path(host_path: pathlib.Path, arcname: str) -> AsyncIterator[bytes]:
+    """Yield a tar archive of *host_path* (file or directory) stored as *arcname*.
+
+    File contents are read in 64 KiB chunks in a worker thread, so peak memory
+    stays at one chunk regardless of file size.
+    """
+    members = await asyncio.to_thread(_collect_members, host_path, arcname)
+    for info, source in members:
+        yield info.tobuf()
+        if source is None or not info.size:
+            continue
+        f = await asyncio.to_thread(source.open, "rb")
+        try:
+            remaining = info.size
+            while remaining:
+                chunk = await asyncio.to_thread(f.read, min(remaining, _CHUNK_SIZE))
+                if not chunk:
+                    msg = f"{source} shrank while it was being archived"
+                    raise OSError(msg)
+                remaining -= len(chunk)
+                yield chunk
+        finally:
+            f.close()
+        yield _padding(info.size)
+    yield _END_OF_ARCHIVE
@@ -5,23 +5,29 @@
 
 from __future__ import annotations
 
-import json
+import collections
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, BinaryIO, Literal
 
 import click
 
 if TYPE_CHECKING:
+    import gzip
+    from collections.abc import AsyncIterator, Iterator
+
     from pocketdock import Container
     from pocketdock.cli.main import CliContext
 
+from pocketdock._json import loads
 from pocketdock.cli._output import (
+    click_echo_json,
     format_container_info,
     format_container_list,
     format_doctor_report,
     format_error,
     print_success,
 )
+from pocketdock.errors import PocketDockError, PodmanNotRunning, ProjectNotInitialized
 
 
 @click.command("quickstart")
@@ -78,7 +84,7 @@ def _resolve_container(name: str, socket_path: str | None) -> Container:
 
     try:
         return pocketdock.resume_container(name, socket_path=socket_path)
-    except pocketdock.PocketDockError as exc:
+    except PocketDockError as exc:
         format_error(exc)
         raise SystemExit(1) from exc
 
@@ -98,7 +104,7 @@ def init_cmd(name: str | None, path: str | None) -> None:
     resolved = Path(path) if path else None
     try:
         root = pocketdock.init_project(resolved, project_name=name)
-    except pocketdock.PocketDockError as exc:
+    except PocketDockError as exc:
         format_error(exc)
         raise SystemExit(1) from exc
     print_success(f"Project initialized at {root}")
@@ -115,7 +121,7 @@ def list_cmd(ctx: click.Context, *, json_output: bool, project: str | None) -> N
     cli_ctx = _get_ctx(ctx)
     try:
         items = pocketdock.list_containers(socket_path=cli_ctx.socket, project=project)
-    except pocketdock.PocketDockError as exc:
+    except PocketDockError as exc:
         format_error(exc)
         raise SystemExit(1) from exc
     format_container_list(items, json_output=json_output)
@@ -132,8 +138,6 @@ def info_cmd(ctx: click.Context, container: str, *, json_output: bool) -> None:
     try:
         info = c.info()
     except Exception as exc:
-        from pocketdock.errors import PocketDockError  # noqa: PLC0415
-
         if isinstance(exc, PocketDockError):
             format_error(exc)
         raise SystemExit(1) from exc
@@ -150,7 +154,7 @@ def doctor_cmd(ctx: click.Context, *, json_output: bool) -> None:
     cli_ctx = _get_ctx(ctx)
     try:
         report = pocketdock.doctor(socket_path=cli_ctx.socket)
-    except pocketdock.PocketDockError as exc:
+    except PocketDockError as exc:
         format_error(exc)
         raise SystemExit(1) from exc
     format_doctor_report(report, json_output=json_output)
@@ -168,13 +172,11 @@ def status_cmd(ctx: click.Context, *, json_output: bool) -> None:
     try:
         root = pocketdock.find_project_root()
         if root is None:
-            from pocketdock.errors import ProjectNotInitialized  # noqa: PLC0415
-
             raise ProjectNotInitialized
         project_name = get_project_name(root)
         instances = list_instance_dirs(root)
         containers = pocketdock.list_containers(socket_path=cli_ctx.socket, project=project_name)
-    except pocketdock.PocketDockError as exc:
+    except PocketDockError as exc:
         format_error(exc)
         raise SystemExit(1) from exc
 
@@ -182,8 +184,6 @@ def status_cmd(ctx: click.Context, *, json_output: bool) -> None:
     stopped = len(containers) - running
 
     if json_output:
-        import sys  # noqa: PLC0415
-
         data = {
             "project": project_name,
             "root": str(root),
@@ -192,7 +192,7 @@ def status_cmd(ctx: click.Context, *, json_output: bool) -> None:
             "running": running,
             "stopped": stopped,
         }
-        sys.stdout.write(json.dumps(data, indent=2, default=str) + "\n")
+        click_echo_json(data)
         return
 
     from rich.console import Console  # noqa: PLC0415
@@ -213,27 +213,76 @@ def status_cmd(ctx: click.Context, *, json_output: bool) -> None:
 # ---------------------------------------------------------------------------
 
 
-def _read_history_entries(instance_dirs: list[Path]) -> list[dict[str, object]]:
-    """Read JSONL history entries from instance directories."""
-    entries: list[dict[str, object]] = []
+def _iter_history_entries(
+    instance_dirs: list[Path],
+    entry_type: str | None = None,
+) -> Iterator[dict[str, object]]:
+    """Yield JSONL history entries from instance directories, one line at a time.
+
+    If *entry_type* is given, only entries of that type are yielded, and
+    lines that cannot contain it are skipped without being decoded.
+    """
+    needle = _raw_needle(entry_type) if entry_type else b""
     for inst_dir in instance_dirs:
-        history = inst_dir / "logs" / "history.jsonl"
-        if history.is_file():
-            for raw in history.read_text().splitlines():
-                stripped = raw.strip()
-                if not stripped:
+        # Opening directly answers "is there a history file" with one syscall
+        # instead of a stat followed by the open.
+        try:
+            fh = (inst_dir / "logs" / "history.jsonl").open("rb")
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+            continue
+        # Iterating the binary file keeps only one line in memory; the decoder
+        # accepts UTF-8 bytes and ignores the trailing newline itself.
+        with fh:
+            for raw in fh:
+                if raw.isspace() or needle not in raw:
                     continue
                 try:
-                    entry = json.loads(stripped)
-                except json.JSONDecodeError:
+                    entry = loads(raw)
+                except ValueError:  # malformed JSON or invalid UTF-8
+                    continue
+                if entry_type and entry.get("type") != entry_type:
                     continue
                 entry["_instance"] = inst_dir.name
-                entries.append(entry)
-    return entries
+                yield entry
+
+
+def _raw_needle(value: str) -> bytes:
+    """Return bytes that any JSON encoding of the string *value* contains.
+
+    Printable ASCII without quotes or backslashes is written verbatim by both
+    json and orjson; anything else may be escaped, so no pre-filter (``b""``).
+    """
+    if value.isascii() and value.isprintable() and '"' not in value and "\\" not in value:
+        return value.encode("ascii")
+    return b""
+
+
+_LOG_COLUMNS = ("Instance", "Type", "Command", "Exit", "Duration", "Timestamp")
+
+# Rich measures and renders every cell, which takes seconds for thousands of
+# rows; longer listings are printed as plain aligned text instead.
+_RICH_LOG_ROWS = 200
+
+
+def _log_row(entry: dict[str, object]) -> tuple[str, ...]:
+    """Return the display cells of a history entry, in ``_LOG_COLUMNS`` order."""
+    dur = entry.get("duration_ms")
+    return (
+        str(entry.get("_instance", "")),
+        str(entry.get("type", "")),
+        str(entry.get("command", ""))[:60],
+        str(entry.get("exit_code", "")),
+        f"{dur:.0f}ms" if isinstance(dur, (int, float)) else "",
+        str(entry.get("timestamp", "")),
+    )
 
 
 def _print_log_table(entries: list[dict[str, object]]) -> None:
-    """Print log entries as a Rich table."""
+    """Print log entries as a Rich table, or as plain text for long listings."""
+    if len(entries) > _RICH_LOG_ROWS:
+        _print_log_plain(entries)
+        return
+
     from rich.console import Console  # noqa: PLC0415
     from rich.table import Table  # noqa: PLC0415
 
@@ -246,22 +295,33 @@ def _print_log_table(entries: list[dict[str, object]]) -> None:
     table.add_column("Timestamp", style="dim")
 
     for entry in entries:
-        exit_code = str(entry.get("exit_code", ""))
+        instance, kind, command, exit_code, dur_str, timestamp = _log_row(entry)
         exit_style = "green" if exit_code == "0" else "red" if exit_code else ""
-        dur = entry.get("duration_ms")
-        dur_str = f"{dur:.0f}ms" if isinstance(dur, (int, float)) else ""
         table.add_row(
-            str(entry.get("_instance", "")),
-            str(entry.get("type", "")),
-            str(entry.get("command", ""))[:60],
+            instance,
+            kind,
+            command,
             f"[{exit_style}]{exit_code}[/{exit_style}]" if exit_style else exit_code,
             dur_str,
-            str(entry.get("timestamp", "")),
+            timestamp,
         )
 
     Console().print(table)
 
 
+def _print_log_plain(entries: list[dict[str, object]]) -> None:
+    """Print log entries as aligned plain-text columns in a single write."""
+    import sys  # noqa: PLC0415
+
+    rows = [_LOG_COLUMNS, *map(_log_row, entries)]
+    widths = [max(map(len, column)) for column in zip(*rows, strict=True)]
+    lines = [
+        "  ".join(cell.ljust(width) for cell, width in zip(row, widths, strict=True)).rstrip()
+        for row in rows
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
 @click.command("logs")
 @click.argument("container", required=False, default=None)
 @click.option("--last", "last_n", type=int, default=10, help="Number of entries to show.")
@@ -285,8 +345,6 @@ def logs_cmd(
 
     root = pocketdock.find_project_root()
     if root is None:
-        from pocketdock.errors import ProjectNotInitialized  # noqa: PLC0415
-
         err = ProjectNotInitialized()
         format_error(err)
         raise SystemExit(1) from err
@@ -298,17 +356,15 @@ def logs_cmd(
             click.echo(f"No instance directory found for '{container}'.", err=True)
             raise SystemExit(1)
 
-    entries = _read_history_entries(instance_dirs)
-
-    if entry_type:
-        entries = [e for e in entries if e.get("type") == entry_type]
-
-    entries = entries[-last_n:]
+    stream = _iter_history_entries(instance_dirs, entry_type)
+    # Only the last N matches are kept while reading, so memory stays bounded
+    # by --last rather than by the size of the history files.
+    entries = (
+        list(collections.deque(stream, maxlen=last_n)) if last_n > 0 else list(stream)[-last_n:]
+    )
 
     if json_output:
-        import sys  # noqa: PLC0415
-
-        sys.stdout.write(json.dumps(entries, indent=2, default=str) + "\n")
+        click_echo_json(entries)
         return
 
     if not entries:
@@ -354,19 +410,19 @@ def _build_create_kwargs(  # noqa: PLR0913, C901, PLR0912
     if device:
         kwargs["devices"] = list(device)
     if volume:
-        volumes = dict(
-            pair
-            for v in volume
-            if len(pair := v.split(":", 1)) == 2  # noqa: PLR2004
-        )
+        volumes: dict[str, str] = {}
+        for v in volume:
+            host_path, sep, container_path = v.partition(":")
+            if sep:
+                volumes[host_path] = container_path
         if volumes:
             kwargs["volumes"] = volumes
     if port:
         ports: dict[int, int] = {}
         for p in port:
-            parts = p.split(":", 1)
-            if len(parts) == 2 and parts[0].isdigit() and parts[1].isdigit():  # noqa: PLR2004
-                ports[int(parts[0])] = int(parts[1])
+            host_port, sep, container_port = p.partition(":")
+            if sep and host_port.isdigit() and container_port.isdigit():
+                ports[int(host_port)] = int(container_port)
         if ports:
             kwargs["ports"] = ports
     return kwargs
@@ -409,8 +465,6 @@ def create_cmd(  # noqa: PLR0913
     port: tuple[str, ...],
 ) -> None:
     """Create and start a new container."""
-    import os  # noqa: PLC0415
-
     import pocketdock  # noqa: PLC0415
 
     cli_ctx = _get_ctx(ctx)
@@ -428,20 +482,11 @@ def create_cmd(  # noqa: PLR0913
         port=port,
     )
 
-    old_env = os.environ.get("POCKETDOCK_SOCKET")
-    if cli_ctx.socket:
-        os.environ["POCKETDOCK_SOCKET"] = cli_ctx.socket
     try:
-        c = pocketdock.create_new_container(**kwargs)  # type: ignore[arg-type]
-    except pocketdock.PocketDockError as exc:
+        c = pocketdock.create_new_container(**kwargs, socket_path=cli_ctx.socket or None)  # type: ignore[arg-type]
+    except PocketDockError as exc:
         format_error(exc)
         raise SystemExit(1) from exc
-    finally:
-        if cli_ctx.socket:
-            if old_env is None:
-                os.environ.pop("POCKETDOCK_SOCKET", None)
-            else:
-                os.environ["POCKETDOCK_SOCKET"] = old_env
 
     print_success(f"Container {c.name} created ({c.container_id[:12]})")
 
@@ -489,8 +534,6 @@ def run_cmd(  # noqa: PLR0913
             kw["lang"] = lang
         result = c.run(cmd_str, **kw)  # type: ignore[call-overload]
     except Exception as exc:
-        from pocketdock.errors import PocketDockError  # noqa: PLC0415
-
         if isinstance(exc, PocketDockError):
             format_error(exc)
         raise SystemExit(1) from exc
@@ -554,8 +597,6 @@ def push_cmd(ctx: click.Context, container: str, src: str, dst: str) -> None:
     try:
         c.push(src, dst)
     except Exception as exc:
-        from pocketdock.errors import PocketDockError  # noqa: PLC0415
-
         if isinstance(exc, PocketDockError):
             format_error(exc)
         raise SystemExit(1) from exc
@@ -574,8 +615,6 @@ def pull_cmd(ctx: click.Context, container: str, src: str, dst: str) -> None:
     try:
         c.pull(src, dst)
     except Exception as exc:
-        from pocketdock.errors import PocketDockError  # noqa: PLC0415
-
         if isinstance(exc, PocketDockError):
             format_error(exc)
         raise SystemExit(1) from exc
@@ -593,8 +632,6 @@ def reboot_cmd(ctx: click.Context, container: str, *, fresh: bool) -> None:
     try:
         c.reboot(fresh=fresh)
     except Exception as exc:
-        from pocketdock.errors import PocketDockError  # noqa: PLC0415
-
         if isinstance(exc, PocketDockError):
             format_error(exc)
         raise SystemExit(1) from exc
@@ -612,7 +649,7 @@ def stop_cmd(ctx: click.Context, container: str) -> None:
     cli_ctx = _get_ctx(ctx)
     try:
         pocketdock.stop_container(container, socket_path=cli_ctx.socket)
-    except pocketdock.PocketDockError as exc:
+    except PocketDockError as exc:
         format_error(exc)
         raise SystemExit(1) from exc
     print_success(f"Container {container} stopped")
@@ -644,7 +681,7 @@ def shutdown_cmd(ctx: click.Context, container: str, *, yes: bool) -> None:
 
     try:
         pocketdock.destroy_container(container, socket_path=cli_ctx.socket)
-    except pocketdock.PocketDockError as exc:
+    except PocketDockError as exc:
         format_error(exc)
         raise SystemExit(1) from exc
     print_success(f"Container {container} shut down and removed")
@@ -661,8 +698,6 @@ def snapshot_cmd(ctx: click.Context, container: str, image_name: str) -> None:
     try:
         image_id = c.snapshot(image_name)
     except Exception as exc:
-        from pocketdock.errors import PocketDockError  # noqa: PLC0415
-
         if isinstance(exc, PocketDockError):
             format_error(exc)
         raise SystemExit(1) from exc
@@ -685,7 +720,7 @@ def prune_cmd(ctx: click.Context, *, yes: bool, project: str | None) -> None:
 
     try:
         count = pocketdock.prune(socket_path=cli_ctx.socket, project=project)
-    except pocketdock.PocketDockError as exc:
+    except PocketDockError as exc:
         format_error(exc)
         raise SystemExit(1) from exc
     print_success(f"Removed {count} container(s)")
@@ -704,27 +739,36 @@ def _detect_engine_cli(socket_path: str | None) -> str:
     return "docker"
 
 
+def _shell_script(bash: str = "/bin/bash", sh: str = "/bin/sh") -> str:
+    """Return a POSIX sh script that execs *bash* if it is executable, else *sh*.
+
+    Run inside the container, so a single interactive exec works on minimal
+    images without bash.
+    """
+    return f"if [ -x {bash} ]; then exec {bash}; fi; exec {sh}"
+
+
+_SHELL_SCRIPT = _shell_script()
+
+
 @click.command("shell")
 @click.argument("container")
 @click.pass_context
 def shell_cmd(ctx: click.Context, container: str) -> None:
     """Open an interactive shell inside a container."""
-    import subprocess  # noqa: PLC0415  # nosec B404
+    import os  # noqa: PLC0415
 
     cli_ctx = _get_ctx(ctx)
     c = _resolve_container(container, cli_ctx.socket)
     engine = _detect_engine_cli(cli_ctx.socket)
 
-    ret = subprocess.run(  # noqa: S603  # nosec B603
-        [engine, "exec", "-it", c.container_id, "/bin/bash"],
-        check=False,
+    # Replace this process with the engine CLI instead of waiting on it: the
+    # interpreter does not stay resident for the whole interactive session,
+    # and the shell's exit status reaches the caller directly.
+    os.execvp(  # noqa: S606  # nosec B606
+        engine,
+        [engine, "exec", "-it", c.container_id, "/bin/sh", "-c", _SHELL_SCRIPT],
     )
-    if ret.returncode == 126:  # noqa: PLR2004
-        ret = subprocess.run(  # noqa: S603  # nosec B603
-            [engine, "exec", "-it", c.container_id, "/bin/sh"],
-            check=False,
-        )
-    raise SystemExit(ret.returncode)
 
 
 # ---------------------------------------------------------------------------
@@ -732,6 +776,11 @@ def shell_cmd(ctx: click.Context, container: str) -> None:
 # ---------------------------------------------------------------------------
 
 
+# Upper bound on profile images built at once by ``build`` so the engine is
+# not asked to run every build in parallel.
+_BUILD_CONCURRENCY = 4
+
+
 def _build_tar_context(dockerfile_dir: Path) -> bytes:
     """Create a tar archive from a Dockerfile directory for the build API."""
     import io  # noqa: PLC0415
@@ -765,33 +814,61 @@ def build_cmd(ctx: click.Context, profiles: tuple[str, ...], *, build_all: bool)
 
     socket_path = cli_ctx.socket or sc.detect_socket()
     if socket_path is None:
-        from pocketdock.errors import PodmanNotRunning  # noqa: PLC0415
-
         err = PodmanNotRunning()
         format_error(err)
         raise SystemExit(1) from err
 
+    builds: list[tuple[str, bytes]] = []
     for name in names:
         try:
             info = resolve_profile(name)
         except ValueError as exc:
             click.echo(str(exc), err=True)
             raise SystemExit(1) from exc
+        builds.append((info.image_tag, _build_tar_context(get_dockerfile_path(name))))
+
+    for tag, _ in builds:
+        click.echo(f"Building {tag} ...")
+    results = asyncio.run(_build_images(socket_path, builds))
+
+    # Every build has run to completion; report each, then fail on the first error.
+    first_error: BaseException | None = None
+    for (tag, _), res in zip(builds, results, strict=True):
+        if res is None:
+            print_success(f"Built {tag}")
+            continue
+        if isinstance(res, PocketDockError):
+            format_error(res)
+        else:
+            click.echo(f"Build failed: {res}", err=True)
+        first_error = first_error or res
+    if first_error is not None:
+        raise SystemExit(1) from first_error
 
-        dockerfile_dir = get_dockerfile_path(name)
-        context = _build_tar_context(dockerfile_dir)
-        click.echo(f"Building {info.image_tag} ...")
-        try:
-            asyncio.run(sc.build_image(socket_path, context, info.image_tag))
-        except Exception as exc:
-            from pocketdock.errors import PocketDockError  # noqa: PLC0415
 
-            if isinstance(exc, PocketDockError):
-                format_error(exc)
-            else:
-                click.echo(f"Build failed: {exc}", err=True)
-            raise SystemExit(1) from exc
-        print_success(f"Built {info.image_tag}")
+async def _build_images(
+    socket_path: str,
+    builds: list[tuple[str, bytes]],
+) -> list[BaseException | None]:
+    """Build ``(tag, context)`` pairs concurrently; return each one's exception or None.
+
+    The profiles are independent of one another, so the engine can work on
+    several at once.  At most ``_BUILD_CONCURRENCY`` run at a time.
+    """
+    import asyncio  # noqa: PLC0415
+
+    from pocketdock import _socket_client as sc  # noqa: PLC0415
+
+    sem = asyncio.Semaphore(_BUILD_CONCURRENCY)
+
+    async def _build(tag: str, context: bytes) -> None:
+        async with sem:
+            await sc.build_image(socket_path, context, tag)
+
+    return await asyncio.gather(
+        *(_build(tag, context) for tag, context in builds),
+        return_exceptions=True,
+    )
 
 
 @click.command("export")
@@ -814,15 +891,12 @@ def export_cmd(
 ) -> None:
     """Export images to a tar file for air-gap transfer."""
     import asyncio  # noqa: PLC0415
-    import gzip  # noqa: PLC0415
 
     from pocketdock import _socket_client as sc  # noqa: PLC0415
 
     cli_ctx = _get_ctx(ctx)
     socket_path = cli_ctx.socket or sc.detect_socket()
     if socket_path is None:
-        from pocketdock.errors import PodmanNotRunning  # noqa: PLC0415
-
         err = PodmanNotRunning()
         format_error(err)
         raise SystemExit(1) from err
@@ -833,24 +907,37 @@ def export_cmd(
     for img_name in image_names:
         click.echo(f"Exporting {img_name} ...")
         try:
-            tar_data = asyncio.run(sc.save_image(socket_path, img_name))
+            asyncio.run(_save_image_file(socket_path, img_name, out_path))
         except Exception as exc:
-            from pocketdock.errors import PocketDockError  # noqa: PLC0415
-
             if isinstance(exc, PocketDockError):
                 format_error(exc)
             else:
                 click.echo(f"Export failed: {exc}", err=True)
             raise SystemExit(1) from exc
 
-        if str(out_path).endswith(".gz"):
-            out_path.write_bytes(gzip.compress(tar_data))
-        else:
-            out_path.write_bytes(tar_data)
-
     print_success(f"Exported to {output}")
 
 
+async def _save_image_file(socket_path: str, image_name: str, out_path: Path) -> None:
+    """Stream an exported image into *out_path*, gzip-compressing ``.gz`` targets.
+
+    Chunks are written as they arrive, so memory use does not grow with the
+    image size.  The archive goes to a ``.part`` sibling that is renamed into
+    place once complete, so a failed export never leaves a truncated file.
+    """
+    from pocketdock import _socket_client as sc  # noqa: PLC0415
+
+    part = out_path.with_name(out_path.name + ".part")
+    try:
+        with _open_image_archive(part, "wb", name=out_path.name) as f:
+            async for chunk in sc.save_image_stream(socket_path, image_name):
+                f.write(chunk)
+    except BaseException:
+        part.unlink(missing_ok=True)
+        raise
+    part.replace(out_path)
+
+
 def _resolve_export_images(
     *,
     image: str | None,
@@ -876,30 +963,20 @@ def _resolve_export_images(
 def import_cmd(ctx: click.Context, file: str) -> None:
     """Import images from a tar file."""
     import asyncio  # noqa: PLC0415
-    import gzip  # noqa: PLC0415
 
     from pocketdock import _socket_client as sc  # noqa: PLC0415
 
     cli_ctx = _get_ctx(ctx)
     socket_path = cli_ctx.socket or sc.detect_socket()
     if socket_path is None:
-        from pocketdock.errors import PodmanNotRunning  # noqa: PLC0415
-
         err = PodmanNotRunning()
         format_error(err)
         raise SystemExit(1) from err
 
-    file_path = Path(file)
-    raw = file_path.read_bytes()
-    if file.endswith(".gz"):
-        raw = gzip.decompress(raw)
-
     click.echo(f"Importing from {file} ...")
     try:
-        asyncio.run(sc.load_image(socket_path, raw))
+        asyncio.run(sc.load_image(socket_path, _iter_image_file(Path(file))))
     except Exception as exc:
-        from pocketdock.errors import PocketDockError  # noqa: PLC0415
-
         if isinstance(exc, PocketDockError):
             format_error(exc)
         else:
@@ -908,6 +985,38 @@ def import_cmd(ctx: click.Context, file: str) -> None:
     print_success(f"Imported from {file}")
 
 
+async def _iter_image_file(path: Path) -> AsyncIterator[bytes]:
+    """Yield an image archive in 64 KiB chunks, decompressing ``.gz`` files on the fly.
+
+    The engine receives the archive as it is read, so neither the file nor
+    its decompressed form is ever held in memory as a whole.
+    """
+    with _open_image_archive(path, "rb") as f:
+        while chunk := f.read(65536):
+            yield chunk
+
+
+def _open_image_archive(
+    path: Path,
+    mode: Literal["rb", "wb"],
+    *,
+    name: str = "",
+) -> BinaryIO | gzip.GzipFile:
+    """Open an image archive for export or import, picking the codec by file name.
+
+    *name* (default ``path.name``) decides the format, so a temporary file
+    can take the codec of its final name.  ``.gz`` archives go through gzip;
+    anything else is a plain tar.
+    """
+    import gzip  # noqa: PLC0415
+
+    if (name or path.name).endswith(".gz"):
+        # Level 6 (gzip's own default) instead of gzip.compress's 9: several
+        # times faster on multi-gigabyte archives for a slightly larger file.
+        return gzip.open(path, mode, compresslevel=6)
+    return path.open(mode)
+
+
 @click.command("profiles")
 @click.option("--json", "json_output", is_flag=True, help="Output as JSON.")
 def profiles_cmd(*, json_output: bool) -> None:
@@ -918,8 +1027,6 @@ def profiles_cmd(*, json_output: bool) -> None:
     if json_output:
         import dataclasses  # noqa: PLC0415
 
-        from pocketdock.cli._output import click_echo_json  # noqa: PLC0415
-
         click_echo_json([dataclasses.asdict(p) for p in all_profiles])
         return
 
@@ -5,63 +5,147 @@
 
 from __future__ import annotations
 
-import dataclasses
-import json
+import functools
 import sys
 from typing import TYPE_CHECKING
 
+from pocketdock._json import dumps
+from pocketdock.errors import (
+    ContainerNotFound,
+    ImageNotFound,
+    PocketDockError,
+    PodmanNotRunning,
+    ProjectNotInitialized,
+)
+
 if TYPE_CHECKING:
-    from pocketdock.errors import PocketDockError
+    from rich.console import Console
+
     from pocketdock.types import ContainerInfo, ContainerListItem, DoctorReport, ExecResult
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
-_console = Console()
-_err_console = Console(stderr=True)
+# Rich is imported on first use: scripts calling with --json never touch it,
+# and its import is a large share of CLI start-up.
+
+
+@functools.lru_cache(maxsize=1)
+def _get_console() -> Console:
+    """Return the shared stdout console, creating it on first use."""
+    from rich.console import Console  # noqa: PLC0415
+
+    return Console()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_err_console() -> Console:
+    """Return the shared stderr console, creating it on first use."""
+    from rich.console import Console  # noqa: PLC0415
+
+    return Console(stderr=True)
+
+
+# ``dataclasses.asdict`` walks the fields reflectively and deep-copies every
+# value; the JSON encoder only reads them, so these literals pass them as-is.
+
+
+def _list_item_dict(item: ContainerListItem) -> dict[str, object]:
+    """Return the JSON fields of a container list row."""
+    return {
+        "id": item.id,
+        "name": item.name,
+        "status": item.status,
+        "image": item.image,
+        "created_at": item.created_at,
+        "persist": item.persist,
+        "project": item.project,
+    }
+
+
+def _info_dict(info: ContainerInfo) -> dict[str, object]:
+    """Return the JSON fields of a container info snapshot."""
+    return {
+        "id": info.id,
+        "name": info.name,
+        "status": info.status,
+        "image": info.image,
+        "created_at": info.created_at,
+        "started_at": info.started_at,
+        "uptime": info.uptime,
+        "memory_usage": info.memory_usage,
+        "memory_limit": info.memory_limit,
+        "memory_percent": info.memory_percent,
+        "cpu_percent": info.cpu_percent,
+        "pids": info.pids,
+        "network": info.network,
+        "ip_address": info.ip_address,
+        "ports": info.ports,
+        "processes": info.processes,
+    }
+
+
+def _doctor_dict(report: DoctorReport) -> dict[str, object]:
+    """Return the JSON fields of a doctor report."""
+    return {
+        "orphaned_containers": report.orphaned_containers,
+        "stale_instance_dirs": report.stale_instance_dirs,
+        "healthy": report.healthy,
+    }
+
+
+_LIST_COLUMNS: tuple[tuple[str, str | None], ...] = (
+    ("Name", "cyan"),
+    ("ID", "dim"),
+    ("Status", None),
+    ("Image", None),
+    ("Persist", None),
+    ("Project", "dim"),
+)
+
+# Marked-up status cells for the states engines report; others are formatted per row.
+_STATUS_CELLS = {
+    "running": "[green]running[/green]",
+    **{state: f"[yellow]{state}[/yellow]" for state in ("created", "exited", "paused")},
+}
 
 
 def format_container_list(items: list[ContainerListItem], *, json_output: bool = False) -> None:
     """Print a list of containers as a rich table or JSON."""
     if json_output:
-        rows = [dataclasses.asdict(item) for item in items]
-        click_echo_json(rows)
+        click_echo_json([_list_item_dict(item) for item in items])
         return
 
+    from rich.table import Table  # noqa: PLC0415
+
     if not items:
-        _console.print("[dim]No containers found.[/dim]")
+        _get_console().print("[dim]No containers found.[/dim]")
         return
 
     table = Table(title="Containers")
-    table.add_column("Name", style="cyan")
-    table.add_column("ID", style="dim")
-    table.add_column("Status")
-    table.add_column("Image")
-    table.add_column("Persist")
-    table.add_column("Project", style="dim")
+    for header, style in _LIST_COLUMNS:
+        table.add_column(header, style=style)
 
     for item in items:
-        status_style = "green" if item.status == "running" else "yellow"
+        status = _STATUS_CELLS.get(item.status) or f"[yellow]{item.status}[/yellow]"
         table.add_row(
             item.name,
             item.id,
-            f"[{status_style}]{item.status}[/{status_style}]",
+            status,
             item.image,
             "yes" if item.persist else "no",
             item.project,
         )
 
-    _console.print(table)
+    _get_console().print(table)
 
 
 def format_container_info(info: ContainerInfo, *, json_output: bool = False) -> None:
     """Print container info as a rich panel or JSON."""
     if json_output:
-        d = dataclasses.asdict(info)
-        click_echo_json(d)
+        click_echo_json(_info_dict(info))
         return
 
+    from rich.panel import Panel  # noqa: PLC0415
+
     status_style = "green" if info.status == "running" else "yellow"
     lines = [
         f"[bold]ID:[/bold]       {info.id[:12]}",
@@ -82,7 +166,7 @@ def format_container_info(info: ContainerInfo, *, json_output: bool = False) ->
         lines.append(f"[bold]Ports:[/bold]    {', '.join(port_strs)}")
 
     panel = Panel("\n".join(lines), title=f"[cyan]{info.name}[/cyan]", expand=False)
-    _console.print(panel)
+    _get_console().print(panel)
 
 
 def format_exec_result(result: ExecResult) -> None:
@@ -100,9 +184,11 @@ def format_exec_result(result: ExecResult) -> None:
 def format_doctor_report(report: DoctorReport, *, json_output: bool = False) -> None:
     """Print doctor report as a rich panel or JSON."""
     if json_output:
-        click_echo_json(dataclasses.asdict(report))
+        click_echo_json(_doctor_dict(report))
         return
 
+    from rich.panel import Panel  # noqa: PLC0415
+
     lines: list[str] = []
     if report.healthy:
         lines.append(f"[green]Healthy:[/green] {report.healthy} container(s)")
@@ -118,11 +204,13 @@ def format_doctor_report(report: DoctorReport, *, json_output: bool = False) ->
         lines.append("[dim]Nothing to report.[/dim]")
 
     panel = Panel("\n".join(lines), title="Doctor Report", expand=False)
-    _console.print(panel)
+    _get_console().print(panel)
 
 
 def format_error(err: PocketDockError) -> None:
     """Print an SDK error as a rich panel with suggestions."""
+    from rich.panel import Panel  # noqa: PLC0415
+
     title, suggestion = _error_info(err)
     lines = [str(err)]
     if suggestion:
@@ -133,39 +221,47 @@ def format_error(err: PocketDockError) -> None:
         title=f"[red]{title}[/red]",
         expand=False,
     )
-    _err_console.print(panel)
+    _get_err_console().print(panel)
+
+
+# Title and suggestion per SDK error class; subclasses inherit their parent's entry.
+_ERROR_INFO: dict[type[PocketDockError], tuple[str, str]] = {
+    PodmanNotRunning: ("Engine Not Found", "Start Podman or Docker and try again."),
+    ContainerNotFound: (
+        "Container Not Found",
+        "Run 'pocketdock list' to see available containers.",
+    ),
+    ImageNotFound: ("Image Not Found", "Pull the image first: docker pull <image>"),
+    ProjectNotInitialized: (
+        "Project Not Initialized",
+        "Run 'pocketdock init' to create a project.",
+    ),
+}
 
 
 def _error_info(err: PocketDockError) -> tuple[str, str]:
     """Map an SDK error to a title and suggestion string."""
-    from pocketdock.errors import (  # noqa: PLC0415
-        ContainerNotFound,
-        ImageNotFound,
-        PodmanNotRunning,
-        ProjectNotInitialized,
-    )
-
-    if isinstance(err, PodmanNotRunning):
-        return "Engine Not Found", "Start Podman or Docker and try again."
-    if isinstance(err, ContainerNotFound):
-        return "Container Not Found", "Run 'pocketdock list' to see available containers."
-    if isinstance(err, ImageNotFound):
-        return "Image Not Found", "Pull the image first: docker pull <image>"
-    if isinstance(err, ProjectNotInitialized):
-        return "Project Not Initialized", "Run 'pocketdock init' to create a project."
+    for cls in type(err).__mro__:
+        info = _ERROR_INFO.get(cls)
+        if info is not None:
+            return info
     return "Error", ""
 
 
 def print_success(msg: str) -> None:
     """Print a success message with a checkmark."""
-    _console.print(f"[green]\u2713[/green] {msg}")
+    _get_console().print(f"[green]\u2713[/green] {msg}")
 
 
 def confirm_destructive(msg: str) -> bool:
     """Prompt for confirmation. Returns True if confirmed."""
-    return _console.input(f"[yellow]{msg} [y/N]:[/yellow] ").strip().lower() == "y"
+    return _get_console().input(f"[yellow]{msg} [y/N]:[/yellow] ").strip().lower() == "y"
 
 
 def click_echo_json(data: object) -> None:
-    """Serialize data to JSON and echo to stdout."""
-    sys.stdout.write(json.dumps(data, indent=2, default=str) + "\n")
+    """Serialize data to JSON and echo to stdout.
+
+    Output is indented for a terminal and compact when piped, where a
+    script rather than a person is reading it.
+    """
+    sys.stdout.write(dumps(data, indent=sys.stdout.isatty()).decode() + "\n")
@@ -5,16 +5,28 @@
 
 from __future__ import annotations
 
+import asyncio
 import shutil
 from pathlib import Path
 from typing import Any
 
 from pocketdock import _socket_client as sc
 from pocketdock._async_container import AsyncContainer
-from pocketdock._helpers import parse_port_bindings
 from pocketdock.errors import ContainerNotFound, PodmanNotRunning
 from pocketdock.types import ContainerListItem
 
+# Upper bound on concurrent removals in prune() so a large backlog of
+# stopped containers does not flood the engine socket.
+_PRUNE_CONCURRENCY = 8
+
+# Keys read from the engine's container list; everything else is dropped.
+_LIST_FIELDS = ("Id", "Labels", "Names", "State", "Image")
+
+# Case variants accepted for the engine's State and our persist label, checked
+# by membership so list parsing does not allocate a lowered copy per container.
+_RUNNING_STATES = frozenset({"running", "Running", "RUNNING"})
+_TRUE_LABELS = frozenset({"true", "True", "TRUE"})
+
 
 async def resume_container(
     name: str,
@@ -49,35 +61,23 @@ async def resume_container(
     container_data = containers[0]
     container_id: str = container_data["Id"]
 
-    state = container_data.get("State", "").lower()
-    if state != "running":
+    if container_data.get("State") not in _RUNNING_STATES:
         await sc.start_container(socket_path, container_id)
 
-    inspect_data = await sc.inspect_container(socket_path, container_id)
-    config = inspect_data.get("Config", {})
-    labels = config.get("Labels", {})
-    image = config.get("Image", "")
-    host_config = inspect_data.get("HostConfig", {})
-
-    mem_limit_bytes = int(host_config.get("Memory", 0))
-    nano_cpus = int(host_config.get("NanoCpus", 0))
-    persist = labels.get("pocketdock.persist", "false").lower() == "true"
-    project = labels.get("pocketdock.project", "")
-    data_path = labels.get("pocketdock.data-path", "")
-    ports = parse_port_bindings(inspect_data)
-
+    # The list entry already carries the labels and image.  Resource limits
+    # and port bindings only matter for a fresh reboot, so the container
+    # inspects itself lazily if one is requested.
+    labels = container_data.get("Labels") or {}
     return AsyncContainer(
         container_id,
         socket_path,
         name=name,
-        image=image,
+        image=container_data.get("Image", ""),
         timeout=timeout,
-        mem_limit_bytes=mem_limit_bytes,
-        nano_cpus=nano_cpus,
-        persist=persist,
-        project=project,
-        data_path=data_path,
-        ports=ports or None,
+        persist=labels.get("pocketdock.persist") in _TRUE_LABELS,
+        project=labels.get("pocketdock.project", ""),
+        data_path=labels.get("pocketdock.data-path", ""),
+        lazy_config=True,
     )
 
 
@@ -100,12 +100,13 @@ async def list_containers(
 
     """
     socket_path = _resolve_socket(socket_path)
-    label_filter = "pocketdock.managed=true"
-    if project is not None:
-        label_filter = f"pocketdock.project={project}"
+    # The engine applies the label filter before serializing, so foreign
+    # containers on a shared host never reach json.loads here.
+    label_filter = _label_filter(project)
     raw = await sc.list_containers(
         socket_path,
         label_filter=label_filter,
+        fields=_LIST_FIELDS,
     )
     return [_parse_container_list_item(c) for c in raw]
 
@@ -138,9 +139,9 @@ async def destroy_container(
     container_data = containers[0]
     container_id: str = container_data["Id"]
 
-    # Check for data-path label to clean up instance directory
-    inspect_data = await sc.inspect_container(socket_path, container_id)
-    labels = inspect_data.get("Config", {}).get("Labels", {}) or {}
+    # The list response already carries the labels, so the data-path label
+    # for the instance directory cleanup needs no separate inspect call.
+    labels = container_data.get("Labels") or {}
     data_path = labels.get("pocketdock.data-path", "")
 
     await sc.remove_container(socket_path, container_id, force=True)
@@ -171,20 +172,29 @@ async def prune(
     """
     socket_path = _resolve_socket(socket_path)
 
-    label_filter = "pocketdock.managed=true"
-    if project is not None:
-        label_filter = f"pocketdock.project={project}"
+    label_filter = _label_filter(project)
     raw = await sc.list_containers(
         socket_path,
         label_filter=label_filter,
+        fields=("Id", "State"),
     )
-    count = 0
-    for container in raw:
-        state = container.get("State", "").lower()
-        if state != "running":
-            await sc.remove_container(socket_path, container["Id"], force=True)
-            count += 1
-    return count
+    victims = [c["Id"] for c in raw if c.get("State") not in _RUNNING_STATES]
+    if not victims:
+        return 0
+
+    sem = asyncio.Semaphore(_PRUNE_CONCURRENCY)
+
+    async def _remove(container_id: str) -> None:
+        async with sem:
+            await sc.remove_container(socket_path, container_id, force=True)
+
+    results = await asyncio.gather(*(_remove(cid) for cid in victims), return_exceptions=True)
+    # A container removed by someone else in the meantime is not an error;
+    # anything else is re-raised once every removal has had its chance.
+    for res in results:
+        if isinstance(res, BaseException) and not isinstance(res, ContainerNotFound):
+            raise res
+    return sum(1 for res in results if res is None)
 
 
 async def stop_container(
@@ -225,12 +235,20 @@ def _resolve_socket(socket_path: str | None) -> str:
     """Return a validated socket path, auto-detecting if necessary."""
     if socket_path is not None:
         return socket_path
-    detected = sc.detect_socket()
+    detected = sc.detect_socket_cached()
     if detected is None:
         raise PodmanNotRunning
     return detected
 
 
+def _label_filter(project: str | None) -> list[str]:
+    """Return the engine label filter for managed containers, optionally per project."""
+    labels = ["pocketdock.managed=true"]
+    if project is not None:
+        labels.append(f"pocketdock.project={project}")
+    return labels
+
+
 def _parse_container_list_item(data: dict[str, Any]) -> ContainerListItem:
     """Parse a raw container JSON object into a ContainerListItem."""
     labels = data.get("Labels") or {}
@@ -247,6 +265,6 @@ def _parse_container_list_item(data: dict[str, Any]) -> ContainerListItem:
         status=data.get("State", "unknown"),
         image=data.get("Image", ""),
         created_at=labels.get("pocketdock.created-at", ""),
-        persist=labels.get("pocketdock.persist", "false").lower() == "true",
+        persist=labels.get("pocketdock.persist") in _TRUE_LABELS,
         project=labels.get("pocketdock.project", ""),
     )
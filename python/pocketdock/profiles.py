@@ -77,6 +77,11 @@ PROFILES: dict[str, ProfileInfo] = {
     ),
 }
 
+_KNOWN_PROFILES = ", ".join(sorted(PROFILES))
+
+# _images/ lives next to this file inside the installed package.
+_PACKAGE_DIR = pathlib.Path(__file__).resolve().parent
+
 
 def resolve_profile(name: str) -> ProfileInfo:
     """Look up a profile by name.
@@ -95,8 +100,7 @@ def resolve_profile(name: str) -> ProfileInfo:
     try:
         return PROFILES[name]
     except KeyError:
-        known = ", ".join(sorted(PROFILES))
-        msg = f"Unknown profile {name!r}. Known profiles: {known}"
+        msg = f"Unknown profile {name!r}. Known profiles: {_KNOWN_PROFILES}"
         raise ValueError(msg) from None
 
 
@@ -122,7 +126,4 @@ def get_dockerfile_path(name: str) -> pathlib.Path:
         ValueError: If *name* is not a known profile.
 
     """
-    info = resolve_profile(name)
-    # _images/ lives next to this file inside the installed package.
-    package_dir = pathlib.Path(__file__).resolve().parent
-    return package_dir / info.dockerfile_dir
+    return _PACKAGE_DIR / resolve_profile(name).dockerfile_dir
@@ -5,19 +5,38 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
+import re
 import shutil
 import sys
 from pathlib import Path
-from typing import Any
-
-import yaml
+from typing import TYPE_CHECKING, Any
 
 from pocketdock.types import DoctorReport
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+try:
+    import tomllib  # type: ignore[import-not-found]
+except ModuleNotFoundError:
+    import tomli as tomllib
+
 _CONFIG_FILENAME = "pocketdock.yaml"
 _INSTANCES_DIR = "instances"
 
+# Top-level ``project_name: value`` line as written by init_project().  Plain
+# scalars are restricted to ones YAML always resolves to a string; anything
+# else (comments, escapes, flow/block values) falls through to PyYAML.
+_PROJECT_NAME_RE = re.compile(
+    r"""^project_name:[ \t]*(?:"([^"\\]*)"|'([^']*)'|([A-Za-z_][\w.-]*))[ \t]*$""",
+    re.MULTILINE,
+)
+_YAML_NON_STR_WORDS = frozenset(
+    {"true", "false", "yes", "no", "on", "off", "null"},
+)
+
 _DEFAULT_YAML_TEMPLATE = """\
 # Project configuration for pocketdock
 project_name: {project_name}
@@ -60,7 +79,7 @@ def init_project(path: Path | None = None, *, project_name: str | None = None) -
     name = project_name or root.name
     config_path = pd_dir / _CONFIG_FILENAME
     if not config_path.exists():
-        config_path.write_text(_DEFAULT_YAML_TEMPLATE.format(project_name=name))
+        config_path.write_bytes(_DEFAULT_YAML_TEMPLATE.format(project_name=name).encode())
 
     # Ensure instances dir exists
     (pd_dir / _INSTANCES_DIR).mkdir(exist_ok=True)
@@ -72,8 +91,17 @@ def get_project_name(project_root: Path) -> str:
     """Parse ``pocketdock.yaml`` for ``project_name``, fallback to dir name."""
     config_path = project_root / ".pocketdock" / _CONFIG_FILENAME
     if config_path.is_file():
+        text = config_path.read_text()
+        matches = _PROJECT_NAME_RE.findall(text)
+        if len(matches) == 1:
+            double, single, plain = matches[0]
+            if plain.lower() not in _YAML_NON_STR_WORDS:
+                return double or single or plain or project_root.name
+
+        import yaml  # noqa: PLC0415
+
         try:
-            data = yaml.safe_load(config_path.read_text())
+            data = yaml.safe_load(text)
             if isinstance(data, dict):
                 name = data.get("project_name")
                 if isinstance(name, str) and name:
@@ -89,8 +117,8 @@ def ensure_instance_dir(project_root: Path, instance_name: str) -> Path:
     Returns the instance directory path.
     """
     instance_dir = project_root / ".pocketdock" / _INSTANCES_DIR / instance_name
-    instance_dir.mkdir(parents=True, exist_ok=True)
-    (instance_dir / "logs").mkdir(exist_ok=True)
+    # Creating logs/ with parents=True brings instance_dir along with it.
+    (instance_dir / "logs").mkdir(parents=True, exist_ok=True)
     (instance_dir / "data").mkdir(exist_ok=True)
     return instance_dir
 
@@ -154,7 +182,7 @@ def write_instance_metadata(  # noqa: PLR0913
     ]
     _emit_section(lines, "provenance", provenance_pairs)
 
-    (instance_dir / "instance.toml").write_text("\n".join(lines))
+    (instance_dir / "instance.toml").write_bytes("\n".join(lines).encode())
 
 
 def read_instance_metadata(instance_dir: Path) -> dict[str, Any]:
@@ -163,12 +191,8 @@ def read_instance_metadata(instance_dir: Path) -> dict[str, Any]:
     if not toml_path.is_file():
         return {}
 
-    try:
-        import tomllib  # type: ignore[import-not-found]  # noqa: PLC0415
-    except ModuleNotFoundError:
-        import tomli as tomllib  # noqa: PLC0415
-
-    result: dict[str, Any] = tomllib.loads(toml_path.read_text())
+    with toml_path.open("rb") as f:
+        result: dict[str, Any] = tomllib.load(f)
     return result
 
 
@@ -186,7 +210,10 @@ def list_instance_dirs(project_root: Path) -> list[Path]:
     instances_dir = project_root / ".pocketdock" / _INSTANCES_DIR
     if not instances_dir.is_dir():
         return []
-    return sorted(p for p in instances_dir.iterdir() if p.is_dir())
+    # DirEntry.is_dir() answers from the directory read itself (d_type), so
+    # only symlinked entries cost an extra stat.
+    with os.scandir(instances_dir) as it:
+        return sorted(Path(e.path) for e in it if e.is_dir())
 
 
 async def doctor(
@@ -221,16 +248,20 @@ async def doctor(
 
     project_name = get_project_name(project_root)
 
-    # Local instance directory names
-    local_dirs = {p.name for p in list_instance_dirs(project_root)}
-
-    # Engine containers for this project
-    items = await list_containers(socket_path=socket_path, project=project_name)
+    # The directory scan and the engine query are independent; run the
+    # blocking scan in a worker thread while the socket call is in flight.
+    instance_dirs, items = await asyncio.gather(
+        asyncio.to_thread(list_instance_dirs, project_root),
+        list_containers(socket_path=socket_path, project=project_name),
+    )
+    local_dirs = {p.name for p in instance_dirs}
     container_names = {item.name for item in items}
 
     orphaned = tuple(sorted(container_names - local_dirs))
     stale = tuple(sorted(local_dirs - container_names))
-    healthy = len(local_dirs & container_names)
+    # Every local dir is either stale or has a container, so the overlap
+    # size falls out of the stale count without a third set operation.
+    healthy = len(local_dirs) - len(stale)
 
     return DoctorReport(
         orphaned_containers=orphaned,
@@ -247,17 +278,24 @@ async def doctor(
 def _emit_section(lines: list[str], name: str, pairs: list[tuple[str, object]]) -> None:
     """Append a TOML section to *lines*."""
     lines.append(f"[{name}]")
-    for k, v in pairs:
-        lines.append(f"{k} = {_toml_value(v)}")
+    lines.extend([f"{k} = {_toml_value(v)}" for k, v in pairs])
     lines.append("")
 
 
+# Exact-type formatters for the values write_instance_metadata() emits.
+_TOML_FORMATTERS: dict[type, Callable[[Any], str]] = {
+    bool: lambda v: "true" if v else "false",
+    int: str,
+    str: lambda v: f'"{v}"',
+}
+
+
 def _toml_value(v: object) -> str:
     """Format a Python value as a TOML literal."""
-    if isinstance(v, bool):
-        return "true" if v else "false"
+    fmt = _TOML_FORMATTERS.get(type(v))
+    if fmt is not None:
+        return fmt(v)
+    # bool cannot be subclassed, so only int subclasses (IntEnum) land here.
     if isinstance(v, int):
         return str(v)
-    if isinstance(v, str):
-        return f'"{v}"'
     return f'"{v}"'
@@ -10,7 +10,7 @@ if TYPE_CHECKING:
     import datetime
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class ContainerInfo:
     """Live snapshot of a container's state and resource usage."""
 
@@ -32,7 +32,7 @@ class ContainerInfo:
     processes: tuple[dict[str, str], ...] = ()
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class ExecResult:
     """Result of executing a command inside a container."""
 
@@ -57,7 +57,7 @@ class StreamChunk:
     data: str
 
 
-@dataclasses.dataclass(frozen=True)
+@dataclasses.dataclass(frozen=True, slots=True)
 class ContainerListItem:
     """Summary information for a pocketdock managed container."""
 
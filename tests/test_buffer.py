@@ -92,6 +92,39 @@ def test_ring_buffer_peek_does_not_drain() -> None:
     assert buf.size == 4
 
 
+def test_ring_buffer_peek_reuses_snapshot_until_write() -> None:
+    buf = RingBuffer()
+    buf.write(STREAM_STDOUT, b"data")
+    snap1 = buf.peek()
+    assert buf.peek() is snap1
+    buf.write(STREAM_STDOUT, b"more")
+    snap2 = buf.peek()
+    assert snap2 is not snap1
+    assert snap2.stdout == "datamore"
+    buf.read()
+    assert buf.peek().stdout == ""
+    assert buf.read().stdout == ""
+
+
+def test_ring_buffer_peek_not_cached_if_written_during_decode() -> None:
+    from unittest.mock import patch
+
+    from pocketdock import _buffer
+
+    buf = RingBuffer()
+    buf.write(STREAM_STDOUT, b"a")
+    real_decode = _buffer._decode
+
+    def _decode_then_write(out: bytes, err: bytes) -> BufferSnapshot:
+        snap = real_decode(out, err)
+        buf.write(STREAM_STDOUT, b"b")
+        return snap
+
+    with patch("pocketdock._buffer._decode", side_effect=_decode_then_write):
+        assert buf.peek().stdout == "a"
+    assert buf.peek().stdout == "ab"
+
+
 # --- overflow ---
 
 
@@ -137,6 +170,35 @@ def test_ring_buffer_multiple_writes_overflow() -> None:
     assert snap.stdout == "defgh"
 
 
+def test_ring_buffer_wraps_in_place() -> None:
+    buf = RingBuffer(capacity=12)  # 6 per stream
+    buf.write(STREAM_STDOUT, b"abcdef")  # exactly full
+    buf.write(STREAM_STDOUT, b"gh")  # overwrite oldest two
+    assert buf.peek().stdout == "cdefgh"
+    buf.write(STREAM_STDOUT, b"ijklm")  # wraps past the end of storage
+    assert buf.peek().stdout == "hijklm"
+    buf.write(STREAM_STDOUT, b"0123456789")  # larger than the stream half
+    assert buf.peek().stdout == "456789"
+
+
+def test_ring_buffer_matches_naive_model() -> None:
+    import random
+
+    rng = random.Random(1234)  # noqa: S311
+    buf = RingBuffer(capacity=64)  # 32 per stream
+    model = bytearray()
+    for _ in range(500):
+        chunk = bytes(rng.randrange(97, 123) for _ in range(rng.randrange(0, 40)))
+        buf.write(STREAM_STDOUT, chunk)
+        model += chunk
+        del model[: max(len(model) - 32, 0)]
+        assert buf.size == len(model)
+        if rng.random() < 0.1:
+            assert buf.read().stdout == model.decode()
+            model.clear()
+    assert buf.peek().stdout == model.decode()
+
+
 # --- capacity edge cases ---
 
 
@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
+import dataclasses
 import json
+import sys
 from io import StringIO
 from unittest.mock import patch
 
 from pocketdock.cli._output import (
+    _doctor_dict,
+    _error_info,
+    _get_console,
+    _get_err_console,
+    _info_dict,
+    _list_item_dict,
     click_echo_json,
     confirm_destructive,
     format_container_info,
@@ -79,6 +87,32 @@ def test_format_container_list_table() -> None:
     format_container_list(items, json_output=False)
 
 
+def test_format_container_list_status_cells() -> None:
+    items = [
+        ContainerListItem(
+            id=str(i), name=f"c{i}", status=status, image="alpine", created_at="", persist=False
+        )
+        for i, status in enumerate(("running", "exited", "restarting"))
+    ]
+    with patch("pocketdock.cli._output._get_console") as mock_get:
+        format_container_list(items, json_output=False)
+    table = mock_get.return_value.print.call_args.args[0]
+    assert [c.header for c in table.columns] == [
+        "Name",
+        "ID",
+        "Status",
+        "Image",
+        "Persist",
+        "Project",
+    ]
+    assert table.columns[0].style == "cyan"
+    assert list(table.columns[2].cells) == [
+        "[green]running[/green]",
+        "[yellow]exited[/yellow]",
+        "[yellow]restarting[/yellow]",
+    ]
+
+
 # --- format_container_info ---
 
 
@@ -197,6 +231,26 @@ def test_format_doctor_report_json() -> None:
     assert "orphan-1" in data["orphaned_containers"]
 
 
+def test_json_dicts_match_asdict() -> None:
+    """The hand-written field dicts stay in step with the dataclass fields."""
+    item = ContainerListItem(
+        id="abc123",
+        name="pd-1",
+        status="running",
+        image="alpine",
+        created_at="2024-01-01T00:00:00Z",
+        persist=True,
+        project="proj",
+    )
+    info = dataclasses.replace(
+        _make_info(), ports={8080: 80}, processes=({"PID": "1", "CMD": "sh"},)
+    )
+    report = DoctorReport(orphaned_containers=("a",), stale_instance_dirs=("b",), healthy=1)
+    assert _list_item_dict(item) == dataclasses.asdict(item)
+    assert _info_dict(info) == dataclasses.asdict(info)
+    assert _doctor_dict(report) == dataclasses.asdict(report)
+
+
 def test_format_doctor_report_panel_healthy() -> None:
     report = DoctorReport(orphaned_containers=(), stale_instance_dirs=(), healthy=3)
     format_doctor_report(report, json_output=False)
@@ -244,6 +298,15 @@ def test_format_error_generic() -> None:
     format_error(err)
 
 
+def test_error_info_lookup() -> None:
+    class GoneAgain(ContainerNotFound):
+        pass
+
+    assert _error_info(ImageNotFound("x"))[0] == "Image Not Found"
+    assert _error_info(GoneAgain("c"))[0] == "Container Not Found"
+    assert _error_info(SocketCommunicationError("boom")) == ("Error", "")
+
+
 # --- print_success ---
 
 
@@ -255,25 +318,34 @@ def test_print_success() -> None:
 
 
 def test_confirm_destructive_yes() -> None:
-    with patch.object(
-        __import__("pocketdock.cli._output", fromlist=["_console"]),
-        "_console",
-    ) as mock_console:
-        mock_console.input.return_value = "y"
+    with patch("pocketdock.cli._output._get_console") as mock_get:
+        mock_get.return_value.input.return_value = "y"
         result = confirm_destructive("Are you sure?")
     assert result is True
 
 
 def test_confirm_destructive_no() -> None:
-    with patch.object(
-        __import__("pocketdock.cli._output", fromlist=["_console"]),
-        "_console",
-    ) as mock_console:
-        mock_console.input.return_value = "n"
+    with patch("pocketdock.cli._output._get_console") as mock_get:
+        mock_get.return_value.input.return_value = "n"
         result = confirm_destructive("Are you sure?")
     assert result is False
 
 
+def test_json_output_does_not_import_rich() -> None:
+    blocked = dict.fromkeys(("rich", "rich.console", "rich.panel", "rich.table"))
+    report = DoctorReport(orphaned_containers=(), stale_instance_dirs=(), healthy=0)
+    with patch.dict(sys.modules, blocked), patch("sys.stdout", new_callable=StringIO):
+        format_container_list([], json_output=True)
+        format_container_info(_make_info(), json_output=True)
+        format_doctor_report(report, json_output=True)
+
+
+def test_consoles_are_created_once() -> None:
+    assert _get_console() is _get_console()
+    assert _get_err_console() is _get_err_console()
+    assert _get_err_console().stderr
+
+
 # --- click_echo_json ---
 
 
@@ -282,3 +354,17 @@ def test_click_echo_json() -> None:
         click_echo_json({"key": "value"})
         data = json.loads(mock_stdout.getvalue())
     assert data["key"] == "value"
+
+
+def test_click_echo_json_pretty_on_terminal() -> None:
+    out = StringIO()
+    out.isatty = lambda: True  # type: ignore[method-assign]
+    with patch("sys.stdout", out):
+        click_echo_json({"key": [1, 2]})
+    assert out.getvalue() == json.dumps({"key": [1, 2]}, indent=2) + "\n"
+
+
+def test_click_echo_json_compact_when_piped() -> None:
+    with patch("sys.stdout", new_callable=StringIO) as mock_stdout:
+        click_echo_json({"key": [1, 2], 8080: 80})
+    assert mock_stdout.getvalue() == '{"key":[1,2],"8080":80}\n'
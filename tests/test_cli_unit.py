@@ -4,14 +4,21 @@ from __future__ import annotations
 
 import datetime
 import json
+import shutil
+import subprocess
 from pathlib import Path
+from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import pytest
 from click.testing import CliRunner
 from pocketdock.cli.main import CliContext, cli
 from pocketdock.errors import ContainerNotFound, PodmanNotRunning, ProjectNotInitialized
 from pocketdock.types import ContainerInfo, ContainerListItem, DoctorReport
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
 # --- Scaffold tests ---
 
 
@@ -564,6 +571,26 @@ def test_logs_invalid_json_skipped(
     assert data == []
 
 
+@patch("pocketdock.projects.list_instance_dirs")
+@patch("pocketdock.find_project_root")
+def test_logs_crlf_and_invalid_utf8(
+    mock_root: MagicMock, mock_dirs: MagicMock, tmp_path: Path
+) -> None:
+    mock_root.return_value = tmp_path
+    inst = tmp_path / ".pocketdock" / "instances" / "inst1"
+    logs_dir = inst / "logs"
+    logs_dir.mkdir(parents=True)
+    (logs_dir / "history.jsonl").write_bytes(
+        b'{"type": "run", "command": "a"}\r\n  \r\n"\xff"\n{"type": "run", "command": "b"}'
+    )
+    mock_dirs.return_value = [inst]
+    runner = CliRunner()
+    result = runner.invoke(cli, ["logs", "--json"])
+    assert result.exit_code == 0
+    data = json.loads(result.output)
+    assert [e["command"] for e in data] == ["a", "b"]
+
+
 @patch("pocketdock.projects.list_instance_dirs")
 @patch("pocketdock.find_project_root")
 def test_logs_table_with_error_exit(
@@ -616,6 +643,90 @@ def test_logs_no_history_file(mock_root: MagicMock, mock_dirs: MagicMock, tmp_pa
     assert data == []
 
 
+@patch("pocketdock.projects.list_instance_dirs")
+@patch("pocketdock.find_project_root")
+def test_logs_type_filter_needs_decode(
+    mock_root: MagicMock, mock_dirs: MagicMock, tmp_path: Path
+) -> None:
+    # A type json.dumps escapes cannot be pre-filtered on the raw bytes.
+    mock_root.return_value = tmp_path
+    inst = tmp_path / ".pocketdock" / "instances" / "inst1"
+    logs_dir = inst / "logs"
+    logs_dir.mkdir(parents=True)
+    lines = [
+        json.dumps({"type": 'we"ird', "command": "a"}),
+        json.dumps({"type": "run", "command": 'we"ird'}),
+        json.dumps({"type": "caf\u00e9", "command": "b"}),
+    ]
+    (logs_dir / "history.jsonl").write_text("\n".join(lines) + "\n")
+    mock_dirs.return_value = [inst]
+    runner = CliRunner()
+    result = runner.invoke(cli, ["logs", "--json", "--type", 'we"ird'])
+    assert [e["command"] for e in json.loads(result.output)] == ["a"]
+    result = runner.invoke(cli, ["logs", "--json", "--type", "caf\u00e9"])
+    assert [e["command"] for e in json.loads(result.output)] == ["b"]
+
+
+@patch("pocketdock.projects.list_instance_dirs")
+@patch("pocketdock.find_project_root")
+def test_logs_last_zero_shows_all(
+    mock_root: MagicMock, mock_dirs: MagicMock, tmp_path: Path
+) -> None:
+    mock_root.return_value = tmp_path
+    inst = tmp_path / ".pocketdock" / "instances" / "inst1"
+    logs_dir = inst / "logs"
+    logs_dir.mkdir(parents=True)
+    lines = [json.dumps({"type": "run", "command": f"cmd{i}"}) for i in range(3)]
+    (logs_dir / "history.jsonl").write_text("\n".join(lines) + "\n")
+    mock_dirs.return_value = [inst]
+    runner = CliRunner()
+    result = runner.invoke(cli, ["logs", "--json", "--last", "0"])
+    assert [e["command"] for e in json.loads(result.output)] == ["cmd0", "cmd1", "cmd2"]
+
+
+@patch("pocketdock.projects.list_instance_dirs")
+@patch("pocketdock.find_project_root")
+def test_logs_history_path_is_directory(
+    mock_root: MagicMock, mock_dirs: MagicMock, tmp_path: Path
+) -> None:
+    mock_root.return_value = tmp_path
+    inst = tmp_path / ".pocketdock" / "instances" / "inst1"
+    (inst / "logs" / "history.jsonl").mkdir(parents=True)
+    mock_dirs.return_value = [inst]
+    runner = CliRunner()
+    result = runner.invoke(cli, ["logs", "--json"])
+    assert result.exit_code == 0
+    assert json.loads(result.output) == []
+
+
+@patch("pocketdock.projects.list_instance_dirs")
+@patch("pocketdock.find_project_root")
+def test_logs_long_listing_is_plain_text(
+    mock_root: MagicMock, mock_dirs: MagicMock, tmp_path: Path
+) -> None:
+    from pocketdock.cli import _commands
+
+    mock_root.return_value = tmp_path
+    inst = tmp_path / ".pocketdock" / "instances" / "inst1"
+    logs_dir = inst / "logs"
+    logs_dir.mkdir(parents=True)
+    count = _commands._RICH_LOG_ROWS + 1
+    lines = [
+        json.dumps({"type": "run", "command": f"cmd{i}", "exit_code": 0, "duration_ms": 5.0})
+        for i in range(count)
+    ]
+    (logs_dir / "history.jsonl").write_text("\n".join(lines) + "\n")
+    mock_dirs.return_value = [inst]
+    runner = CliRunner()
+    result = runner.invoke(cli, ["logs", "--last", str(count)])
+    assert result.exit_code == 0
+    out = result.output.splitlines()
+    assert len(out) == count + 1
+    assert out[0].split() == ["Instance", "Type", "Command", "Exit", "Duration", "Timestamp"]
+    assert out[1].split() == ["inst1", "run", "cmd0", "0", "5ms"]
+    assert out[-1].index("cmd200") == out[0].index("Command")
+
+
 def test_logs_help() -> None:
     runner = CliRunner()
     result = runner.invoke(cli, ["logs", "--help"])
@@ -710,21 +821,21 @@ def test_create_volume_invalid_format(mock_create: MagicMock) -> None:
 
 
 @patch("pocketdock.create_new_container")
-def test_create_restores_existing_env(mock_create: MagicMock) -> None:
+def test_create_passes_socket_and_leaves_env_untouched(mock_create: MagicMock) -> None:
     import os
 
     container = MagicMock()
     container.name = "test"
     container.container_id = "abc123def456"
     mock_create.return_value = container
-    os.environ["POCKETDOCK_SOCKET"] = "/original/socket"
-    try:
-        runner = CliRunner()
-        result = runner.invoke(cli, ["--socket", "/tmp/test.sock", "create"])
-        assert result.exit_code == 0
-        assert os.environ.get("POCKETDOCK_SOCKET") == "/original/socket"
-    finally:
-        os.environ.pop("POCKETDOCK_SOCKET", None)
+    before = dict(os.environ)
+
+    runner = CliRunner()
+    result = runner.invoke(cli, ["--socket", "/tmp/test.sock", "create"])
+
+    assert result.exit_code == 0
+    assert mock_create.call_args[1]["socket_path"] == "/tmp/test.sock"
+    assert dict(os.environ) == before
 
 
 def test_create_help() -> None:
@@ -1217,36 +1328,43 @@ def test_prune_help() -> None:
 # --- shell command ---
 
 
-@patch("subprocess.run")
+@patch("os.execvp")
 @patch("pocketdock.resume_container")
-def test_shell_success(mock_resume: MagicMock, mock_run: MagicMock) -> None:
+def test_shell_success(mock_resume: MagicMock, mock_exec: MagicMock) -> None:
+    from pocketdock.cli._commands import _SHELL_SCRIPT
+
     container = MagicMock()
     container.container_id = "abc123"
     mock_resume.return_value = container
-    mock_run.return_value = MagicMock(returncode=0)
     runner = CliRunner()
-    result = runner.invoke(cli, ["shell", "myc"])
+    with patch("pocketdock.cli._commands._detect_engine_cli", return_value="podman"):
+        result = runner.invoke(cli, ["shell", "myc"])
     assert result.exit_code == 0
-    call_args = mock_run.call_args
-    assert "/bin/bash" in call_args[0][0]
+    mock_exec.assert_called_once_with(
+        "podman",
+        ["podman", "exec", "-it", "abc123", "/bin/sh", "-c", _SHELL_SCRIPT],
+    )
 
 
-@patch("subprocess.run")
-@patch("pocketdock.resume_container")
-def test_shell_fallback_to_sh(mock_resume: MagicMock, mock_run: MagicMock) -> None:
-    container = MagicMock()
-    container.container_id = "abc123"
-    mock_resume.return_value = container
-    mock_run.side_effect = [
-        MagicMock(returncode=126),
-        MagicMock(returncode=0),
-    ]
-    runner = CliRunner()
-    result = runner.invoke(cli, ["shell", "myc"])
-    assert result.exit_code == 0
-    assert mock_run.call_count == 2
-    second_call = mock_run.call_args_list[1]
-    assert "/bin/sh" in second_call[0][0]
+@pytest.mark.skipif(shutil.which("sh") is None, reason="needs a POSIX sh")
+def test_shell_script_prefers_bash_then_falls_back_to_sh(tmp_path: Path) -> None:
+    from pocketdock.cli._commands import _shell_script
+
+    bash, sh = tmp_path / "bash", tmp_path / "sh"
+    for stub in (bash, sh):
+        stub.write_text(f"#!/bin/sh\necho {stub.name}\n")
+        stub.chmod(0o755)
+    script = _shell_script(bash=str(bash), sh=str(sh))
+
+    def _run() -> str:
+        argv = ["sh", "-c", script]
+        return subprocess.run(argv, capture_output=True, text=True, check=True).stdout  # noqa: S603
+
+    assert _run() == "bash\n"
+    bash.chmod(0o644)  # present but not executable
+    assert _run() == "sh\n"
+    bash.unlink()
+    assert _run() == "sh\n"
 
 
 @patch("pocketdock.resume_container")
@@ -1476,53 +1594,105 @@ def test_build_pocketdock_error(mock_detect: MagicMock, mock_build: MagicMock) -
     assert result.exit_code == 1
 
 
+@patch("pocketdock._socket_client.detect_socket")
+def test_build_all_reports_every_result(mock_detect: MagicMock) -> None:
+    mock_detect.return_value = "/tmp/s.sock"
+
+    async def build(_socket: str, _context: bytes, tag: str) -> str:
+        if tag.endswith("dev"):
+            msg = "dev boom"
+            raise RuntimeError(msg)
+        return "ok"
+
+    runner = CliRunner()
+    with patch("pocketdock._socket_client.build_image", AsyncMock(side_effect=build)):
+        result = runner.invoke(cli, ["build", "--all"])
+    assert result.exit_code == 1
+    assert result.output.count("Built") == 5
+    assert "dev boom" in result.output
+
+
+@patch("pocketdock._socket_client.detect_socket")
+def test_build_concurrency_is_bounded(mock_detect: MagicMock) -> None:
+    import asyncio
+
+    from pocketdock.cli import _commands
+
+    mock_detect.return_value = "/tmp/s.sock"
+    active = 0
+    peak = 0
+
+    async def build(_socket: str, _context: bytes, _tag: str) -> str:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return "ok"
+
+    runner = CliRunner()
+    with patch("pocketdock._socket_client.build_image", AsyncMock(side_effect=build)):
+        result = runner.invoke(cli, ["build", "--all"])
+    assert result.exit_code == 0
+    assert peak == _commands._BUILD_CONCURRENCY
+
+
 # --- export command ---
 
 
-@patch("pocketdock._socket_client.save_image", new_callable=AsyncMock)
+def _stream_of(*chunks: bytes, error: Exception | None = None) -> MagicMock:
+    """Return a stand-in for save_image_stream yielding *chunks*, then *error*."""
+
+    async def gen(*_args: object) -> AsyncIterator[bytes]:
+        for chunk in chunks:
+            yield chunk
+        if error is not None:
+            raise error
+
+    return MagicMock(side_effect=gen)
+
+
 @patch("pocketdock._socket_client.detect_socket")
-def test_export_with_image(mock_detect: MagicMock, mock_save: AsyncMock, tmp_path: Path) -> None:
+def test_export_with_image(mock_detect: MagicMock, tmp_path: Path) -> None:
     mock_detect.return_value = "/tmp/s.sock"
-    mock_save.return_value = b"tar-data"
     out = str(tmp_path / "out.tar")
     runner = CliRunner()
-    result = runner.invoke(cli, ["export", "--image", "pocketdock/minimal-python", "-o", out])
+    with patch("pocketdock._socket_client.save_image_stream", _stream_of(b"tar-", b"data")):
+        result = runner.invoke(cli, ["export", "--image", "pocketdock/minimal-python", "-o", out])
     assert result.exit_code == 0
     assert Path(out).read_bytes() == b"tar-data"
+    assert not (tmp_path / "out.tar.part").exists()
 
 
-@patch("pocketdock._socket_client.save_image", new_callable=AsyncMock)
 @patch("pocketdock._socket_client.detect_socket")
-def test_export_with_profile(mock_detect: MagicMock, mock_save: AsyncMock, tmp_path: Path) -> None:
+def test_export_with_profile(mock_detect: MagicMock, tmp_path: Path) -> None:
     mock_detect.return_value = "/tmp/s.sock"
-    mock_save.return_value = b"tar-data"
     out = str(tmp_path / "out.tar")
     runner = CliRunner()
-    result = runner.invoke(cli, ["export", "--profile", "dev", "-o", out])
+    with patch("pocketdock._socket_client.save_image_stream", _stream_of(b"tar-data")):
+        result = runner.invoke(cli, ["export", "--profile", "dev", "-o", out])
     assert result.exit_code == 0
 
 
-@patch("pocketdock._socket_client.save_image", new_callable=AsyncMock)
 @patch("pocketdock._socket_client.detect_socket")
-def test_export_all(mock_detect: MagicMock, mock_save: AsyncMock, tmp_path: Path) -> None:
+def test_export_all(mock_detect: MagicMock, tmp_path: Path) -> None:
     mock_detect.return_value = "/tmp/s.sock"
-    mock_save.return_value = b"tar-data"
     out = str(tmp_path / "out.tar")
     runner = CliRunner()
-    result = runner.invoke(cli, ["export", "--all", "-o", out])
+    with patch("pocketdock._socket_client.save_image_stream", _stream_of(b"tar-data")):
+        result = runner.invoke(cli, ["export", "--all", "-o", out])
     assert result.exit_code == 0
 
 
-@patch("pocketdock._socket_client.save_image", new_callable=AsyncMock)
 @patch("pocketdock._socket_client.detect_socket")
-def test_export_gzip(mock_detect: MagicMock, mock_save: AsyncMock, tmp_path: Path) -> None:
+def test_export_gzip(mock_detect: MagicMock, tmp_path: Path) -> None:
     import gzip
 
     mock_detect.return_value = "/tmp/s.sock"
-    mock_save.return_value = b"tar-data"
     out = str(tmp_path / "out.tar.gz")
     runner = CliRunner()
-    result = runner.invoke(cli, ["export", "--image", "test", "-o", out])
+    with patch("pocketdock._socket_client.save_image_stream", _stream_of(b"tar-", b"data")):
+        result = runner.invoke(cli, ["export", "--image", "test", "-o", out])
     assert result.exit_code == 0
     # Verify it's gzip-compressed
     decompressed = gzip.decompress(Path(out).read_bytes())
@@ -1546,63 +1716,77 @@ def test_export_no_image_or_profile(tmp_path: Path) -> None:
     assert result.exit_code != 0
 
 
-@patch("pocketdock._socket_client.save_image")
 @patch("pocketdock._socket_client.detect_socket")
-def test_export_error(mock_detect: MagicMock, mock_save: MagicMock, tmp_path: Path) -> None:
+def test_export_error(mock_detect: MagicMock, tmp_path: Path) -> None:
     mock_detect.return_value = "/tmp/s.sock"
-    mock_save.side_effect = RuntimeError("save boom")
-    out = str(tmp_path / "out.tar")
+    out = tmp_path / "out.tar"
+    out.write_bytes(b"previous export")
     runner = CliRunner()
-    result = runner.invoke(cli, ["export", "--image", "test", "-o", out])
+    stream = _stream_of(b"partial", error=RuntimeError("save boom"))
+    with patch("pocketdock._socket_client.save_image_stream", stream):
+        result = runner.invoke(cli, ["export", "--image", "test", "-o", str(out)])
     assert result.exit_code == 1
+    assert "save boom" in result.output
+    # A failed export leaves neither a truncated archive nor the .part file.
+    assert out.read_bytes() == b"previous export"
+    assert not (tmp_path / "out.tar.part").exists()
 
 
-@patch("pocketdock._socket_client.save_image")
 @patch("pocketdock._socket_client.detect_socket")
-def test_export_pocketdock_error(
-    mock_detect: MagicMock, mock_save: MagicMock, tmp_path: Path
-) -> None:
+def test_export_pocketdock_error(mock_detect: MagicMock, tmp_path: Path) -> None:
     from pocketdock.errors import ImageNotFound
 
     mock_detect.return_value = "/tmp/s.sock"
-    mock_save.side_effect = ImageNotFound("nope")
     out = str(tmp_path / "out.tar")
     runner = CliRunner()
-    result = runner.invoke(cli, ["export", "--image", "nope", "-o", out])
+    stream = _stream_of(error=ImageNotFound("nope"))
+    with patch("pocketdock._socket_client.save_image_stream", stream):
+        result = runner.invoke(cli, ["export", "--image", "nope", "-o", out])
     assert result.exit_code == 1
+    assert not Path(out).exists()
 
 
 # --- import command ---
 
 
-@patch("pocketdock._socket_client.load_image", new_callable=AsyncMock)
+def _consuming_load(received: list[bytes]) -> AsyncMock:
+    """Return a stand-in for load_image that drains the chunk stream into *received*."""
+
+    async def load(_socket: str, chunks: AsyncIterator[bytes]) -> str:
+        received.extend([chunk async for chunk in chunks])
+        return "ok"
+
+    return AsyncMock(side_effect=load)
+
+
 @patch("pocketdock._socket_client.detect_socket")
-def test_import_success(mock_detect: MagicMock, mock_load: AsyncMock, tmp_path: Path) -> None:
+def test_import_success(mock_detect: MagicMock, tmp_path: Path) -> None:
     mock_detect.return_value = "/tmp/s.sock"
-    mock_load.return_value = "ok"
     tar_file = tmp_path / "images.tar"
-    tar_file.write_bytes(b"tar-data")
+    tar_file.write_bytes(b"x" * 70000)
+    received: list[bytes] = []
     runner = CliRunner()
-    result = runner.invoke(cli, ["import", str(tar_file)])
+    with patch("pocketdock._socket_client.load_image", _consuming_load(received)):
+        result = runner.invoke(cli, ["import", str(tar_file)])
     assert result.exit_code == 0
     assert "Imported" in result.output
+    assert [len(c) for c in received] == [65536, 70000 - 65536]
 
 
-@patch("pocketdock._socket_client.load_image", new_callable=AsyncMock)
 @patch("pocketdock._socket_client.detect_socket")
-def test_import_gzip(mock_detect: MagicMock, mock_load: AsyncMock, tmp_path: Path) -> None:
+def test_import_gzip(mock_detect: MagicMock, tmp_path: Path) -> None:
     import gzip
 
     mock_detect.return_value = "/tmp/s.sock"
-    mock_load.return_value = "ok"
     gz_file = tmp_path / "images.tar.gz"
     gz_file.write_bytes(gzip.compress(b"tar-data"))
+    received: list[bytes] = []
     runner = CliRunner()
-    result = runner.invoke(cli, ["import", str(gz_file)])
+    with patch("pocketdock._socket_client.load_image", _consuming_load(received)):
+        result = runner.invoke(cli, ["import", str(gz_file)])
     assert result.exit_code == 0
-    # Verify the decompressed data was passed
-    call_args = mock_load.call_args[0]
-    assert call_args[1] == b"tar-data"
+    # Verify the decompressed data was streamed
+    assert b"".join(received) == b"tar-data"
 
 
 @patch("pocketdock._socket_client.detect_socket")
@@ -5,6 +5,8 @@ These tests do NOT require a running container engine.
 
 from __future__ import annotations
 
+import asyncio
+import concurrent.futures
 import io
 import tarfile
 from typing import TYPE_CHECKING
@@ -229,6 +231,49 @@ async def test_async_create_sets_labels() -> None:
     assert labels["pocketdock.instance"] == "pd-lab"
 
 
+async def test_async_create_reuses_detected_socket() -> None:
+    with (
+        patch(
+            "pocketdock._async_container.sc.detect_socket",
+            return_value="/tmp/s.sock",
+        ) as detect,
+        patch("pocketdock._socket_client._path_exists", return_value=True),
+        patch(
+            "pocketdock._async_container.sc.create_container",
+            new_callable=AsyncMock,
+            return_value="deadbeef",
+        ),
+        patch(
+            "pocketdock._async_container.sc.start_container",
+            new_callable=AsyncMock,
+        ),
+    ):
+        await async_factory(name="pd-one")
+        await async_factory(name="pd-two")
+
+    detect.assert_called_once()
+
+
+async def test_async_create_explicit_socket_skips_detection() -> None:
+    with (
+        patch("pocketdock._async_container.sc.detect_socket_cached") as detect,
+        patch(
+            "pocketdock._async_container.sc.create_container",
+            new_callable=AsyncMock,
+            return_value="deadbeef",
+        ) as create,
+        patch(
+            "pocketdock._async_container.sc.start_container",
+            new_callable=AsyncMock,
+        ),
+    ):
+        c = await async_factory(name="pd-sock", socket_path="/tmp/explicit.sock")
+
+    detect.assert_not_called()
+    assert create.call_args[0][0] == "/tmp/explicit.sock"
+    assert c.socket_path == "/tmp/explicit.sock"
+
+
 # --- Container (sync) properties ---
 
 
@@ -361,6 +406,15 @@ def test_loopthread_shutdown() -> None:
     assert not fresh._thread.is_alive()
 
 
+def test_loopthread_shutdown_idempotent() -> None:
+    fresh = _LoopThread()
+    fresh._shutdown()
+    assert not fresh._finalizer.alive
+    # A second call is a no-op — the loop is not stopped twice
+    fresh._shutdown()
+    assert not fresh._thread.is_alive()
+
+
 def test_loopthread_double_check_locking_race() -> None:
     # Ensure the singleton exists (may be None in parallel xdist workers)
     _LoopThread.get()
@@ -481,6 +535,79 @@ async def test_async_info_stopped() -> None:
     assert info.pids == 0
 
 
+_STOPPED_INSPECT = {
+    "Id": "cid",
+    "Created": "2026-01-01T00:00:00Z",
+    "State": {"Status": "exited", "Running": False},
+    "Config": {"Image": "test-image"},
+    "NetworkSettings": {"IPAddress": ""},
+}
+
+
+async def test_async_info_queries_engine_every_call_by_default() -> None:
+    ac = _make_container()
+
+    with patch(
+        "pocketdock._async_container.sc.inspect_container",
+        new_callable=AsyncMock,
+        return_value=_STOPPED_INSPECT,
+    ) as inspect:
+        await ac.info()
+        await ac.info()
+
+    assert inspect.await_count == 2
+
+
+async def test_async_info_max_age_reuses_recent_snapshot() -> None:
+    ac = _make_container()
+
+    with patch(
+        "pocketdock._async_container.sc.inspect_container",
+        new_callable=AsyncMock,
+        return_value=_STOPPED_INSPECT,
+    ) as inspect:
+        first = await ac.info()
+        second = await ac.info(max_age=60)
+
+    assert second is first
+    inspect.assert_awaited_once()
+
+
+async def test_async_info_max_age_expired_requeries() -> None:
+    ac = _make_container()
+
+    with (
+        patch(
+            "pocketdock._async_container.sc.inspect_container",
+            new_callable=AsyncMock,
+            return_value=_STOPPED_INSPECT,
+        ) as inspect,
+        patch("pocketdock._async_container.time.monotonic", side_effect=[100.0, 101.0, 101.0]),
+    ):
+        await ac.info()
+        await ac.info(max_age=0.5)
+
+    assert inspect.await_count == 2
+
+
+async def test_async_reboot_drops_cached_info() -> None:
+    ac = _make_container()
+
+    with (
+        patch(
+            "pocketdock._async_container.sc.inspect_container",
+            new_callable=AsyncMock,
+            return_value=_STOPPED_INSPECT,
+        ) as inspect,
+        patch("pocketdock._async_container.sc.restart_container", new_callable=AsyncMock),
+    ):
+        await ac.info()
+        await ac.reboot()
+        await ac.info(max_age=60)
+
+    assert inspect.await_count == 2
+
+
 async def test_async_info_race_container_stops_during_stats() -> None:
     ac = _make_container()
     inspect_data = {
@@ -1006,6 +1133,88 @@ async def test_async_shutdown_cleans_up_processes() -> None:
     assert len(ac._active_processes) == 0
 
 
+async def test_async_shutdown_closes_handles_before_stopping_container() -> None:
+    ac = _make_container()
+    started: list[str] = []
+    release = asyncio.Event()
+
+    def _handle(name: str) -> MagicMock:
+        async def _close() -> None:
+            started.append(name)
+            await release.wait()
+
+        h = MagicMock()
+        h._close = _close
+        h._cancel = _close
+        return h
+
+    ac._active_sessions.append(_handle("session"))
+    ac._active_streams.append(_handle("stream"))
+    ac._active_processes.append(_handle("process"))
+
+    async def _stop(*_args: object) -> None:
+        started.append("stop")
+
+    with (
+        patch("pocketdock._async_container.sc.stop_container", side_effect=_stop),
+        patch("pocketdock._async_container.sc.remove_container", new_callable=AsyncMock),
+    ):
+        task = asyncio.ensure_future(ac.shutdown())
+        for _ in range(5):
+            await asyncio.sleep(0)
+        # All three closes are in flight together; the container is untouched.
+        assert sorted(started) == ["process", "session", "stream"]
+        release.set()
+        await task
+
+    assert started[-1] == "stop"
+    assert not ac._active_sessions
+    assert not ac._active_streams
+    assert not ac._active_processes
+
+
+async def test_async_shutdown_raises_engine_error_after_closing_handles() -> None:
+    ac = _make_container()
+    handle = MagicMock()
+    handle._close = AsyncMock()
+    ac._active_streams.append(handle)
+
+    with (
+        patch(
+            "pocketdock._async_container.sc.remove_container",
+            new_callable=AsyncMock,
+            side_effect=PodmanNotRunning,
+        ),
+        pytest.raises(PodmanNotRunning),
+    ):
+        await ac.shutdown(force=True)
+
+    handle._close.assert_awaited_once()
+    assert not ac._active_streams
+
+
+async def test_async_shutdown_removes_container_before_raising_close_error() -> None:
+    ac = _make_container()
+    bad = MagicMock()
+    bad._close = AsyncMock(side_effect=OSError("broken pipe"))
+    good = MagicMock()
+    good._close = AsyncMock()
+    ac._active_streams.extend([bad, good])
+
+    with (
+        patch("pocketdock._async_container.sc.stop_container", new_callable=AsyncMock),
+        patch(
+            "pocketdock._async_container.sc.remove_container", new_callable=AsyncMock
+        ) as mock_remove,
+        pytest.raises(OSError, match="broken pipe"),
+    ):
+        await ac.shutdown()
+
+    good._close.assert_awaited_once()
+    mock_remove.assert_awaited_once()
+    assert not ac._active_streams
+
+
 # --- Sync SyncExecStream ---
 
 
@@ -1026,6 +1235,60 @@ async def test_sync_exec_stream_iteration() -> None:
     assert len(chunks) == 1
     assert chunks[0].data == "hi"
     assert sync_stream.result.exit_code == 0
+    # Exhausted stream keeps raising StopIteration
+    with pytest.raises(StopIteration):
+        next(sync_stream)
+
+
+def test_sync_exec_stream_propagates_error() -> None:
+    async def _failing_gen() -> AsyncGenerator[tuple[int, bytes], None]:
+        yield STREAM_STDOUT, b"partial"
+        msg = "connection lost"
+        raise OSError(msg)
+
+    async_stream = AsyncExecStream("eid", _failing_gen(), _mock_writer(), "/tmp/s.sock", 0.0)
+    sync_stream = SyncExecStream(async_stream, _LoopThread.get())
+
+    assert next(sync_stream).data == "partial"
+    with pytest.raises(OSError, match="connection lost"):
+        next(sync_stream)
+    with (
+        patch(
+            "pocketdock._socket_client._exec_inspect_exit_code",
+            new_callable=AsyncMock,
+            return_value=-1,
+        ),
+        pytest.raises(StopIteration),
+    ):
+        next(sync_stream)
+
+
+def test_sync_exec_stream_reads_only_what_is_consumed() -> None:
+    produced: list[int] = []
+
+    async def _counting_gen() -> AsyncGenerator[tuple[int, bytes], None]:
+        for i in range(100):
+            produced.append(i)
+            yield STREAM_STDOUT, b"x"
+
+    async_stream = AsyncExecStream("eid", _counting_gen(), _mock_writer(), "/tmp/s.sock", 0.0)
+    sync_stream = SyncExecStream(async_stream, _LoopThread.get())
+
+    for _ in sync_stream:
+        break
+    assert produced == [0]
+
+
+def test_sync_exec_stream_propagates_cancellation() -> None:
+    async def _cancelled_gen() -> AsyncGenerator[tuple[int, bytes], None]:
+        raise asyncio.CancelledError
+        yield STREAM_STDOUT, b""  # pragma: no cover
+
+    async_stream = AsyncExecStream("eid", _cancelled_gen(), _mock_writer(), "/tmp/s.sock", 0.0)
+    sync_stream = SyncExecStream(async_stream, _LoopThread.get())
+
+    with pytest.raises(concurrent.futures.CancelledError):
+        next(sync_stream)
 
 
 # --- Sync SyncProcess (tested via Container.run(detach=True)) ---
@@ -1742,6 +2005,14 @@ async def test_run_blocking_calls_logger(tmp_path: Path) -> None:
     history = (logs_dir / "history.jsonl").read_text()
     assert '"echo hello"' in history
 
+    with (
+        patch("pocketdock._async_container.sc.stop_container", new_callable=AsyncMock),
+        patch("pocketdock._async_container.sc.remove_container", new_callable=AsyncMock),
+    ):
+        await ac.shutdown()
+    assert ac._logger is not None
+    assert ac._logger._history_file is None
+
 
 async def test_run_detach_creates_log_handle(tmp_path: Path) -> None:
     logs_dir = tmp_path / "logs"
@@ -1855,6 +2126,8 @@ async def test_create_new_container_with_project_root(tmp_path: Path) -> None:
     assert toml_file.is_file()
     content = toml_file.read_text()
     assert "cid123" in content
+    # Label and metadata share a single timestamp
+    assert f'created_at = "{labels["pocketdock.created-at"]}"' in content
 
 
 async def test_create_new_container_with_explicit_project(tmp_path: Path) -> None:
@@ -2160,3 +2433,118 @@ async def test_reboot_fresh_includes_ports() -> None:
     assert hc["PortBindings"] == {"80/tcp": [{"HostPort": "8080"}]}
     ep = create.call_args[1]["exposed_ports"]
     assert ep == {"80/tcp": {}}
+
+
+async def test_reboot_fresh_loads_config_for_resumed_container() -> None:
+    ac = AsyncContainer("cid", "/tmp/s.sock", name="pd-xx", image="sha256:abc", lazy_config=True)
+    inspect_data = {
+        "Config": {"Image": "pocketdock/dev"},
+        "HostConfig": {
+            "Memory": 268435456,
+            "NanoCpus": 500000000,
+            "PortBindings": {"80/tcp": [{"HostPort": "8080"}]},
+        },
+    }
+
+    with (
+        patch(
+            "pocketdock._async_container.sc.inspect_container",
+            new_callable=AsyncMock,
+            return_value=inspect_data,
+        ) as inspect,
+        patch("pocketdock._async_container.sc.stop_container", new_callable=AsyncMock),
+        patch("pocketdock._async_container.sc.remove_container", new_callable=AsyncMock),
+        patch(
+            "pocketdock._async_container.sc.create_container",
+            new_callable=AsyncMock,
+            side_effect=["newcid", "newcid2"],
+        ) as create,
+        patch("pocketdock._async_container.sc.start_container", new_callable=AsyncMock),
+    ):
+        await ac.reboot(fresh=True)
+        await ac.reboot(fresh=True)
+
+    inspect.assert_called_once_with("/tmp/s.sock", "cid")
+    assert create.call_args[0][1] == "pocketdock/dev"
+    hc = create.call_args[1]["host_config"]
+    assert hc["Memory"] == 268435456
+    assert hc["NanoCpus"] == 500000000
+    assert hc["PortBindings"] == {"80/tcp": [{"HostPort": "8080"}]}
+
+
+async def test_detach_log_is_flushed_while_running(tmp_path: Path) -> None:
+    import asyncio
+
+    logs_dir = tmp_path / "logs"
+    logs_dir.mkdir()
+    ac = AsyncContainer("cid", "/fake.sock", name="test", image="img", data_path=str(tmp_path))
+    release = asyncio.Event()
+
+    async def fake_gen() -> AsyncGenerator[tuple[int, bytes], None]:
+        yield (STREAM_STDOUT, b"first chunk")
+        await release.wait()
+
+    mock_writer = MagicMock()
+    mock_writer.close = MagicMock()
+    mock_writer.wait_closed = AsyncMock()
+
+    with (
+        patch(
+            "pocketdock._async_container.sc._exec_create",
+            new_callable=AsyncMock,
+            return_value="eid",
+        ),
+        patch(
+            "pocketdock._async_container.sc._exec_start_stream",
+            new_callable=AsyncMock,
+            return_value=(fake_gen(), mock_writer),
+        ),
+    ):
+        proc = await ac.run("sleep 100", detach=True)
+        await asyncio.sleep(0.05)
+        (log_file,) = logs_dir.glob("detach-*.log")
+        assert "first chunk" in log_file.read_text()
+        assert await proc.is_running()
+        release.set()
+        await proc.wait(timeout=5)
+
+
+async def test_session_log_is_flushed_while_open(tmp_path: Path) -> None:
+    import asyncio
+
+    logs_dir = tmp_path / "logs"
+    logs_dir.mkdir()
+    ac = AsyncContainer("cid", "/fake.sock", name="test", image="img", data_path=str(tmp_path))
+    release = asyncio.Event()
+
+    async def fake_gen() -> AsyncGenerator[tuple[int, bytes], None]:
+        yield (STREAM_STDOUT, b"bash$ \n")
+        await release.wait()
+
+    mock_writer = MagicMock()
+    mock_writer.write = MagicMock()
+    mock_writer.drain = AsyncMock()
+    mock_writer.close = MagicMock()
+    mock_writer.wait_closed = AsyncMock()
+
+    with (
+        patch(
+            "pocketdock._async_container.sc._exec_create",
+            new_callable=AsyncMock,
+            return_value="eid",
+        ),
+        patch(
+            "pocketdock._async_container.sc._exec_start_stream",
+            new_callable=AsyncMock,
+            return_value=(fake_gen(), mock_writer),
+        ),
+    ):
+        sess = await ac.session()
+        await asyncio.sleep(0.05)
+        await sess.send("ls")
+        (log_file,) = logs_dir.glob("session-*.log")
+        content = log_file.read_text()
+        assert "bash$" in content
+        assert ">>> ls" in content
+        release.set()
+        await sess.close()
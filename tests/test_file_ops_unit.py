@@ -2,21 +2,31 @@
 
 from __future__ import annotations
 
+import asyncio
 import io
 import pathlib
 import tarfile
 import tempfile
+from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, patch
 
 import pytest
-from pocketdock._async_container import AsyncContainer
+from pocketdock._async_container import _OPTIMISTIC_UPLOAD_MAX, AsyncContainer, _split_posix
+from pocketdock.errors import SocketCommunicationError
 from pocketdock.types import ExecResult
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable
+
 
 def _make_container() -> AsyncContainer:
     return AsyncContainer("cid", "/tmp/s.sock", name="pd-test")
 
 
+async def _collect(chunks: AsyncIterable[bytes]) -> bytes:
+    return b"".join([chunk async for chunk in chunks])
+
+
 # --- write_file ---
 
 
@@ -37,7 +47,7 @@ async def test_write_file_text_encodes_utf8() -> None:
     _, _, dest_dir, tar_data = mock_push.call_args[0]
     assert dest_dir == "/tmp"
 
-    buf = io.BytesIO(tar_data)
+    buf = io.BytesIO(await _collect(tar_data))
     with tarfile.open(fileobj=buf, mode="r") as tar:
         members = tar.getmembers()
         assert len(members) == 1
@@ -64,7 +74,7 @@ async def test_write_file_binary_passthrough() -> None:
     _, _, dest_dir, tar_data = mock_push.call_args[0]
     assert dest_dir == "/data"
 
-    buf = io.BytesIO(tar_data)
+    buf = io.BytesIO(await _collect(tar_data))
     with tarfile.open(fileobj=buf, mode="r") as tar:
         extracted = tar.extractfile(tar.getmembers()[0])
         assert extracted is not None
@@ -88,6 +98,134 @@ async def test_write_file_nested_path() -> None:
     assert dest_dir == "/a/b/c"
 
 
+async def test_write_file_skips_mkdir_when_dir_exists() -> None:
+    c = _make_container()
+
+    with (
+        patch.object(c, "run", new_callable=AsyncMock) as mock_run,
+        patch("pocketdock._async_container.sc.push_archive", new_callable=AsyncMock),
+    ):
+        await c.write_file("/tmp/a.txt", "a")
+
+    mock_run.assert_not_called()
+
+
+async def test_write_file_creates_missing_dir_and_retries() -> None:
+    c = _make_container()
+    uploads: list[bytes] = []
+
+    async def _push(_sock: str, _cid: str, _dest: str, chunks: AsyncIterable[bytes]) -> None:
+        uploads.append(await _collect(chunks))
+        if len(uploads) == 1:
+            msg = "destination path not found in container: /new/dir"
+            raise FileNotFoundError(msg)
+
+    with (
+        patch.object(
+            c, "run", new_callable=AsyncMock, return_value=ExecResult(exit_code=0)
+        ) as mock_run,
+        patch("pocketdock._async_container.sc.push_archive", side_effect=_push),
+    ):
+        await c.write_file("/new/dir/a.txt", "a")
+
+    mock_run.assert_called_once_with("mkdir -p /new/dir")
+    assert len(uploads) == 2
+    assert uploads[0] == uploads[1]
+
+
+@pytest.mark.parametrize("cause", [BrokenPipeError(32, "EPIPE"), ConnectionResetError()])
+async def test_write_file_retries_after_engine_hangs_up(cause: OSError) -> None:
+    c = _make_container()
+    calls = 0
+
+    async def _push(_sock: str, _cid: str, _dest: str, chunks: AsyncIterable[bytes]) -> None:
+        nonlocal calls
+        calls += 1
+        await _collect(chunks)
+        if calls == 1:
+            raise SocketCommunicationError(str(cause)) from cause
+
+    with (
+        patch.object(
+            c, "run", new_callable=AsyncMock, return_value=ExecResult(exit_code=0)
+        ) as mock_run,
+        patch("pocketdock._async_container.sc.push_archive", side_effect=_push),
+    ):
+        await c.write_file("/new/dir/a.txt", "a")
+
+    mock_run.assert_called_once_with("mkdir -p /new/dir")
+    assert calls == 2
+
+
+async def test_write_file_other_communication_error_is_raised() -> None:
+    c = _make_container()
+    err = SocketCommunicationError("HTTP 500")
+
+    with (
+        patch.object(c, "run", new_callable=AsyncMock) as mock_run,
+        patch("pocketdock._async_container.sc.push_archive", side_effect=err),
+        pytest.raises(SocketCommunicationError, match="HTTP 500"),
+    ):
+        await c.write_file("/tmp/a.txt", "a")
+
+    mock_run.assert_not_called()
+
+
+async def test_write_file_large_payload_creates_dir_first() -> None:
+    c = _make_container()
+    order: list[str] = []
+
+    async def _run(cmd: str) -> ExecResult:
+        order.append(cmd)
+        return ExecResult(exit_code=0)
+
+    async def _push(_sock: str, _cid: str, _dest: str, chunks: AsyncIterable[bytes]) -> None:
+        await _collect(chunks)
+        order.append("push")
+
+    with (
+        patch.object(c, "run", side_effect=_run),
+        patch("pocketdock._async_container.sc.push_archive", side_effect=_push),
+    ):
+        await c.write_file("/new/dir/big.bin", bytes(_OPTIMISTIC_UPLOAD_MAX))
+
+    assert order == ["mkdir -p /new/dir", "push"]
+
+
+async def test_write_file_large_str_encodes_in_thread() -> None:
+    c = _make_container()
+    content = "é" * (1024 * 1024)
+    uploads: list[bytes] = []
+
+    async def _push(_sock: str, _cid: str, _dest: str, chunks: AsyncIterable[bytes]) -> None:
+        uploads.append(await _collect(chunks))
+
+    with (
+        patch("pocketdock._async_container.asyncio.to_thread", wraps=asyncio.to_thread) as thr,
+        patch.object(c, "run", new_callable=AsyncMock, return_value=ExecResult(exit_code=0)),
+        patch("pocketdock._async_container.sc.push_archive", side_effect=_push),
+    ):
+        await c.write_file("/tmp/big.txt", content)
+
+    assert thr.call_args[0][1:] == ("utf-8",)
+    with tarfile.open(fileobj=io.BytesIO(uploads[0])) as tar:
+        member = tar.extractfile("big.txt")
+        assert member is not None
+        assert member.read() == content.encode("utf-8")
+
+
+# --- _split_posix ---
+
+
+@pytest.mark.parametrize(
+    "path",
+    ["/tmp/a.txt", "/a.txt", "a.txt", "rel/dir/a.txt", "/tmp/dir/", "/tmp//a.txt", "/", ""],
+)
+def test_split_posix_matches_pure_posix_path(path: str) -> None:
+    pure = pathlib.PurePosixPath(path)
+    assert _split_posix(path) == (str(pure.parent), pure.name)
+
+
 # --- read_file ---
 
 
@@ -113,6 +251,30 @@ async def test_read_file_extracts_from_tar() -> None:
     assert result == b"file contents"
 
 
+async def test_read_file_returns_first_file_in_directory_archive() -> None:
+    c = _make_container()
+
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w") as tar:
+        dir_info = tarfile.TarInfo(name="dir")
+        dir_info.type = tarfile.DIRTYPE
+        tar.addfile(dir_info)
+        for name, content in (("dir/a.txt", b"first"), ("dir/b.txt", b"second")):
+            info = tarfile.TarInfo(name=name)
+            info.size = len(content)
+            tar.addfile(info, io.BytesIO(content))
+    tar_bytes = buf.getvalue()
+
+    with patch(
+        "pocketdock._async_container.sc.pull_archive",
+        new_callable=AsyncMock,
+        return_value=tar_bytes,
+    ):
+        result = await c.read_file("/tmp/dir")
+
+    assert result == b"first"
+
+
 async def test_read_file_empty_tar_raises() -> None:
     c = _make_container()
 
@@ -138,9 +300,13 @@ async def test_read_file_empty_tar_raises() -> None:
 
 async def test_list_files_parses_output() -> None:
     c = _make_container()
-    mock_result = ExecResult(exit_code=0, stdout=".\n..\nfoo.txt\nbar.txt\n")
+    mock_result = ExecResult(exit_code=0, stdout="foo.txt\nbar.txt\n")
 
-    with patch.object(c, "run", new_callable=AsyncMock, return_value=mock_result):
+    with patch(
+        "pocketdock._async_container.sc.exec_command",
+        new_callable=AsyncMock,
+        return_value=mock_result,
+    ):
         files = await c.list_files("/tmp")
 
     assert files == ["foo.txt", "bar.txt"]
@@ -151,7 +317,11 @@ async def test_list_files_failure_raises() -> None:
     mock_result = ExecResult(exit_code=2, stderr="ls: cannot access: No such file")
 
     with (
-        patch.object(c, "run", new_callable=AsyncMock, return_value=mock_result),
+        patch(
+            "pocketdock._async_container.sc.exec_command",
+            new_callable=AsyncMock,
+            return_value=mock_result,
+        ),
         pytest.raises(FileNotFoundError, match="ls failed"),
     ):
         await c.list_files("/no/such/dir")
@@ -159,15 +329,38 @@ async def test_list_files_failure_raises() -> None:
 
 async def test_list_files_default_path() -> None:
     c = _make_container()
-    mock_result = ExecResult(exit_code=0, stdout=".\n..\n")
+    mock_result = ExecResult(exit_code=0, stdout="")
 
-    with patch.object(c, "run", new_callable=AsyncMock, return_value=mock_result) as mock_run:
+    with patch(
+        "pocketdock._async_container.sc.exec_command",
+        new_callable=AsyncMock,
+        return_value=mock_result,
+    ) as mock_exec:
         files = await c.list_files()
 
-    mock_run.assert_called_once_with("ls -1a /home/sandbox")
+    assert mock_exec.call_args[0][2] == ["ls", "-1A", "--", "/home/sandbox"]
     assert files == []
 
 
+async def test_list_files_skips_shell() -> None:
+    c = _make_container()
+    mock_result = ExecResult(exit_code=0, stdout="a b.txt\n")
+
+    with (
+        patch.object(c, "run", new_callable=AsyncMock) as mock_run,
+        patch(
+            "pocketdock._async_container.sc.exec_command",
+            new_callable=AsyncMock,
+            return_value=mock_result,
+        ) as mock_exec,
+    ):
+        files = await c.list_files("/tmp/my dir")
+
+    mock_run.assert_not_called()
+    assert mock_exec.call_args[0][2] == ["ls", "-1A", "--", "/tmp/my dir"]
+    assert files == ["a b.txt"]
+
+
 # --- push ---
 
 
@@ -190,7 +383,7 @@ async def test_push_file_creates_tar() -> None:
         _, _, dest_dir, tar_data = mock_push.call_args[0]
         assert dest_dir == "/container"
 
-        buf = io.BytesIO(tar_data)
+        buf = io.BytesIO(await _collect(tar_data))
         with tarfile.open(fileobj=buf, mode="r") as tar:
             members = tar.getmembers()
             assert len(members) == 1
@@ -218,7 +411,7 @@ async def test_push_directory_creates_tar() -> None:
         _, _, dest_dir, tar_data = mock_push.call_args[0]
         assert dest_dir == "/dest"
 
-        buf = io.BytesIO(tar_data)
+        buf = io.BytesIO(await _collect(tar_data))
         with tarfile.open(fileobj=buf, mode="r") as tar:
             names = tar.getnames()
             assert any("a.txt" in n for n in names)
@@ -9,6 +9,8 @@ from pocketdock._helpers import (
     _extract_memory,
     _extract_pids,
     _extract_processes,
+    _parse_engine_timestamp,
+    _percent,
     _safe_dict,
     build_container_info,
     build_exposed_ports,
@@ -97,6 +99,12 @@ def test_parse_mem_limit_empty() -> None:
         parse_mem_limit("")
 
 
+@pytest.mark.parametrize("value", ["m", "12mm", "1.5g", "-1k", "g1"])
+def test_parse_mem_limit_rejects_malformed(value: str) -> None:
+    with pytest.raises(ValueError, match="invalid memory limit"):
+        parse_mem_limit(value)
+
+
 # --- parse_iso_timestamp ---
 
 
@@ -120,6 +128,45 @@ def test_parse_iso_timestamp_microseconds() -> None:
     assert dt.microsecond == 654321
 
 
+def test_parse_iso_timestamp_nanoseconds_z_suffix() -> None:
+    dt = parse_iso_timestamp("2026-01-15T10:30:00.123456789Z")
+    assert dt == datetime.datetime(2026, 1, 15, 10, 30, 0, 123456, tzinfo=datetime.timezone.utc)
+
+
+def test_parse_iso_timestamp_invalid() -> None:
+    with pytest.raises(ValueError, match="Invalid isoformat"):
+        parse_iso_timestamp("not a timestamp")
+
+
+def test_parse_engine_timestamp_is_memoised() -> None:
+    s = "2026-01-15T10:30:00.123456789Z"
+    first = _parse_engine_timestamp(s)
+    assert first == parse_iso_timestamp(s)
+    assert _parse_engine_timestamp(s) is first
+
+
+# --- _percent ---
+
+
+@pytest.mark.parametrize(
+    ("part", "whole", "expected"),
+    [
+        (0, 100, 0.0),
+        (1, 3, 33.33),
+        (2, 3, 66.67),
+        (1, 8, 12.5),
+        (123456789, 536870912, 23.0),
+        (1.5, 7.0, 21.43),
+    ],
+)
+def test_percent_matches_round(part: float, whole: float, expected: float) -> None:
+    assert _percent(part, whole) == expected
+    assert _percent(part, whole) == round(part / whole * 100, 2)
+    # Exact ties round half up, where round() would round to even.
+    assert _percent(1, 800) == 0.13
+    assert round(0.125, 2) == 0.12
+
+
 # --- compute_cpu_percent ---
 
 
@@ -249,6 +296,11 @@ def test_extract_memory_non_numeric() -> None:
     assert _extract_memory(stats) == ("", "", 0.0)
 
 
+def test_extract_memory_missing_memory_stats() -> None:
+    stats: dict[str, object] = {"memory_stats": "bad"}
+    assert _extract_memory(stats) == ("0 B", "0 B", 0.0)
+
+
 # --- _extract_pids ---
 
 
@@ -297,6 +349,14 @@ def test_extract_processes_non_list_proc_entry() -> None:
     assert len(procs) == 1
 
 
+def test_extract_processes_ragged_rows() -> None:
+    top: dict[str, object] = {
+        "Titles": ["PID", "CMD"],
+        "Processes": [["1"], ["2", "bash", "extra"]],
+    }
+    assert _extract_processes(top) == ({"PID": "1"}, {"PID": "2", "CMD": "bash"})
+
+
 # --- build_container_info ---
 
 
@@ -383,6 +443,14 @@ def test_build_container_info_missing_state() -> None:
     assert info.status == "unknown"
 
 
+def test_build_container_info_non_dict_stats() -> None:
+    inspect: dict[str, object] = {"Id": "x", "State": {"Status": "running"}}
+    info = build_container_info(inspect, ["not", "a", "dict"], None, "pd-x")  # type: ignore[arg-type]
+    assert (info.memory_usage, info.memory_limit, info.memory_percent) == ("", "", 0.0)
+    assert info.cpu_percent == 0.0
+    assert info.pids == 0
+
+
 # --- build_exposed_ports ---
 
 
@@ -0,0 +1,59 @@
+"""Tests for the shared JSON helpers."""
+
+from __future__ import annotations
+
+import datetime
+import importlib
+import json
+import sys
+import types
+from unittest.mock import MagicMock, patch
+
+import pocketdock._json as json_mod
+from pocketdock._json import dumps, loads
+
+_WHEN = datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc)
+
+
+def test_dumps_compact_and_indented() -> None:
+    data = {"a": [1, 2], 8080: 80}
+    assert dumps(data) == b'{"a":[1,2],"8080":80}'
+    assert json.loads(dumps(data, indent=True)) == {"a": [1, 2], "8080": 80}
+    assert dumps(data, indent=True).startswith(b'{\n  "a": [')
+
+
+def test_dumps_renders_datetimes_with_str() -> None:
+    assert loads(dumps({"t": _WHEN})) == {"t": str(_WHEN)}
+
+
+def test_loads_bytes() -> None:
+    assert loads(b'{"Id": "abc", "Names": ["/x"]}') == {"Id": "abc", "Names": ["/x"]}
+
+
+def test_backend_selection() -> None:
+    """Both branches of the optional orjson import pick a working backend.
+
+    Importers bind ``loads``/``dumps`` at import time, so reloading this
+    module does not change the functions they already hold.
+    """
+    fake_orjson = types.ModuleType("orjson")
+    fake_orjson.loads = MagicMock()  # type: ignore[attr-defined]
+    fake_orjson.dumps = MagicMock(return_value=b"{}")  # type: ignore[attr-defined]
+    fake_orjson.OPT_INDENT_2 = 1  # type: ignore[attr-defined]
+    fake_orjson.OPT_NON_STR_KEYS = 2  # type: ignore[attr-defined]
+    fake_orjson.OPT_PASSTHROUGH_DATETIME = 4  # type: ignore[attr-defined]
+    try:
+        with patch.dict(sys.modules, {"orjson": None}):
+            importlib.reload(json_mod)
+            assert json_mod.loads is json.loads
+            assert json_mod.dumps({1: _WHEN}) == f'{{"1":"{_WHEN}"}}'.encode()
+            assert json_mod.dumps({"a": 1}, indent=True) == b'{\n  "a": 1\n}'
+        with patch.dict(sys.modules, {"orjson": fake_orjson}):
+            importlib.reload(json_mod)
+            assert json_mod.loads is fake_orjson.loads  # type: ignore[attr-defined]
+            json_mod.dumps({}, indent=True)
+            json_mod.dumps({})
+        options = [c.kwargs["option"] for c in fake_orjson.dumps.call_args_list]  # type: ignore[attr-defined]
+        assert options == [7, 6]
+    finally:
+        importlib.reload(json_mod)
@@ -85,6 +85,24 @@ def test_log_run_with_stderr(tmp_path: Path) -> None:
     assert "error\n" in content
 
 
+def test_log_run_file_layout(tmp_path: Path) -> None:
+    logger, instance_dir = _make_logger(tmp_path)
+    started = datetime(2026, 2, 10, 14, 30, 0, tzinfo=timezone.utc)
+    result = ExecResult(exit_code=2, stdout="out\n", stderr="err\n", duration_ms=5.0)
+
+    logger.log_run("cmd", result, started)
+
+    log_file = next((instance_dir / "logs").glob("run-*.log"))
+    assert log_file.read_text() == (
+        "# command: cmd\n"
+        "# exit_code: 2\n"
+        "# duration_ms: 5.0\n"
+        "# timed_out: False\n"
+        "\n--- stdout ---\nout\n"
+        "\n--- stderr ---\nerr\n"
+    )
+
+
 def test_log_run_appends_to_history(tmp_path: Path) -> None:
     logger, instance_dir = _make_logger(tmp_path)
     started = datetime(2026, 2, 10, 14, 30, 0, tzinfo=timezone.utc)
@@ -195,6 +213,37 @@ def test_detach_log_disabled(tmp_path: Path) -> None:
     assert len(log_files) == 0
 
 
+# --- Buffering ---
+
+
+def test_session_log_buffers_until_flush(tmp_path: Path) -> None:
+    logger, instance_dir = _make_logger(tmp_path)
+
+    handle = logger.start_session_log("exec-123")
+    handle.write_recv("chunk\n")
+    log_file = next((instance_dir / "logs").glob("session-*.log"))
+    assert "chunk" not in log_file.read_text()
+
+    handle.flush()
+    assert "chunk\n" in log_file.read_text()
+    handle.close()
+    handle.flush()  # no-op once closed
+
+
+def test_detach_log_buffers_until_flush(tmp_path: Path) -> None:
+    logger, instance_dir = _make_logger(tmp_path)
+
+    handle = logger.start_detach_log("cmd")
+    handle.write_output("stdout", "chunk\n")
+    log_file = next((instance_dir / "logs").glob("detach-*.log"))
+    assert "chunk" not in log_file.read_text()
+
+    handle.flush()
+    assert "[stdout] chunk\n" in log_file.read_text()
+    handle.close(exit_code=0, duration_ms=1.0)
+    handle.flush()  # no-op once closed
+
+
 # --- append_history ---
 
 
@@ -211,6 +260,25 @@ def test_append_history_multiple_entries(tmp_path: Path) -> None:
     assert json.loads(lines[1])["command"] == "cmd2"
 
 
+def test_append_history_reuses_open_file(tmp_path: Path) -> None:
+    logger, instance_dir = _make_logger(tmp_path)
+    history = instance_dir / "logs" / "history.jsonl"
+
+    logger.append_history({"command": "cmd1"})
+    first = logger._history_file
+    logger.append_history({"command": "cmd2"})
+    assert first is not None
+    assert logger._history_file is first
+
+    logger.close()
+    logger.close()  # idempotent
+    logger.append_history({"command": "cmd3"})  # reopens after close
+    logger.close()
+
+    lines = history.read_text().splitlines()
+    assert [json.loads(line)["command"] for line in lines] == ["cmd1", "cmd2", "cmd3"]
+
+
 def test_append_history_disabled(tmp_path: Path) -> None:
     init_project(tmp_path)
     instance_dir = ensure_instance_dir(tmp_path, "pd-nohist")
@@ -114,6 +114,13 @@ def test_container_list_item_is_frozen() -> None:
         item.name = "changed"  # type: ignore[misc]
 
 
+def test_container_list_item_has_no_instance_dict() -> None:
+    item = ContainerListItem(
+        id="x", name="n", status="running", image="img", created_at="", persist=False
+    )
+    assert not hasattr(item, "__dict__")
+
+
 # --- resume_container ---
 
 
@@ -139,14 +146,14 @@ async def test_resume_not_found() -> None:
 
 
 async def test_resume_stopped_container_starts_it() -> None:
-    list_result = [{"Id": "abc123", "State": "exited"}]
-    inspect_result = {
-        "Config": {
+    list_result = [
+        {
+            "Id": "abc123",
+            "State": "exited",
             "Image": "pocketdock/minimal-python",
             "Labels": {"pocketdock.persist": "true"},
-        },
-        "HostConfig": {"Memory": 0, "NanoCpus": 0},
-    }
+        }
+    ]
     with (
         patch("pocketdock.persistence.sc.detect_socket", return_value="/tmp/s.sock"),
         patch(
@@ -155,15 +162,12 @@ async def test_resume_stopped_container_starts_it() -> None:
             return_value=list_result,
         ),
         patch("pocketdock.persistence.sc.start_container", new_callable=AsyncMock) as start,
-        patch(
-            "pocketdock.persistence.sc.inspect_container",
-            new_callable=AsyncMock,
-            return_value=inspect_result,
-        ),
+        patch("pocketdock.persistence.sc.inspect_container", new_callable=AsyncMock) as inspect,
     ):
         c = await resume_container("pd-test")
 
     start.assert_called_once_with("/tmp/s.sock", "abc123")
+    inspect.assert_not_called()
     assert c.container_id == "abc123"
     assert c.persist is True
     assert c.name == "pd-test"
@@ -171,10 +175,6 @@ async def test_resume_stopped_container_starts_it() -> None:
 
 async def test_resume_running_container_skips_start() -> None:
     list_result = [{"Id": "abc123", "State": "running"}]
-    inspect_result = {
-        "Config": {"Image": "img", "Labels": {}},
-        "HostConfig": {"Memory": 268435456, "NanoCpus": 500000000},
-    }
     with (
         patch("pocketdock.persistence.sc.detect_socket", return_value="/tmp/s.sock"),
         patch(
@@ -183,11 +183,6 @@ async def test_resume_running_container_skips_start() -> None:
             return_value=list_result,
         ),
         patch("pocketdock.persistence.sc.start_container", new_callable=AsyncMock) as start,
-        patch(
-            "pocketdock.persistence.sc.inspect_container",
-            new_callable=AsyncMock,
-            return_value=inspect_result,
-        ),
     ):
         c = await resume_container("pd-test")
 
@@ -197,10 +192,6 @@ async def test_resume_running_container_skips_start() -> None:
 
 async def test_resume_with_explicit_socket() -> None:
     list_result = [{"Id": "abc123", "State": "exited"}]
-    inspect_result = {
-        "Config": {"Image": "img", "Labels": {}},
-        "HostConfig": {"Memory": 0, "NanoCpus": 0},
-    }
     with (
         patch(
             "pocketdock.persistence.sc.list_containers",
@@ -208,11 +199,6 @@ async def test_resume_with_explicit_socket() -> None:
             return_value=list_result,
         ) as list_mock,
         patch("pocketdock.persistence.sc.start_container", new_callable=AsyncMock),
-        patch(
-            "pocketdock.persistence.sc.inspect_container",
-            new_callable=AsyncMock,
-            return_value=inspect_result,
-        ),
     ):
         await resume_container("pd-test", socket_path="/custom.sock")
 
@@ -302,24 +288,20 @@ async def test_destroy_not_found_raises() -> None:
 
 
 async def test_destroy_removes_with_force() -> None:
-    inspect_data = {"Config": {"Labels": {}}}
     with (
         patch("pocketdock.persistence.sc.detect_socket", return_value="/tmp/s.sock"),
         patch(
             "pocketdock.persistence.sc.list_containers",
             new_callable=AsyncMock,
-            return_value=[{"Id": "abc123"}],
-        ),
-        patch(
-            "pocketdock.persistence.sc.inspect_container",
-            new_callable=AsyncMock,
-            return_value=inspect_data,
+            return_value=[{"Id": "abc123", "Labels": {}}],
         ),
+        patch("pocketdock.persistence.sc.inspect_container", new_callable=AsyncMock) as inspect,
         patch("pocketdock.persistence.sc.remove_container", new_callable=AsyncMock) as remove,
     ):
         await destroy_container("test")
 
     remove.assert_called_once_with("/tmp/s.sock", "abc123", force=True)
+    inspect.assert_not_called()
 
 
 # --- prune ---
@@ -375,6 +357,58 @@ async def test_prune_no_stopped_returns_zero() -> None:
     remove.assert_not_called()
 
 
+async def test_prune_skips_already_removed() -> None:
+    raw = [
+        {"Id": "exited1", "State": "exited"},
+        {"Id": "gone1", "State": "exited"},
+    ]
+
+    async def _remove(_socket: str, cid: str, *, force: bool) -> None:  # noqa: ARG001
+        if cid == "gone1":
+            raise ContainerNotFound(cid)
+
+    with (
+        patch("pocketdock.persistence.sc.detect_socket", return_value="/tmp/s.sock"),
+        patch(
+            "pocketdock.persistence.sc.list_containers",
+            new_callable=AsyncMock,
+            return_value=raw,
+        ),
+        patch("pocketdock.persistence.sc.remove_container", side_effect=_remove) as remove,
+    ):
+        count = await prune()
+
+    assert count == 1
+    assert remove.call_count == 2
+
+
+async def test_prune_reraises_after_attempting_all() -> None:
+    from pocketdock.errors import SocketCommunicationError
+
+    raw = [
+        {"Id": "bad1", "State": "exited"},
+        {"Id": "exited1", "State": "exited"},
+    ]
+
+    async def _remove(_socket: str, cid: str, *, force: bool) -> None:  # noqa: ARG001
+        if cid == "bad1":
+            raise SocketCommunicationError("boom")
+
+    with (
+        patch("pocketdock.persistence.sc.detect_socket", return_value="/tmp/s.sock"),
+        patch(
+            "pocketdock.persistence.sc.list_containers",
+            new_callable=AsyncMock,
+            return_value=raw,
+        ),
+        patch("pocketdock.persistence.sc.remove_container", side_effect=_remove) as remove,
+        pytest.raises(SocketCommunicationError, match="boom"),
+    ):
+        await prune()
+
+    assert remove.call_count == 2
+
+
 async def test_prune_empty_list_returns_zero() -> None:
     with (
         patch("pocketdock.persistence.sc.detect_socket", return_value="/tmp/s.sock"),
@@ -517,7 +551,27 @@ async def test_list_containers_with_project_filter() -> None:
     ):
         await list_containers(project="my-project")
 
-    list_mock.assert_called_once_with("/tmp/s.sock", label_filter="pocketdock.project=my-project")
+    list_mock.assert_called_once_with(
+        "/tmp/s.sock",
+        label_filter=["pocketdock.managed=true", "pocketdock.project=my-project"],
+        fields=("Id", "Labels", "Names", "State", "Image"),
+    )
+
+
+async def test_list_and_prune_filter_managed_server_side() -> None:
+    with (
+        patch("pocketdock.persistence.sc.detect_socket", return_value="/tmp/s.sock"),
+        patch(
+            "pocketdock.persistence.sc.list_containers",
+            new_callable=AsyncMock,
+            return_value=[],
+        ) as list_mock,
+    ):
+        await list_containers()
+        await prune()
+
+    for call in list_mock.call_args_list:
+        assert call.kwargs["label_filter"] == ["pocketdock.managed=true"]
 
 
 async def test_prune_with_project_filter() -> None:
@@ -532,7 +586,11 @@ async def test_prune_with_project_filter() -> None:
         count = await prune(project="my-project")
 
     assert count == 0
-    list_mock.assert_called_once_with("/tmp/s.sock", label_filter="pocketdock.project=my-project")
+    list_mock.assert_called_once_with(
+        "/tmp/s.sock",
+        label_filter=["pocketdock.managed=true", "pocketdock.project=my-project"],
+        fields=("Id", "State"),
+    )
 
 
 async def test_destroy_cleans_up_data_path(tmp_path: object) -> None:
@@ -542,20 +600,13 @@ async def test_destroy_cleans_up_data_path(tmp_path: object) -> None:
     data_dir.mkdir()
     (data_dir / "test.txt").write_text("test")
 
-    inspect_data = {
-        "Config": {"Labels": {"pocketdock.data-path": str(data_dir)}},
-    }
+    labels = {"pocketdock.data-path": str(data_dir)}
     with (
         patch("pocketdock.persistence.sc.detect_socket", return_value="/tmp/s.sock"),
         patch(
             "pocketdock.persistence.sc.list_containers",
             new_callable=AsyncMock,
-            return_value=[{"Id": "abc123"}],
-        ),
-        patch(
-            "pocketdock.persistence.sc.inspect_container",
-            new_callable=AsyncMock,
-            return_value=inspect_data,
+            return_value=[{"Id": "abc123", "Labels": labels}],
         ),
         patch("pocketdock.persistence.sc.remove_container", new_callable=AsyncMock),
     ):
@@ -565,18 +616,12 @@ async def test_destroy_cleans_up_data_path(tmp_path: object) -> None:
 
 
 async def test_destroy_no_data_path_label() -> None:
-    inspect_data = {"Config": {"Labels": {}}}
     with (
         patch("pocketdock.persistence.sc.detect_socket", return_value="/tmp/s.sock"),
         patch(
             "pocketdock.persistence.sc.list_containers",
             new_callable=AsyncMock,
-            return_value=[{"Id": "abc123"}],
-        ),
-        patch(
-            "pocketdock.persistence.sc.inspect_container",
-            new_callable=AsyncMock,
-            return_value=inspect_data,
+            return_value=[{"Id": "abc123", "Labels": None}],
         ),
         patch("pocketdock.persistence.sc.remove_container", new_callable=AsyncMock) as remove,
     ):
@@ -586,20 +631,13 @@ async def test_destroy_no_data_path_label() -> None:
 
 
 async def test_destroy_data_path_already_gone() -> None:
-    inspect_data = {
-        "Config": {"Labels": {"pocketdock.data-path": "/nonexistent/path"}},
-    }
+    labels = {"pocketdock.data-path": "/nonexistent/path"}
     with (
         patch("pocketdock.persistence.sc.detect_socket", return_value="/tmp/s.sock"),
         patch(
             "pocketdock.persistence.sc.list_containers",
             new_callable=AsyncMock,
-            return_value=[{"Id": "abc123"}],
-        ),
-        patch(
-            "pocketdock.persistence.sc.inspect_container",
-            new_callable=AsyncMock,
-            return_value=inspect_data,
+            return_value=[{"Id": "abc123", "Labels": labels}],
         ),
         patch("pocketdock.persistence.sc.remove_container", new_callable=AsyncMock),
     ):
@@ -608,18 +646,18 @@ async def test_destroy_data_path_already_gone() -> None:
 
 
 async def test_resume_restores_project_and_data_path() -> None:
-    list_result = [{"Id": "abc123", "State": "running"}]
-    inspect_result = {
-        "Config": {
+    list_result = [
+        {
+            "Id": "abc123",
+            "State": "running",
             "Image": "img",
             "Labels": {
                 "pocketdock.persist": "true",
                 "pocketdock.project": "my-proj",
                 "pocketdock.data-path": "/some/path",
             },
-        },
-        "HostConfig": {"Memory": 0, "NanoCpus": 0},
-    }
+        }
+    ]
     with (
         patch("pocketdock.persistence.sc.detect_socket", return_value="/tmp/s.sock"),
         patch(
@@ -628,11 +666,6 @@ async def test_resume_restores_project_and_data_path() -> None:
             return_value=list_result,
         ),
         patch("pocketdock.persistence.sc.start_container", new_callable=AsyncMock),
-        patch(
-            "pocketdock.persistence.sc.inspect_container",
-            new_callable=AsyncMock,
-            return_value=inspect_result,
-        ),
     ):
         c = await resume_container("pd-test")
 
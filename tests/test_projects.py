@@ -7,6 +7,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import pytest
 import yaml
 from pocketdock.projects import (
     _toml_value,
@@ -66,6 +67,22 @@ def test_find_project_root_default_start(tmp_path: Path) -> None:
     assert find_project_root() == tmp_path
 
 
+def test_find_project_root_sees_new_nearer_project(tmp_path: Path) -> None:
+    init_project(tmp_path)
+    sub = tmp_path / "a" / "b"
+    sub.mkdir(parents=True)
+    assert find_project_root(sub) == tmp_path
+
+    # A nearer project created by another process is found on the next call.
+    (sub / ".pocketdock").mkdir()
+    (sub / ".pocketdock" / "pocketdock.yaml").write_text("project_name: inner")
+    assert find_project_root(sub) == sub
+
+    (sub / ".pocketdock" / "pocketdock.yaml").unlink()
+    (tmp_path / ".pocketdock" / "pocketdock.yaml").unlink()
+    assert find_project_root(sub) is None
+
+
 # --- init_project ---
 
 
@@ -157,6 +174,30 @@ def test_get_project_name_non_string_in_yaml(tmp_path: Path) -> None:
     assert get_project_name(tmp_path) == tmp_path.name
 
 
+@pytest.mark.parametrize(
+    ("line", "expected"),
+    [
+        ('project_name: "quoted name"', "quoted name"),
+        ("project_name: 'single'", "single"),
+        ("project_name: with-comment  # note", "with-comment"),
+        ("project_name: true", None),
+        ("project_name: 'true'", "true"),
+    ],
+)
+def test_get_project_name_scalar_forms(tmp_path: Path, line: str, expected: str | None) -> None:
+    pd_dir = tmp_path / ".pocketdock"
+    pd_dir.mkdir()
+    (pd_dir / "pocketdock.yaml").write_text(f"default_persist: false\n{line}\n")
+    assert get_project_name(tmp_path) == (expected or tmp_path.name)
+
+
+def test_get_project_name_nested_key_ignored(tmp_path: Path) -> None:
+    pd_dir = tmp_path / ".pocketdock"
+    pd_dir.mkdir()
+    (pd_dir / "pocketdock.yaml").write_text("other:\n  project_name: nested\n")
+    assert get_project_name(tmp_path) == tmp_path.name
+
+
 # --- ensure_instance_dir ---
 
 
@@ -255,6 +296,17 @@ def test_list_instance_dirs_multiple(tmp_path: Path) -> None:
     assert names == ["pd-aaa", "pd-bbb", "pd-ccc"]
 
 
+def test_list_instance_dirs_skips_files_keeps_symlinked_dirs(tmp_path: Path) -> None:
+    init_project(tmp_path)
+    ensure_instance_dir(tmp_path, "pd-real")
+    instances = tmp_path / ".pocketdock" / "instances"
+    (instances / "notes.txt").write_text("x")
+    (instances / "pd-link").symlink_to(instances / "pd-real")
+
+    names = [d.name for d in list_instance_dirs(tmp_path)]
+    assert names == ["pd-link", "pd-real"]
+
+
 def test_list_instance_dirs_no_instances_dir(tmp_path: Path) -> None:
     # No .pocketdock/instances/ dir
     assert list_instance_dirs(tmp_path) == []
@@ -293,6 +345,19 @@ def test_toml_value_other() -> None:
     assert _toml_value(3.14) == '"3.14"'
 
 
+def test_toml_value_int_subclass() -> None:
+    import enum
+
+    class _Flag(enum.IntEnum):
+        ON = 1
+
+    class _Count(int):
+        pass
+
+    assert _toml_value(_Flag.ON) == "1"
+    assert _toml_value(_Count(7)) == "7"
+
+
 # --- tomli fallback coverage ---
 
 
@@ -323,10 +388,13 @@ def test_write_instance_metadata_no_ports(tmp_path: Path) -> None:
 
 
 def test_read_instance_metadata_tomli_fallback(tmp_path: Path) -> None:
-    """Ensure the tomli fallback import path is covered."""
+    """Ensure the module-level tomli fallback import is covered."""
     import builtins
+    import importlib
     import sys
 
+    import pocketdock.projects as projects_mod
+
     init_project(tmp_path)
     instance_dir = ensure_instance_dir(tmp_path, "pd-fallback")
     write_instance_metadata(instance_dir, container_id="abc", name="pd-fallback")
@@ -342,9 +410,12 @@ def test_read_instance_metadata_tomli_fallback(tmp_path: Path) -> None:
 
     builtins.__import__ = _block_tomllib  # type: ignore[assignment]
     try:
-        metadata = read_instance_metadata(instance_dir)
+        importlib.reload(projects_mod)
+        assert projects_mod.tomllib.__name__ == "tomli"
+        metadata = projects_mod.read_instance_metadata(instance_dir)
         assert metadata["container"]["id"] == "abc"
     finally:
         builtins.__import__ = real_import  # type: ignore[assignment]
         if saved is not None:
             sys.modules["tomllib"] = saved
+        importlib.reload(projects_mod)
@@ -14,6 +14,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 if TYPE_CHECKING:
     import pathlib
+    from collections.abc import AsyncGenerator
 
 import pytest
 from pocketdock._socket_client import (
@@ -23,6 +24,7 @@ from pocketdock._socket_client import (
     _exec_inspect_exit_code,
     _exec_start,
     _exec_start_stream,
+    _iter_body,
     _path_exists,
     _read_body,
     _read_chunked,
@@ -37,6 +39,7 @@ from pocketdock._socket_client import (
     commit_container,
     create_container,
     detect_socket,
+    detect_socket_cached,
     get_container_stats,
     get_container_top,
     list_containers,
@@ -47,6 +50,7 @@ from pocketdock._socket_client import (
     remove_container,
     restart_container,
     save_image,
+    save_image_stream,
     start_container,
     stop_container,
 )
@@ -90,6 +94,52 @@ def test_detect_socket_no_env_no_candidates() -> None:
         assert detect_socket() is None
 
 
+def test_detect_socket_cached_reuses_hit(tmp_path: pathlib.Path) -> None:
+    sock = tmp_path / "a.sock"
+    sock.touch()
+    with (
+        patch.dict(os.environ, {"POCKETDOCK_SOCKET": str(sock)}),
+        patch("pocketdock._socket_client.detect_socket", return_value=str(sock)) as probe,
+    ):
+        assert detect_socket_cached() == str(sock)
+        assert detect_socket_cached() == str(sock)
+    probe.assert_called_once()
+
+
+def test_detect_socket_cached_does_not_remember_miss(tmp_path: pathlib.Path) -> None:
+    sock = tmp_path / "b.sock"
+    sock.touch()
+    with patch("pocketdock._socket_client.detect_socket", side_effect=[None, str(sock)]):
+        assert detect_socket_cached() is None
+        assert detect_socket_cached() == str(sock)
+
+
+def test_detect_socket_cached_reprobes_on_env_change(tmp_path: pathlib.Path) -> None:
+    a, b = tmp_path / "a", tmp_path / "b"
+    a.touch()
+    b.touch()
+    with patch("pocketdock._socket_client.detect_socket", side_effect=[str(a), str(b)]) as probe:
+        with patch.dict(os.environ, {"POCKETDOCK_SOCKET": str(a)}):
+            assert detect_socket_cached() == str(a)
+        with patch.dict(os.environ, {"POCKETDOCK_SOCKET": str(b)}):
+            assert detect_socket_cached() == str(b)
+    assert probe.call_count == 2
+
+
+def test_detect_socket_cached_reprobes_when_socket_vanishes(tmp_path: pathlib.Path) -> None:
+    podman, docker = tmp_path / "podman.sock", tmp_path / "docker.sock"
+    podman.touch()
+    docker.touch()
+    with patch(
+        "pocketdock._socket_client.detect_socket", side_effect=[str(podman), str(docker)]
+    ) as probe:
+        assert detect_socket_cached() == str(podman)
+        podman.unlink()  # the engine stopped and removed its socket
+        assert detect_socket_cached() == str(docker)
+        assert detect_socket_cached() == str(docker)
+    assert probe.call_count == 2
+
+
 def test_detect_socket_darwin_podman_machine(tmp_path: pathlib.Path) -> None:
     sock = tmp_path / ".local/share/containers/podman/machine/podman-machine-default/podman.sock"
     sock.parent.mkdir(parents=True)
@@ -236,6 +286,61 @@ async def test_read_exact_body_short() -> None:
     assert body == b"short"
 
 
+# -- _iter_body --
+
+
+async def _collect(reader: asyncio.StreamReader, headers: dict[str, str]) -> list[bytes]:
+    return [chunk async for chunk in _iter_body(reader, headers)]
+
+
+async def test_iter_body_content_length() -> None:
+    reader = asyncio.StreamReader()
+    reader.feed_data(b"hello worldEXTRA")
+    reader.feed_eof()
+    assert b"".join(await _collect(reader, {"content-length": "11"})) == b"hello world"
+
+
+async def test_iter_body_content_length_short() -> None:
+    reader = asyncio.StreamReader()
+    reader.feed_data(b"short")
+    reader.feed_eof()
+    with pytest.raises(asyncio.IncompleteReadError):
+        await _collect(reader, {"content-length": "100"})
+
+
+async def test_iter_body_until_eof() -> None:
+    reader = asyncio.StreamReader()
+    reader.feed_data(b"x" * 70000)
+    reader.feed_eof()
+    chunks = await _collect(reader, {})
+    assert b"".join(chunks) == b"x" * 70000
+    assert max(map(len, chunks)) <= 65536
+
+
+async def test_iter_body_chunked() -> None:
+    reader = asyncio.StreamReader()
+    reader.feed_data(b"5\r\nhello\r\n\r\n6\r\n world\r\n0\r\n\r\n")
+    reader.feed_eof()
+    chunks = await _collect(reader, {"transfer-encoding": "chunked"})
+    assert chunks == [b"hello", b" world"]
+
+
+async def test_iter_body_chunked_eof_before_terminator() -> None:
+    reader = asyncio.StreamReader()
+    reader.feed_data(b"5\r\nhello\r\n")
+    reader.feed_eof()
+    with pytest.raises(asyncio.IncompleteReadError):
+        await _collect(reader, {"transfer-encoding": "chunked"})
+
+
+async def test_iter_body_chunked_truncated_chunk() -> None:
+    reader = asyncio.StreamReader()
+    reader.feed_data(b"a\r\nhel")
+    reader.feed_eof()
+    with pytest.raises(asyncio.IncompleteReadError):
+        await _collect(reader, {"transfer-encoding": "chunked"})
+
+
 # -- _read_chunked --
 
 
@@ -274,6 +379,25 @@ async def test_send_request_with_body() -> None:
     assert b'{"key":"value"}' in written
 
 
+async def test_send_request_chunked_body() -> None:
+    transport = _MockTransport()
+    loop = asyncio.get_running_loop()
+    protocol = asyncio.StreamReaderProtocol(asyncio.StreamReader())
+    writer = asyncio.StreamWriter(transport, protocol, reader=asyncio.StreamReader(), loop=loop)
+
+    async def _chunks() -> AsyncGenerator[bytes, None]:
+        yield b"hello"
+        yield b""
+        yield b"x" * 20
+
+    await _send_request(writer, "PUT", "/archive", _chunks(), content_type="application/x-tar")
+
+    head, _, body = transport.data.partition(b"\r\n\r\n")
+    assert b"Transfer-Encoding: chunked" in head
+    assert b"Content-Length" not in head
+    assert body == b"5\r\nhello\r\n14\r\n" + b"x" * 20 + b"\r\n0\r\n\r\n"
+
+
 async def test_send_request_without_body() -> None:
     transport = _MockTransport()
     loop = asyncio.get_running_loop()
@@ -1090,6 +1214,22 @@ async def test_list_containers_no_filter() -> None:
     assert call_path == "/containers/json?all=true"
 
 
+async def test_list_containers_fields_projection() -> None:
+    import json
+
+    result_body = json.dumps(
+        [{"Id": "abc", "State": "exited", "Mounts": [], "NetworkSettings": {}}, {"Id": "def"}]
+    ).encode()
+    with patch(
+        "pocketdock._socket_client._request",
+        new_callable=AsyncMock,
+        return_value=(200, result_body),
+    ):
+        result = await list_containers("/tmp/s.sock", fields=("Id", "State"))
+
+    assert result == [{"Id": "abc", "State": "exited"}, {"Id": "def"}]
+
+
 async def test_list_containers_with_label_filter() -> None:
     import json
     import urllib.parse
@@ -1112,6 +1252,22 @@ async def test_list_containers_with_label_filter() -> None:
     assert "pocketdock.managed=true" in decoded
 
 
+async def test_list_containers_with_multiple_label_filters() -> None:
+    import json
+    import urllib.parse
+
+    with patch(
+        "pocketdock._socket_client._request",
+        new_callable=AsyncMock,
+        return_value=(200, b"[]"),
+    ) as mock:
+        await list_containers("/tmp/s.sock", label_filter=["a=1", "b=2"])
+
+    query = urllib.parse.urlparse(mock.call_args[0][2]).query
+    filters = json.loads(urllib.parse.parse_qs(query)["filters"][0])
+    assert filters == {"label": ["a=1", "b=2"]}
+
+
 async def test_list_containers_error() -> None:
     with (
         patch(
@@ -1232,6 +1388,88 @@ async def test_save_image_error() -> None:
         await save_image("/tmp/s.sock", "bad:image")
 
 
+# --- save_image_stream ---
+
+
+def _stream_writer() -> MagicMock:
+    writer = MagicMock()
+    writer.wait_closed = AsyncMock()
+    return writer
+
+
+async def test_save_image_stream_success() -> None:
+    reader = asyncio.StreamReader()
+    reader.feed_data(b"3\r\ntar\r\n4\r\n-raw\r\n0\r\n\r\n")
+    reader.feed_eof()
+    writer = _stream_writer()
+    with patch(
+        "pocketdock._socket_client._request_stream",
+        new_callable=AsyncMock,
+        return_value=(200, {"transfer-encoding": "chunked"}, reader, writer),
+    ) as mock_req:
+        chunks = [c async for c in save_image_stream("/tmp/s.sock", "pocketdock/dev:latest")]
+    assert chunks == [b"tar", b"-raw"]
+    assert mock_req.call_args[0][2] == "/images/pocketdock%2Fdev%3Alatest/get"
+    writer.close.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    ("status", "error"),
+    [(404, ImageNotFound), (500, SocketCommunicationError)],
+)
+async def test_save_image_stream_error_status(status: int, error: type[Exception]) -> None:
+    reader = asyncio.StreamReader()
+    reader.feed_data(b"nope")
+    reader.feed_eof()
+    writer = _stream_writer()
+    with (
+        patch(
+            "pocketdock._socket_client._request_stream",
+            new_callable=AsyncMock,
+            return_value=(status, {"content-length": "4"}, reader, writer),
+        ),
+        pytest.raises(error),
+    ):
+        async for _ in save_image_stream("/tmp/s.sock", "bad:image"):
+            pass
+    writer.close.assert_called_once()
+
+
+async def test_save_image_stream_connection_lost() -> None:
+    reader = MagicMock()
+    reader.read = AsyncMock(side_effect=ConnectionResetError("reset"))
+    writer = _stream_writer()
+    with (
+        patch(
+            "pocketdock._socket_client._request_stream",
+            new_callable=AsyncMock,
+            return_value=(200, {}, reader, writer),
+        ),
+        pytest.raises(SocketCommunicationError, match="reset"),
+    ):
+        async for _ in save_image_stream("/tmp/s.sock", "img"):
+            pass
+    writer.close.assert_called_once()
+
+
+async def test_save_image_stream_truncated() -> None:
+    reader = asyncio.StreamReader()
+    reader.feed_data(b"partial")
+    reader.feed_eof()
+    writer = _stream_writer()
+    with (
+        patch(
+            "pocketdock._socket_client._request_stream",
+            new_callable=AsyncMock,
+            return_value=(200, {"content-length": "1000"}, reader, writer),
+        ),
+        pytest.raises(SocketCommunicationError),
+    ):
+        async for _ in save_image_stream("/tmp/s.sock", "img"):
+            pass
+    writer.close.assert_called_once()
+
+
 # --- load_image ---
 
 
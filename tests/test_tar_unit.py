@@ -0,0 +1,86 @@
+"""Unit tests for the streaming tar builders in ``pocketdock._tar``."""
+
+from __future__ import annotations
+
+import io
+import socket
+import tarfile
+from typing import TYPE_CHECKING
+
+import pytest
+from pocketdock._tar import stream_bytes, stream_path
+
+if TYPE_CHECKING:
+    import pathlib
+    from collections.abc import AsyncIterable
+
+
+async def _collect(chunks: AsyncIterable[bytes]) -> bytes:
+    return b"".join([chunk async for chunk in chunks])
+
+
+def _members(data: bytes) -> list[tuple[str, str, bytes | None]]:
+    """Return (name, type, contents) for every member of a tar archive."""
+    out: list[tuple[str, str, bytes | None]] = []
+    with tarfile.open(fileobj=io.BytesIO(data), mode="r") as tar:
+        for m in tar.getmembers():
+            f = tar.extractfile(m) if m.isfile() else None
+            out.append((m.name, m.type.decode(), f.read() if f else None))
+    return out
+
+
+async def test_stream_bytes_round_trip() -> None:
+    data = await _collect(stream_bytes("hello.txt", b"hi there"))
+    assert len(data) % tarfile.BLOCKSIZE == 0
+    assert _members(data) == [("hello.txt", "0", b"hi there")]
+
+
+async def test_stream_bytes_empty_file() -> None:
+    data = await _collect(stream_bytes("empty", b""))
+    assert _members(data) == [("empty", "0", b"")]
+
+
+async def test_stream_path_matches_tarfile_add(tmp_path: pathlib.Path) -> None:
+    src = tmp_path / "src"
+    (src / "sub" / "deeper").mkdir(parents=True)
+    (src / "b.txt").write_bytes(b"b" * 70_000)  # spans several read chunks
+    (src / "a.txt").write_text("aaa")
+    (src / "empty").write_bytes(b"")
+    (src / "sub" / "deeper" / "c.txt").write_text("ccc")
+    (src / "link").symlink_to("a.txt")
+
+    expected = io.BytesIO()
+    with tarfile.open(fileobj=expected, mode="w") as tar:
+        tar.add(str(src), arcname="dest")
+
+    streamed = await _collect(stream_path(src, "dest"))
+    assert _members(streamed) == _members(expected.getvalue())
+
+    with tarfile.open(fileobj=io.BytesIO(streamed), mode="r") as tar:
+        for m in tar.getmembers():
+            assert (m.uid, m.gid, m.uname, m.gname) == (0, 0, "root", "root")
+            assert m.mode == (0o755 if m.isdir() else 0o644)
+
+
+async def test_stream_path_skips_unsupported_types(tmp_path: pathlib.Path) -> None:
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "f.txt").write_text("f")
+    sock = socket.socket(socket.AF_UNIX)
+    try:
+        sock.bind(str(src / "sock"))
+        streamed = await _collect(stream_path(src, "d"))
+    finally:
+        sock.close()
+    assert [name for name, _, _ in _members(streamed)] == ["d", "d/f.txt"]
+
+
+async def test_stream_path_raises_if_file_shrinks(tmp_path: pathlib.Path) -> None:
+    src = tmp_path / "f.bin"
+    src.write_bytes(b"x" * 1000)
+
+    chunks = stream_path(src, "f.bin")
+    await chunks.__anext__()  # header written with the original size
+    src.write_bytes(b"x" * 10)
+    with pytest.raises(OSError, match="shrank"):
+        await _collect(chunks)